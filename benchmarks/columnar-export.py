@@ -0,0 +1,99 @@
+"""
+Benchmark of aggregating the print history of a fleet.
+
+Compares pulling the print runs as models with iterate_all and aggregating
+them in a Python loop, as analytics scripts do, with the columnar export of
+Columnar: to_numpy followed by vectorized NumPy aggregation, and to_arrow
+followed by a pyarrow group by. Each variant computes the printed volume and
+the elapsed time per material. The pages are served by the fake web API of
+the tests; the peak memory traced during each variant is reported as well.
+
+Usage: python3 benchmarks/columnar-export.py [--prints 5000] [--per-page 100] [--repeat 3]
+"""
+
+import argparse
+import collections
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib")]
+
+import numpy
+
+from formlabs_web_api import PrintsApi
+from formlabs_web_api.Columnar import to_arrow, to_numpy
+from formlabs_web_api.Pagination import iterate_all
+from tests.fake_web_api import FakeWebApi, make_print_run
+
+COLUMNS = ("material", "volume_ml", "elapsed_duration_ms", "status", "created_at")
+MATERIALS = ("FLGPGR05", "FLTO2001", "FLCW4001", "FLFL8001")
+
+
+def with_models(prints_list, per_page):
+    volume = collections.defaultdict(float)
+    elapsed = collections.defaultdict(int)
+    for run in iterate_all(prints_list, per_page=per_page):
+        volume[run.material] += run.volume_ml
+        elapsed[run.material] += run.elapsed_duration_ms
+    return {material: (round(volume[material], 6), elapsed[material]) for material in volume}
+
+
+def with_numpy(prints_list, per_page):
+    array = to_numpy(prints_list, columns=COLUMNS, per_page=per_page)
+    materials, inverse = numpy.unique(array["material"].astype(str), return_inverse=True)
+    volume = numpy.bincount(inverse, weights=array["volume_ml"])
+    elapsed = numpy.bincount(inverse, weights=array["elapsed_duration_ms"])
+    return {str(material): (round(float(volume[index]), 6), int(elapsed[index])) for index, material in enumerate(materials)}
+
+
+def with_arrow(prints_list, per_page):
+    table = to_arrow(prints_list, columns=COLUMNS, per_page=per_page)
+    totals = table.group_by("material").aggregate([("volume_ml", "sum"), ("elapsed_duration_ms", "sum")])
+    return {
+        row["material"]: (round(row["volume_ml_sum"], 6), row["elapsed_duration_ms_sum"])
+        for row in totals.to_pylist()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--prints", type=int, default=5000)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    prints = [make_print_run(index) | {"material": MATERIALS[index % len(MATERIALS)]} for index in range(args.prints)]
+    with FakeWebApi(prints=prints) as server:
+        prints_list = PrintsApi(server.api_client()).prints_list
+        variants = {
+            "models + loop": with_models,
+            "to_numpy": with_numpy,
+            "to_arrow": with_arrow,
+        }
+        # Interleave the variants so drifting machine load affects them alike
+        timings = dict.fromkeys(variants, float("inf"))
+        peaks = {}
+        results = {}
+        for _ in range(args.repeat):
+            for name, run in variants.items():
+                started = time.perf_counter()
+                results[name] = run(prints_list, args.per_page)
+                timings[name] = min(timings[name], time.perf_counter() - started)
+        for name, run in variants.items():
+            tracemalloc.start()
+            run(prints_list, args.per_page)
+            peaks[name] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        assert results["models + loop"] == results["to_numpy"] == results["to_arrow"], results
+
+    print(f"{args.prints} print runs, {args.per_page} per page")
+    baseline = timings["models + loop"]
+    for name, seconds in timings.items():
+        print(f"  {name:<15}{seconds * 1000:9.1f} ms  {baseline / seconds:5.2f}x  peak {peaks[name] / 2 ** 20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
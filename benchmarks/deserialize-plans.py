@@ -0,0 +1,100 @@
+"""
+Benchmark of the per-item overhead of ApiClient deserialization on long lists.
+
+Compares the previous recursive walk, which parsed the type string with a
+regular expression and looked the model class up again for every element,
+with the cached deserialization plans. The JSON is parsed beforehand, so only
+the walk and the model construction are timed.
+
+Usage: python3 benchmarks/deserialize-plans.py [--items 10000] [--repeat 20]
+"""
+
+import argparse
+import datetime
+import decimal
+import os
+import re
+import sys
+import timeit
+from enum import Enum
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib")]
+
+import formlabs_web_api
+import formlabs_web_api.models
+
+
+def previous_deserialize(client, data, klass):
+    """ApiClient.__deserialize before the deserialization plans"""
+    if data is None:
+        return None
+
+    if isinstance(klass, str):
+        if klass.startswith('List['):
+            m = re.match(r'List\[(.*)]', klass)
+            sub_kls = m.group(1)
+            return [previous_deserialize(client, sub_data, sub_kls) for sub_data in data]
+
+        if klass.startswith('Dict['):
+            m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+            sub_kls = m.group(2)
+            return {k: previous_deserialize(client, v, sub_kls) for k, v in data.items()}
+
+        if klass in client.NATIVE_TYPES_MAPPING:
+            klass = client.NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(formlabs_web_api.models, klass)
+
+    if klass in client.PRIMITIVE_TYPES:
+        return client._ApiClient__deserialize_primitive(data, klass)
+    elif klass == object:
+        return client._ApiClient__deserialize_object(data)
+    elif klass == datetime.date:
+        return client._ApiClient__deserialize_date(data)
+    elif klass == datetime.datetime:
+        return client._ApiClient__deserialize_datetime(data)
+    elif klass == decimal.Decimal:
+        return decimal.Decimal(data)
+    elif issubclass(klass, Enum):
+        return client._ApiClient__deserialize_enum(data, klass)
+    else:
+        return client._ApiClient__deserialize_model(data, klass)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="elements per list")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    client = formlabs_web_api.ApiClient()
+    cases = {
+        "List[int]": list(range(args.items)),
+        "List[str]": [f"serial-{index}" for index in range(args.items)],
+        "Dict[str, List[str]]": {f"key-{index}": ["a", "b"] for index in range(args.items // 2)},
+        "List[PrinterGroup]": [
+            {"id": f"00000000-0000-0000-0000-{index:012d}", "name": f"Group {index}"} for index in range(args.items)
+        ],
+    }
+    for response_type, data in cases.items():
+        variants = {
+            "previous": lambda: previous_deserialize(client, data, response_type),
+            "plans": lambda: client._ApiClient__deserialize(data, response_type),
+        }
+        # Interleave the variants so drifting machine load affects them alike
+        timings = dict.fromkeys(variants, float("inf"))
+        for _ in range(args.repeat):
+            for name, run in variants.items():
+                timings[name] = min(timings[name], timeit.timeit(run, number=1))
+
+        print(f"{response_type} ({args.items} items)")
+        for name, seconds in timings.items():
+            print(
+                f"  {name:<10}{seconds * 1000:9.2f} ms  {seconds / args.items * 1e9:8.0f} ns/item"
+                f"  {timings['previous'] / seconds:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
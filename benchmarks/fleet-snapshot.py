@@ -0,0 +1,117 @@
+"""
+Benchmark of building a dashboard view of a printer fleet.
+
+Compares listing the printers, retrieving each one after another and then
+searching the list for a status, group, machine type and tank material, as
+dashboards do, with FleetSnapshot, which lists the pages concurrently once
+and answers the lookups from its indexes. The printers are served by the
+fake web API of the tests with a fixed latency per request standing in for
+the round trip to the server.
+
+Usage: python3 benchmarks/fleet-snapshot.py [--printers 200] [--per-page 50] [--latency 0.02]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib")]
+
+from formlabs_web_api import PrintersApi
+from formlabs_web_api.FleetSnapshot import FleetSnapshot
+from tests.fake_web_api import FakeWebApi, make_group, make_printer
+
+STATUSES = ("IDLE", "PRINTING", "ERROR")
+MATERIALS = ("FLGPGR05", "FLTO2001", "FLCW4001")
+MACHINE_TYPES = ("FORM-3-0", "FORM-3-2", "FORM-4-0")
+GROUPS = [make_group(index)["id"] for index in range(4)]
+
+
+def queries(serials):
+    # A dashboard refresh: a few breakdowns and a lookup of every printer shown
+    for status in STATUSES:
+        yield "status", status
+    for group in GROUPS:
+        yield "group", group
+    for machine_type in MACHINE_TYPES:
+        yield "machine_type", machine_type
+    for material in MATERIALS:
+        yield "material", material
+    for serial in serials:
+        yield "serial", serial
+
+
+def linear(api, serials, per_page):
+    printers = []
+    page_number = 1
+    while True:
+        page = api.printers_list(page=page_number, per_page=per_page)
+        printers.extend(page.results)
+        if not page.next:
+            break
+        page_number += 1
+    printers = [api.printers_retrieve(printer.serial) for printer in printers]
+    found = 0
+    for kind, key in queries(serials):
+        if kind == "serial":
+            found += sum(1 for printer in printers if printer.serial == key)
+        elif kind == "status":
+            found += len([printer for printer in printers if printer.printer_status.status == key])
+        elif kind == "group":
+            found += len([printer for printer in printers if printer.group.id == key])
+        elif kind == "machine_type":
+            found += len([printer for printer in printers if printer.machine_type_id.value == key])
+        else:
+            found += len([printer for printer in printers if printer.tank_status.tank.material == key])
+    return found
+
+
+def indexed(api_client, serials, per_page, concurrency):
+    snapshot = FleetSnapshot.fetch(api_client, per_page=per_page, max_concurrency=concurrency)
+    lookups = {
+        "serial": lambda key: (snapshot.printer(key),),
+        "status": snapshot.with_status,
+        "group": snapshot.in_group,
+        "machine_type": snapshot.of_machine_type,
+        "material": snapshot.with_tank_material,
+    }
+    return sum(len(lookups[kind](key)) for kind, key in queries(serials))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--printers", type=int, default=200)
+    parser.add_argument("--per-page", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every response")
+    parser.add_argument("--concurrency", type=int, default=8, help="max_concurrency of FleetSnapshot.fetch")
+    args = parser.parse_args()
+
+    fleet = [
+        make_printer(index, status=STATUSES[index % 3], group=index % len(GROUPS), material=MATERIALS[index % 3 - 1], machine_type_id=MACHINE_TYPES[index % 3 - 2])
+        for index in range(args.printers)
+    ]
+    serials = [printer["serial"] for printer in fleet]
+    with FakeWebApi(printers=fleet, latency=args.latency) as server:
+        api_client = server.api_client()
+        variants = {
+            "list + retrieve + scan": lambda: linear(PrintersApi(api_client), serials, args.per_page),
+            "FleetSnapshot": lambda: indexed(api_client, serials, args.per_page, args.concurrency),
+        }
+        print(f"{args.printers} printers, {args.per_page} per page, {args.latency * 1000:.0f} ms latency")
+        timings = {}
+        results = set()
+        for name, run in variants.items():
+            server.requests.clear()
+            started = time.perf_counter()
+            results.add(run())
+            timings[name] = (time.perf_counter() - started, len(server.requests))
+        assert len(results) == 1
+        baseline = timings["list + retrieve + scan"][0]
+        for name, (seconds, requests) in timings.items():
+            print(f"  {name:<24}{seconds * 1000:9.1f} ms  {requests:5d} requests  {baseline / seconds:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
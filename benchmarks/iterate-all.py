@@ -0,0 +1,62 @@
+"""
+Benchmark of pulling every page of a web API list operation.
+
+Compares requesting the pages one after another, as callers looping over
+`page` do, with iterate_all, which requests the pages after the first one
+concurrently. The pages are served by the fake web API of the tests with a
+fixed latency per request standing in for the round trip to the server.
+
+Usage: python3 benchmarks/iterate-all.py [--prints 2000] [--per-page 100] [--latency 0.05]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib")]
+
+from formlabs_web_api import PrintsApi
+from formlabs_web_api.Pagination import iterate_all
+from tests.fake_web_api import FakeWebApi, make_print_run
+
+
+def sequential(list_operation, per_page):
+    results = []
+    page_number = 1
+    while True:
+        page = list_operation(page=page_number, per_page=per_page)
+        results.extend(page.results or [])
+        if not page.next:
+            return results
+        page_number += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--prints", type=int, default=2000)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    parser.add_argument("--concurrency", type=int, default=8, help="max_concurrency of iterate_all")
+    args = parser.parse_args()
+
+    with FakeWebApi(prints=[make_print_run(index) for index in range(args.prints)], latency=args.latency) as server:
+        prints_list = PrintsApi(server.api_client()).prints_list
+        variants = {
+            "sequential": lambda: sequential(prints_list, args.per_page),
+            "iterate_all": lambda: list(iterate_all(prints_list, per_page=args.per_page, max_concurrency=args.concurrency)),
+        }
+        print(f"{args.prints} print runs, {args.per_page} per page, {args.latency * 1000:.0f} ms latency")
+        timings = {}
+        for name, run in variants.items():
+            started = time.perf_counter()
+            results = run()
+            timings[name] = time.perf_counter() - started
+            assert len(results) == args.prints
+        for name, seconds in timings.items():
+            print(f"  {name:<12}{seconds * 1000:9.1f} ms  {timings['sequential'] / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark of the JSON backends on large request bodies and list responses.
+
+Times encoding a scene with many models, the way RESTClientObject encodes
+request bodies, and decoding a page of print runs, the way ApiClient decodes
+responses, with each backend Configuration.json_backend can be set to.
+
+Usage: python3 benchmarks/json-backends.py [--models 2000] [--prints 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib"), os.path.join(ROOT, "local-api", "lib")]
+
+import formlabs_local_api
+from formlabs_local_api.JsonBackend import get_json_backend
+from tests.fake_web_api import make_print_run
+
+
+def make_scene(model_count):
+    return {
+        "models": [
+            {
+                "id": f"00000000-0000-0000-0000-{index:012d}",
+                "name": f"part_{index}",
+                "position": {"x": index % 50 * 2.5, "y": index // 50 * 2.5, "z": 0.0},
+                "orientation": {"x": 0.0, "y": 0.0, "z": 90.0},
+                "scale": 1.0,
+                "units": "MILLIMETERS",
+                "bounding_box": {"min_corner": {"x": 0.0, "y": 0.0, "z": 0.0}, "max_corner": {"x": 2.0, "y": 2.0, "z": 5.0}},
+                "original_file": f"C:\\Projects\\Models\\part_{index}.stl",
+                "visible": True,
+                "has_supports": index % 2 == 0,
+                "in_bounds": True,
+            }
+            for index in range(model_count)
+        ],
+        "scene_settings": {"machine_type": "FORM-4-0", "material_code": "FLGPGR05", "layer_thickness_mm": 0.1, "print_setting": "DEFAULT"},
+        "layer_count": 1000,
+    }
+
+
+def bench(label, run, repeat):
+    variants = {name: (lambda backend=get_json_backend(name): run(backend)) for name in ("default", "json", "orjson")}
+    # Interleave the variants so drifting machine load affects them alike
+    timings = dict.fromkeys(variants, float("inf"))
+    for _ in range(repeat):
+        for name, variant in variants.items():
+            timings[name] = min(timings[name], timeit.timeit(variant, number=1))
+
+    print(label)
+    for name, seconds in timings.items():
+        print(f"  {name:<10}{seconds * 1000:9.2f} ms  {timings['default'] / seconds:5.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=2000, help="models in the scene")
+    parser.add_argument("--prints", type=int, default=1000, help="print runs on the page")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    client = formlabs_local_api.ApiClient()
+    scene = client.sanitize_for_serialization(formlabs_local_api.SceneModel.from_dict(make_scene(args.models)))
+    bench(f"encode a scene of {args.models} models", lambda backend: backend.dumps(scene), args.repeat)
+
+    page = json.dumps({
+        "count": args.prints, "next": None, "previous": None,
+        "results": [make_print_run(index) for index in range(args.prints)],
+    }).encode("utf-8")
+    bench(f"decode a page of {args.prints} print runs", lambda backend: backend.loads(page), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
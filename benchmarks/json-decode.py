@@ -0,0 +1,131 @@
+"""
+Benchmark of ApiClient.response_deserialize on large responses.
+
+Compares the previous path (decode the body to str, then json.loads) with
+parsing the body bytes directly, with the "json" JsonBackend and with the
+"orjson" one when orjson is installed, each set as `Configuration.json_backend`
+of its own client. Each path includes building the response models.
+
+Usage: python3 benchmarks/json-decode.py [--prints 1000] [--models 2000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+# tests.fake_web_api provides the print run fixtures
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib"), os.path.join(ROOT, "local-api", "lib")]
+
+import urllib3
+import formlabs_local_api
+import formlabs_web_api
+from formlabs_local_api.JsonBackend import get_json_backend as get_local_json_backend
+from formlabs_web_api.JsonBackend import get_json_backend as get_web_json_backend
+from tests.fake_web_api import make_print_run
+
+
+def make_scene(model_count):
+    return {
+        "models": [
+            {
+                "id": f"00000000-0000-0000-0000-{index:012d}",
+                "name": f"part_{index}",
+                "position": {"x": index % 50 * 2.5, "y": index // 50 * 2.5, "z": 0.0},
+                "orientation": {"x": 0.0, "y": 0.0, "z": 90.0},
+                "scale": 1.0,
+                "units": "MILLIMETERS",
+                "bounding_box": {"min_corner": {"x": 0.0, "y": 0.0, "z": 0.0}, "max_corner": {"x": 2.0, "y": 2.0, "z": 5.0}},
+                "original_file": f"C:\\Projects\\Models\\part_{index}.stl",
+                "visible": True,
+                "has_supports": index % 2 == 0,
+                "in_bounds": True,
+                "raw_mesh_hash": f"{index:064x}",
+                "canonical_model_hash": f"{index * 7:064x}",
+            }
+            for index in range(model_count)
+        ],
+        "scene_settings": {"machine_type": "FORM-4-0", "material_code": "FLGPGR05", "layer_thickness_mm": 0.1, "print_setting": "DEFAULT"},
+        "layer_count": 1000,
+    }
+
+
+def make_prints_page(print_count):
+    return {"count": print_count, "next": None, "previous": None, "results": [make_print_run(index) for index in range(print_count)]}
+
+
+def make_response(payload):
+    body = json.dumps(payload).encode("utf-8")
+    response = formlabs_web_api.rest.RESTResponse(urllib3.HTTPResponse(
+        body=body, status=200, headers={"Content-Type": "application/json"}, preload_content=True,
+    ))
+    response.read()
+    return response
+
+
+def client_with_backend(package, backend):
+    configuration = package.Configuration()
+    configuration.json_backend = backend
+    return package.ApiClient(configuration)
+
+
+def bench(label, package, get_json_backend, response, response_type, repeat):
+    types_map = {"200": response_type}
+
+    def before(client):
+        # The body was decoded to a str before json.loads
+        text = response.data.decode("utf-8")
+        client.deserialize(text, response_type, "application/json")
+
+    def after(client):
+        client.response_deserialize(response, types_map)
+
+    json_client = client_with_backend(package, "json")
+    variants = {"str + json": lambda: before(json_client), "bytes + json": lambda: after(json_client)}
+    try:
+        orjson_client = client_with_backend(package, get_json_backend("orjson"))
+    except ImportError:
+        pass
+    else:
+        variants["bytes + orjson"] = lambda: after(orjson_client)
+    # Interleave the variants so drifting machine load affects them alike
+    timings = dict.fromkeys(variants, float("inf"))
+    for _ in range(repeat):
+        for name, run in variants.items():
+            timings[name] = min(timings[name], timeit.timeit(run, number=1))
+
+    baseline = timings["str + json"]
+    print(f"{label} ({len(response.data) / 1e6:.1f} MB)")
+    for name, seconds in timings.items():
+        print(f"  {name:<16}{seconds * 1000:9.1f} ms  {baseline / seconds:5.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--prints", type=int, default=1000, help="print runs in the prints_list page")
+    parser.add_argument("--models", type=int, default=2000, help="models in the get_scene response")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    bench(
+        f"web prints_list, {args.prints} print runs",
+        formlabs_web_api,
+        get_web_json_backend,
+        make_response(make_prints_page(args.prints)),
+        "PaginatedPrintRunWithFleetControlDataList",
+        args.repeat,
+    )
+    bench(
+        f"local get_scene, {args.models} models",
+        formlabs_local_api,
+        get_local_json_backend,
+        make_response(make_scene(args.models)),
+        "SceneModel",
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
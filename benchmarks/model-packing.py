@@ -0,0 +1,89 @@
+"""
+Benchmark of handing lists of models to other processes or caches.
+
+Compares pickling the models, as process pools and most caches do, with
+pack_models/unpack_models of ModelPacking, on the models that are typically
+shipped around: scenes and printers of the local API, print runs and printers
+of the web API.
+
+Usage: python3 benchmarks/model-packing.py [--count 1000] [--repeat 10]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib"), os.path.join(ROOT, "local-api", "lib")]
+
+import formlabs_local_api
+import formlabs_web_api
+from formlabs_local_api import ModelPacking as local_packing
+from formlabs_web_api import ModelPacking as web_packing
+from tests.fake_web_api import make_print_run, make_printer
+
+
+def make_model_properties(index):
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "name": f"part_{index}",
+        "position": {"x": index % 50 * 2.5, "y": index // 50 * 2.5, "z": 0.0},
+        "orientation": {"x": 0.0, "y": 0.0, "z": 90.0},
+        "scale": 1.0,
+        "units": "MILLIMETERS",
+        "bounding_box": {"min_corner": {"x": 0.0, "y": 0.0, "z": 0.0}, "max_corner": {"x": 2.0, "y": 2.0, "z": 5.0}},
+        "original_file": f"C:\\Projects\\Models\\part_{index}.stl",
+        "visible": True,
+        "has_supports": index % 2 == 0,
+        "in_bounds": True,
+    }
+
+
+def bench(label, packing, models, repeat):
+    pickled = pickle.dumps(models)
+    packed = packing.pack_models(models)
+    assert pickle.loads(pickled) == packing.unpack_models(packed) == models
+    variants = {
+        "pickle dumps": lambda: pickle.dumps(models),
+        "pack_models": lambda: packing.pack_models(models),
+        "pickle loads": lambda: pickle.loads(pickled),
+        "unpack_models": lambda: packing.unpack_models(packed),
+    }
+    # Interleave the variants so drifting machine load affects them alike
+    timings = dict.fromkeys(variants, float("inf"))
+    for _ in range(repeat):
+        for name, run in variants.items():
+            timings[name] = min(timings[name], timeit.timeit(run, number=1))
+
+    print(f"{label}: {len(pickled) / len(models):.0f} B/model pickled, {len(packed) / len(models):.0f} B/model packed")
+    for name, seconds in timings.items():
+        print(f"  {name:<15}{seconds * 1000:9.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000, help="models in each list")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    scenes = [
+        formlabs_local_api.SceneModel.from_dict({
+            "models": [make_model_properties(index) for index in range(10)],
+            "scene_settings": {"machine_type": "FORM-4-0", "material_code": "FLGPGR05", "layer_thickness_mm": 0.1, "print_setting": "DEFAULT"},
+            "layer_count": 1000,
+        })
+        for _ in range(args.count // 10)
+    ]
+    bench(f"{len(scenes)} SceneModel of 10 models", local_packing, scenes, args.repeat)
+    properties = [formlabs_local_api.ModelProperties.from_dict(make_model_properties(index)) for index in range(args.count)]
+    bench(f"{args.count} ModelProperties", local_packing, properties, args.repeat)
+    runs = [formlabs_web_api.PrintRunWithFleetControlData.from_dict(make_print_run(index)) for index in range(args.count)]
+    bench(f"{args.count} PrintRunWithFleetControlData", web_packing, runs, args.repeat)
+    printers = [formlabs_web_api.DeveloperAPIMyPrinter.from_dict(make_printer(index)) for index in range(args.count)]
+    bench(f"{args.count} DeveloperAPIMyPrinter", web_packing, printers, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
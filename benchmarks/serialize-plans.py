@@ -0,0 +1,124 @@
+"""
+Benchmark of ApiClient.sanitize_for_serialization on large request bodies.
+
+Compares the previous serializer, which called each model's to_dict (a
+pydantic model_dump plus a to_dict of every nested model) and then walked the
+result again, with the single pass over the cached serialization plans.
+
+Usage: python3 benchmarks/serialize-plans.py [--models 2000] [--repeat 20]
+"""
+
+import argparse
+import datetime
+import decimal
+import os
+import sys
+import timeit
+from enum import Enum
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "web-api", "lib"), os.path.join(ROOT, "local-api", "lib")]
+
+from pydantic import SecretStr
+import formlabs_local_api
+import formlabs_web_api
+from tests.fake_web_api import make_printer
+
+
+def previous_sanitize(client, obj):
+    """ApiClient.sanitize_for_serialization before the serialization plans"""
+    if obj is None:
+        return None
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, SecretStr):
+        return obj.get_secret_value()
+    elif isinstance(obj, client.PRIMITIVE_TYPES):
+        return obj
+    elif isinstance(obj, list):
+        return [previous_sanitize(client, sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(previous_sanitize(client, sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    elif isinstance(obj, decimal.Decimal):
+        return str(obj)
+    elif isinstance(obj, dict):
+        obj_dict = obj
+    else:
+        obj_dict = obj.to_dict()
+    return {key: previous_sanitize(client, val) for key, val in obj_dict.items()}
+
+
+def make_scene(model_count):
+    return formlabs_local_api.SceneModel.from_dict({
+        "models": [
+            {
+                "id": f"00000000-0000-0000-0000-{index:012d}",
+                "name": f"part_{index}",
+                "position": {"x": index % 50 * 2.5, "y": index // 50 * 2.5, "z": 0.0},
+                "orientation": {"x": 0.0, "y": 0.0, "z": 90.0},
+                "scale": 1.0,
+                "units": "MILLIMETERS",
+                "bounding_box": {"min_corner": {"x": 0.0, "y": 0.0, "z": 0.0}, "max_corner": {"x": 2.0, "y": 2.0, "z": 5.0}},
+                "original_file": f"C:\\Projects\\Models\\part_{index}.stl",
+                "visible": True,
+                "has_supports": index % 2 == 0,
+                "in_bounds": True,
+            }
+            for index in range(model_count)
+        ],
+        "scene_settings": {"machine_type": "FORM-4-0", "material_code": "FLGPGR05", "layer_thickness_mm": 0.1, "print_setting": "DEFAULT"},
+        "layer_count": 1000,
+    })
+
+
+def bench(label, client, body, repeat):
+    assert previous_sanitize(client, body) == client.sanitize_for_serialization(body)
+    variants = {
+        "previous": lambda: previous_sanitize(client, body),
+        "plans": lambda: client.sanitize_for_serialization(body),
+    }
+    # Interleave the variants so drifting machine load affects them alike
+    timings = dict.fromkeys(variants, float("inf"))
+    for _ in range(repeat):
+        for name, run in variants.items():
+            timings[name] = min(timings[name], timeit.timeit(run, number=1))
+
+    print(label)
+    for name, seconds in timings.items():
+        print(f"  {name:<10}{seconds * 1000:9.2f} ms  {timings['previous'] / seconds:5.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=2000, help="models in the request bodies")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    local_client = formlabs_local_api.ApiClient()
+    scene = make_scene(args.models)
+    model_ids = [model.id for model in scene.models]
+    bench(
+        f"AutoSupportRequest, {args.models} model ids",
+        local_client,
+        formlabs_local_api.AutoSupportRequest(models=formlabs_local_api.ModelsSelectionModel(model_ids), density=1.0),
+        args.repeat,
+    )
+    bench(
+        f"UpdateModelRequest x {args.models}",
+        local_client,
+        [formlabs_local_api.UpdateModelRequest(name=model.name, position=model.position, scale=2.0) for model in scene.models],
+        args.repeat,
+    )
+    bench(f"SceneModel, {args.models} models", local_client, scene, args.repeat)
+
+    printers = formlabs_web_api.PaginatedDeveloperAPIMyPrinterList.from_dict({
+        "count": args.models // 10, "next": None, "previous": None,
+        "results": [make_printer(index) for index in range(args.models // 10)],
+    })
+    bench(f"web printers page, {args.models // 10} printers", formlabs_web_api.ApiClient(), printers, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ def hello_server():
     else:
         print("Unsupported platform")
         sys.exit(1)
-    with formlabs.PreFormApi.start_preform_server(pathToPreformServer=pathToPreformServer) as preform:
+    with formlabs.PreFormApi.start_preform_server_if_needed(pathToPreformServer=pathToPreformServer) as preform:
         preform.api.create_scene(SceneTypeModel(
             machine_type="FORM-4-0",
             material_code="FLRG1011",
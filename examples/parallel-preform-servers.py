@@ -0,0 +1,56 @@
+"""
+Demo application that prepares one .form file per STL file in a folder,
+using several PreFormServer processes in parallel.
+
+Usage: python3 parallel-preform-servers.py ~/Documents/folder-of-stl-files
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import formlabs_local_api as formlabs
+from formlabs_local_api import (
+    ImportModelRequest,
+    LoadFormFileRequest,
+    SceneTypeModel,
+    SceneTypeModelLayerThicknessMm,
+)
+
+parser = argparse.ArgumentParser(description="Process a folder path.")
+parser.add_argument("folder", type=str, help="Path to the folder")
+parser.add_argument("--servers", type=int, default=os.cpu_count(), help="Number of PreFormServer processes")
+args = parser.parse_args()
+
+directory_path = os.path.abspath(args.folder)
+stl_files = [f for f in os.listdir(directory_path) if f.endswith(".stl")]
+
+pathToPreformServer = None
+if sys.platform == 'win32':
+    pathToPreformServer = pathlib.Path().resolve() / "PreFormServer.exe"
+elif sys.platform == 'darwin':
+    pathToPreformServer = pathlib.Path().resolve() / "PreFormServer.app/Contents/MacOS/PreFormServer"
+else:
+    print("Unsupported platform")
+    sys.exit(1)
+
+
+def prepare(pool, file_name):
+    with pool.lease() as api:
+        api.create_scene(SceneTypeModel(
+            machine_type="FORM-4-0",
+            material_code="FLGPGR05",
+            layer_thickness_mm=SceneTypeModelLayerThicknessMm("0.1"),
+            print_setting="DEFAULT",
+        ))
+        api.import_model(ImportModelRequest(file=os.path.join(directory_path, file_name)))
+        form_path = os.path.join(directory_path, os.path.splitext(file_name)[0] + ".form")
+        api.save_form_file(LoadFormFileRequest(file=form_path))
+        print(f"Saved {form_path}")
+
+
+with formlabs.PreFormServerPool(size=args.servers, pathToPreformServer=pathToPreformServer) as pool:
+    with ThreadPoolExecutor(max_workers=args.servers) as executor:
+        for future in [executor.submit(prepare, pool, f) for f in stl_files]:
+            future.result()
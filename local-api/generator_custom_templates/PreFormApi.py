@@ -1,63 +1,142 @@
 """\
 Handwritten convenience wrapper around the generated Python library code
 """
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from collections import deque
+import asyncio
 import formlabs_local_api as formlabs
+from formlabs_local_api.AsyncUnifiedApi import AsyncUnifiedApi
+from formlabs_local_api.PreFormServerRecyclePolicy import PreFormServerStats
+import functools
 import subprocess
+import socket
 import os
+import re
 import sys
 import threading
-import queue
+import time
+from urllib.parse import urlsplit
+import urllib3
+
+class PreFormServerStartupError(RuntimeError):
+    """Raised when a PreFormServer does not become ready, keeps the last lines the server printed"""
+
+    def __init__(self, message, stdout_lines=(), stderr_lines=(), port_in_use=False):
+        self.stdout_lines = list(stdout_lines)
+        self.stderr_lines = list(stderr_lines)
+        self.port_in_use = port_in_use
+        if self.stderr_lines:
+            message += "\nLast server stderr output:\n" + "".join(self.stderr_lines[-20:])
+        super().__init__(message)
 
 class PreFormApi:
+    STARTUP_TIMEOUT = 120
+    READINESS_POLL_INTERVAL = 0.25
+    OUTPUT_BUFFER_LINES = 200
+    OUTPUT_READER_JOIN_TIMEOUT = 5
+
+
     server_process = None
+    startup_seconds = None
+    stdout_lines = None
+    stderr_lines = None
+    output_readers = ()
+    recycle_policy = None
+    pathToPreformServer = None
+    startup_timeout = None
 
     def __init__(self, preform_port=44388):
         self.preform_port = preform_port
-        self.client = formlabs.ApiClient(
-            formlabs.Configuration(host=f"http://localhost:{preform_port}")
-        )
+        self.stats = PreFormServerStats()
+        configuration = formlabs.Configuration(host=f"http://localhost:{preform_port}")
+        self.client = _MeteredApiClient(configuration, self.stats)
         self.api = formlabs.UnifiedApi(self.client)
+        self.async_api = AsyncUnifiedApi(self.client)
+        # Health checks go through their own client so they neither count as operations nor wait for a drain
+        self._probe_api = formlabs.UnifiedApi(formlabs.ApiClient(configuration))
 
     @staticmethod
-    def start_preform_sync(pathToPreformServer=None, preform_port=44388):
+    def start_preform_sync(pathToPreformServer=None, preform_port=44388, startup_timeout=None):
+        started = time.monotonic()
+        if startup_timeout is None:
+            startup_timeout = PreFormApi.STARTUP_TIMEOUT
         preformserver_path = _find_preform_server(pathToPreformServer)
 
+        preformApi = PreFormApi(preform_port)
+        preformApi.pathToPreformServer = preformserver_path
+        preformApi.startup_timeout = startup_timeout
+        if preformApi.probe_api_version() is not None:
+            raise PreFormServerStartupError(
+                "Port already in use, probably another PreForm server is already running.",
+                port_in_use=True)
+
         server_process = subprocess.Popen(
             [preformserver_path, "--port", str(preform_port)],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True)
-        
-        def output_reader(proc, outq):
-            for line in iter(proc.stdout.readline, ""):
-                outq.put(line)
-        
-        outq = queue.Queue()
-        t = threading.Thread(target=output_reader, args=(server_process, outq))
-        t.start()
-
-        while True:
-            try:
-                line = outq.get(block=True) # Add timeout?
+        preformApi.server_process = server_process
+        # Both pipes are always drained so a chatty server can never block on a full pipe buffer
+        preformApi.stdout_lines = deque(maxlen=PreFormApi.OUTPUT_BUFFER_LINES)
+        preformApi.stderr_lines = deque(maxlen=PreFormApi.OUTPUT_BUFFER_LINES)
+        ready = threading.Event()
+        port_in_use = threading.Event()
+
+        def output_reader(stream, lines):
+            for line in iter(stream.readline, ""):
+                lines.append(line)
                 if "READY FOR INPUT" in line:
-                    preformApi = PreFormApi(preform_port)
-                    preformApi.server_process = server_process
-                    return preformApi
+                    ready.set()
                 if "address is already in use" in line:
-                    raise RuntimeError("Port already in use, probably another PreForm server is already running.")
-            except queue.Empty:
-                print('could not get line from queue')
+                    port_in_use.set()
+
+        preformApi.output_readers = tuple(
+            threading.Thread(target=output_reader, args=(stream, lines), daemon=True)
+            for stream, lines in ((server_process.stdout, preformApi.stdout_lines), (server_process.stderr, preformApi.stderr_lines)))
+        for reader in preformApi.output_readers:
+            reader.start()
+
+        def fail(message, **kwargs):
+            preformApi.stop_preform_server()
+            raise PreFormServerStartupError(message, preformApi.stdout_lines, preformApi.stderr_lines, **kwargs)
+
+        # Ready is whichever comes first: the stdout marker or the server answering HTTP requests
+        deadline = started + startup_timeout
+        while not ready.is_set():
+            if port_in_use.is_set():
+                fail("Port already in use, probably another PreForm server is already running.", port_in_use=True)
+            if server_process.poll() is not None:
+                fail(f"PreForm server exited with code {server_process.returncode} during startup.")
+            if preformApi.probe_api_version(PreFormApi.READINESS_POLL_INTERVAL) is not None:
+                break
+            if time.monotonic() >= deadline:
+                fail(f"PreForm server was not ready after {startup_timeout} seconds.")
+            ready.wait(PreFormApi.READINESS_POLL_INTERVAL)
+
+        preformApi.startup_seconds = time.monotonic() - started
+        return preformApi
+
+    @staticmethod
+    def attach_preform_server(preform_port=44388, timeout=1.0):
+        """Returns a PreFormApi for a compatible PreFormServer already running on preform_port, or None if nothing answers"""
+        started = time.monotonic()
+        preformApi = PreFormApi(preform_port)
+        version = preformApi.probe_api_version(timeout)
+        if version is None:
+            return None
+        if not _is_compatible_version(version):
+            raise RuntimeError(f"PreForm server {version} on port {preform_port} is not compatible with this library ({formlabs.__version__}).")
+        preformApi.startup_seconds = time.monotonic() - started
+        return preformApi
 
     # This solves a problem while developing where it's easy to end up with an orphaned server process
-    # TODO: start_preform_server_if_needed
     @contextmanager
     @staticmethod
-    def start_preform_server(pathToPreformServer=None, preform_port=44388):
+    def start_preform_server(pathToPreformServer=None, preform_port=44388, startup_timeout=None):
         preformApi = None
         try:
-            preformApi = PreFormApi.start_preform_sync(pathToPreformServer, preform_port)
-            print("PreForm server ready")
+            preformApi = PreFormApi.start_preform_sync(pathToPreformServer, preform_port, startup_timeout)
+            print(f"PreForm server ready in {preformApi.startup_seconds:.2f}s")
             yield preformApi
             return
         finally:
@@ -65,11 +144,136 @@ class PreFormApi:
                 preformApi.stop_preform_server()
                 print("PreForm server stopped.")
 
+    # Skips the cold start when a short script is run repeatedly against a long-lived server.
+    # An attached server is left running on exit, only a server started here is stopped.
+    @contextmanager
+    @staticmethod
+    def start_preform_server_if_needed(pathToPreformServer=None, preform_port=44388, startup_timeout=None):
+        preformApi = PreFormApi.attach_preform_server(preform_port)
+        if preformApi is not None:
+            print(f"Attached to running PreForm server in {preformApi.startup_seconds:.2f}s")
+            yield preformApi
+            return
+        with PreFormApi.start_preform_server(pathToPreformServer, preform_port, startup_timeout) as preformApi:
+            yield preformApi
+
+    # Lets one event loop start and drive several servers, pass preform_port=None to pick a free port
+    @asynccontextmanager
+    @staticmethod
+    async def start_preform_server_async(pathToPreformServer=None, preform_port=44388, startup_timeout=None):
+        loop = asyncio.get_running_loop()
+        if preform_port is None:
+            start = functools.partial(_start_preform_on_free_port, pathToPreformServer, startup_timeout)
+        else:
+            start = functools.partial(PreFormApi.start_preform_sync, pathToPreformServer, preform_port, startup_timeout)
+        preformApi = await loop.run_in_executor(None, start)
+        try:
+            print(f"PreForm server ready in {preformApi.startup_seconds:.2f}s")
+            yield preformApi
+        finally:
+            await loop.run_in_executor(None, preformApi.stop_preform_server)
+            print("PreForm server stopped.")
+
+    def probe_api_version(self, timeout=1.0):
+        """Returns the version reported by the server, or None if it does not answer"""
+        try:
+            return self._probe_api.get_api_version(_request_timeout=float(timeout)).version
+        except (formlabs.ApiException, urllib3.exceptions.HTTPError):
+            return None
+
+    def is_running(self, timeout=1.0):
+        """Checks that the server process, if owned, has not exited and that the server answers requests"""
+        if self.server_process is not None and self.server_process.poll() is not None:
+            return False
+        return self.probe_api_version(timeout) is not None
+
+    def recycle_if_needed(self):
+        """Replaces the server process when the recycle policy asks for it, returns the reason or None
+
+        The replacement starts with an empty scene, so call this between jobs.
+        """
+        if self.recycle_policy is None or self.server_process is None:
+            return None
+        reason = self.recycle_policy.recycle_reason(self)
+        if reason is not None:
+            print(f"Recycling PreForm server on port {self.preform_port}: {reason}")
+            self.recycle()
+        return reason
+
+    def recycle(self):
+        """Waits for in-flight requests, then moves this wrapper onto a freshly started server process"""
+        with self.client.drained():
+            fresh = _start_preform_on_free_port(self.pathToPreformServer, self.startup_timeout)
+            old_process, old_readers = self.server_process, self.output_readers
+            self.server_process = fresh.server_process
+            self.output_readers = fresh.output_readers
+            self.preform_port = fresh.preform_port
+            self.client.configuration.host = fresh.client.configuration.host
+            self.startup_seconds = fresh.startup_seconds
+            self.stdout_lines = fresh.stdout_lines
+            self.stderr_lines = fresh.stderr_lines
+            self.stats.reset()
+            if old_process is not None:
+                _stop_process(old_process, old_readers)
+
     def stop_preform_server(self):
         if self.server_process is not None:
-            self.server_process.terminate()
-            self.server_process.wait()
+            _stop_process(self.server_process, self.output_readers)
             self.server_process = None
+            self.output_readers = ()
+
+class _MeteredApiClient(formlabs.ApiClient):
+    """ApiClient that records request latencies and can hold back requests while its server is replaced"""
+
+    def __init__(self, configuration, stats):
+        super().__init__(configuration)
+        self.stats = stats
+        self._in_flight = 0
+        self._draining = False
+        self._condition = threading.Condition()
+
+    def call_api(self, method, url, *args, **kwargs):
+        with self._condition:
+            self._condition.wait_for(lambda: not self._draining)
+            self._in_flight += 1
+        try:
+            # The request may have been serialized against a server that was recycled since
+            if not url.startswith(self.configuration.host):
+                parts = urlsplit(url)
+                url = self.configuration.host + parts.path + (f"?{parts.query}" if parts.query else "")
+            started = time.monotonic()
+            response = super().call_api(method, url, *args, **kwargs)
+            self.stats.record(time.monotonic() - started)
+            return response
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    @contextmanager
+    def drained(self):
+        """Blocks new requests and waits for in-flight ones to finish for the duration of the `with` block"""
+        with self._condition:
+            self._draining = True
+            self._condition.wait_for(lambda: self._in_flight == 0)
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._draining = False
+                self._condition.notify_all()
+
+def _stop_process(process, output_readers):
+    """Terminates a server process, then lets its output readers reach the end of the pipes and closes them"""
+    process.terminate()
+    process.wait()
+    for reader in output_readers:
+        reader.join(PreFormApi.OUTPUT_READER_JOIN_TIMEOUT)
+    # A reader still blocked on a pipe, e.g. one inherited by a child of the server, holds its lock
+    if not any(reader.is_alive() for reader in output_readers):
+        for stream in (process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
 
 def _find_preform_server(pathToPreformServer=None):
     if pathToPreformServer is None:
@@ -85,3 +289,29 @@ def _find_preform_server(pathToPreformServer=None):
         raise FileNotFoundError("PreFormServer executable not found at " + pathToPreformServer)
 
     return pathToPreformServer
+
+def _is_compatible_version(version):
+    """A server is compatible when it has the same major version and is at least as new as the library"""
+    def major_minor(v):
+        m = re.match(r"(\d+)\.(\d+)", v or "")
+        return (int(m.group(1)), int(m.group(2))) if m else None
+
+    server, library = major_minor(version), major_minor(formlabs.__version__)
+    if server is None or library is None:
+        return False
+    return server[0] == library[0] and server >= library
+
+def _start_preform_on_free_port(pathToPreformServer=None, startup_timeout=None, attempts=3):
+    for attempt in range(attempts):
+        try:
+            return PreFormApi.start_preform_sync(pathToPreformServer, _find_free_port(), startup_timeout)
+        except PreFormServerStartupError as e:
+            # Another process took the port between picking and binding it
+            if not e.port_in_use or attempt == attempts - 1:
+                raise
+
+def _find_free_port():
+    """Asks the OS for a currently unused localhost TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,94 @@
+"""\
+Handwritten policy deciding when a long-lived PreFormServer process should be replaced
+"""
+from collections import deque
+import math
+import os
+import threading
+
+
+class PreFormServerStats:
+    """Operation count and rolling request latencies of one PreFormServer process"""
+
+    def __init__(self, window=200):
+        self.window = window
+        self.operations = 0
+        self.baseline_p95 = None
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self.operations += 1
+            self._latencies.append(seconds)
+            # The first full window, right after startup, is what later latencies are compared against
+            if self.baseline_p95 is None and len(self._latencies) == self.window:
+                self.baseline_p95 = _p95(self._latencies)
+
+    def p95(self):
+        """p95 of the last `window` request latencies in seconds, None until the window is full"""
+        with self._lock:
+            if len(self._latencies) < self.window:
+                return None
+            return _p95(self._latencies)
+
+    def reset(self):
+        with self._lock:
+            self.operations = 0
+            self.baseline_p95 = None
+            self._latencies.clear()
+
+
+class PreFormServerRecyclePolicy:
+    """Thresholds after which a PreFormServer is drained and replaced by a fresh process.
+
+    Every threshold is optional, None disables it.
+
+    :param max_operations: number of requests a server may serve.
+    :param max_rss_bytes: resident memory the server process may use.
+    :param max_latency_drift: factor by which the rolling p95 request latency
+        may exceed the p95 measured right after startup.
+    """
+
+    def __init__(self, max_operations=None, max_rss_bytes=None, max_latency_drift=None):
+        self.max_operations = max_operations
+        self.max_rss_bytes = max_rss_bytes
+        self.max_latency_drift = max_latency_drift
+
+    def recycle_reason(self, preform):
+        """Returns why the server behind the PreFormApi should be recycled, or None if it is fine"""
+        stats = preform.stats
+        if self.max_operations is not None and stats.operations >= self.max_operations:
+            return f"served {stats.operations} operations"
+        if self.max_rss_bytes is not None and preform.server_process is not None:
+            rss = _process_rss_bytes(preform.server_process.pid)
+            if rss is not None and rss > self.max_rss_bytes:
+                return f"resident memory of {rss} bytes"
+        if self.max_latency_drift is not None and stats.baseline_p95:
+            p95 = stats.p95()
+            if p95 is not None and p95 > stats.baseline_p95 * self.max_latency_drift:
+                return f"p95 latency drifted from {stats.baseline_p95:.3f}s to {p95:.3f}s"
+        return None
+
+
+def _p95(values):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+def _process_rss_bytes(pid):
+    """Resident memory of a process, None when it cannot be determined on this platform"""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
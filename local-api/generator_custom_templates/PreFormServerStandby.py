@@ -0,0 +1,166 @@
+"""\
+Handwritten manager of warm standby PreFormServers, each already set up with a scene type
+"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from formlabs_local_api.PreFormApi import _start_preform_on_free_port
+import queue
+import threading
+
+
+class PreFormServerStandby:
+    """Keeps idle PreFormServers running with a scene already created for each configured scene type.
+
+    Checking out a server takes a ready one off the standby list, so neither
+    process launch nor `create_scene` is on the caller's critical path. A server
+    is reset with `create_scene` when it is checked back in and kept as a standby
+    if one is missing, otherwise stopped. Servers are only started in the
+    background to replace one that died or could not be reset, or when every
+    server of a scene type is checked out and a caller waits for one, so that a
+    server checked back in does not find its place taken by a refill.
+    """
+    HEALTH_CHECK_TIMEOUT = 5.0
+
+    def __init__(self, scene_types, standby_count=1, pathToPreformServer=None, startup_timeout=None, recycle_policy=None):
+        """
+        :param scene_types: list of SceneTypeModel to keep standby servers for.
+        :param standby_count: number of idle servers to keep per scene type.
+        :param recycle_policy: PreFormServerRecyclePolicy checked each time a server is checked in.
+        """
+        self.standby_count = standby_count
+        self.pathToPreformServer = pathToPreformServer
+        self.startup_timeout = startup_timeout
+        self.recycle_policy = recycle_policy
+        self._scene_types = {_scene_type_key(scene_type): scene_type for scene_type in scene_types}
+        self._idle = {key: queue.Queue() for key in self._scene_types}
+        self._starting = {key: 0 for key in self._scene_types}
+        self._waiting = {key: 0 for key in self._scene_types}
+        self._servers = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self._scene_types) * standby_count))
+        self._closed = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def start(self):
+        """Starts the standby servers for every scene type and waits until they are ready"""
+        futures = [self._executor.submit(self._refill, key) for key in self._scene_types for _ in range(self.standby_count)]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            self.shutdown()
+            raise
+
+    @contextmanager
+    def checkout(self, scene_type, timeout=None):
+        """Gives exclusive use of a server whose scene is set up with scene_type, as a `UnifiedApi`
+
+        :param scene_type: SceneTypeModel, must be one of the scene types given to the constructor.
+        :param timeout: seconds to wait for a standby server, waits forever if None.
+        """
+        key = _scene_type_key(scene_type)
+        if key not in self._idle:
+            raise ValueError(f"No standby servers are configured for scene type {key}")
+        preform = self._acquire(key, timeout)
+        try:
+            yield preform.api
+        finally:
+            if self._closed:
+                self._discard(preform)
+            else:
+                self._executor.submit(self._check_in, key, preform)
+
+    def shutdown(self):
+        """Stops the background refills and every server started by the manager"""
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            servers, self._servers = self._servers, []
+        for preform in servers:
+            preform.stop_preform_server()
+
+    def idle_count(self, scene_type):
+        """Number of standby servers currently ready for scene_type"""
+        return self._idle[_scene_type_key(scene_type)].qsize()
+
+    def _acquire(self, key, timeout):
+        if self._closed:
+            raise RuntimeError("PreFormServerStandby has been shut down.")
+        with self._lock:
+            self._waiting[key] += 1
+        try:
+            while True:
+                if self._idle[key].empty():
+                    # Every server is checked out, start one for this caller rather than wait for a check-in
+                    self._executor.submit(self._refill, key)
+                try:
+                    preform = self._idle[key].get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"No standby PreForm server became ready within {timeout} seconds.")
+                if preform.is_running(self.HEALTH_CHECK_TIMEOUT):
+                    return preform
+                self._discard(preform)
+                self._executor.submit(self._refill, key)
+        finally:
+            with self._lock:
+                self._waiting[key] -= 1
+
+    def _refill(self, key):
+        with self._lock:
+            target = max(self.standby_count, self._waiting[key])
+            if self._closed or self._idle[key].qsize() + self._starting[key] >= target:
+                return
+            self._starting[key] += 1
+        try:
+            preform = self._start_server()
+            try:
+                preform.api.create_scene(self._scene_types[key])
+            except BaseException:
+                self._discard(preform)
+                raise
+            self._idle[key].put(preform)
+        except Exception as e:
+            print(f"Failed to start standby PreForm server: {e}")
+            raise
+        finally:
+            with self._lock:
+                self._starting[key] -= 1
+
+    def _check_in(self, key, preform):
+        try:
+            preform.recycle_if_needed()
+            preform.api.create_scene(self._scene_types[key])
+        except Exception as e:
+            print(f"Discarding PreForm server that could not be reset: {e}")
+            self._discard(preform)
+            self._refill(key)
+            return
+        with self._lock:
+            keep = not self._closed and self._idle[key].qsize() < self.standby_count
+            if keep:
+                self._idle[key].put(preform)
+        if not keep:
+            self._discard(preform)
+
+    def _start_server(self):
+        preform = _start_preform_on_free_port(self.pathToPreformServer, self.startup_timeout)
+        preform.recycle_policy = self.recycle_policy
+        with self._lock:
+            self._servers.append(preform)
+        return preform
+
+    def _discard(self, preform):
+        with self._lock:
+            if preform in self._servers:
+                self._servers.remove(preform)
+        preform.stop_preform_server()
+
+
+def _scene_type_key(scene_type):
+    return scene_type.to_json()
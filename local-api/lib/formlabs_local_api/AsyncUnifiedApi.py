@@ -0,0 +1,49 @@
+"""\
+Handwritten asyncio interface to the generated, blocking UnifiedApi
+"""
+import asyncio
+import functools
+import inspect
+import formlabs_local_api as formlabs
+
+
+class AsyncUnifiedApi:
+    """Awaitable version of every UnifiedApi operation.
+
+    Each call runs the blocking generated operation on an executor thread, so one
+    event loop can wait on long operations such as `auto_support` on several
+    PreFormServers, and on device polls, at the same time. The underlying urllib3
+    connection pool is shared between those threads.
+    The `*_without_preload_content` variants are left out since reading their
+    raw response would block the event loop.
+
+    :param api_client: ApiClient of the server to talk to.
+    :param executor: concurrent.futures.Executor for the blocking calls,
+        the event loop's default executor if None.
+    """
+
+    def __init__(self, api_client=None, executor=None) -> None:
+        if api_client is None:
+            api_client = formlabs.ApiClient.get_default()
+        self.api_client = api_client
+        self.executor = executor
+        self._api = formlabs.UnifiedApi(api_client)
+
+    async def _run(self, operation, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(operation, *args, **kwargs))
+
+
+def _make_async_operation(name):
+    blocking = getattr(formlabs.UnifiedApi, name)
+
+    @functools.wraps(blocking)
+    async def operation(self, *args, **kwargs):
+        return await self._run(getattr(self._api, name), *args, **kwargs)
+
+    return operation
+
+
+for _name, _ in inspect.getmembers(formlabs.UnifiedApi, inspect.isfunction):
+    if not _name.startswith("_") and not _name.endswith("_without_preload_content"):
+        setattr(AsyncUnifiedApi, _name, _make_async_operation(_name))
@@ -0,0 +1,184 @@
+"""\
+Handwritten lazy deserialization of the generated models
+"""
+import typing
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+
+class LazyModel:
+    """Stand-in for a model that is deserialized on first attribute access.
+
+    Until then it only holds the parsed JSON of the model, so items of large
+    responses that are never looked at are never validated. It reports the
+    model's class as its `__class__`, so `isinstance` checks and the field
+    validation of the generated models accept it in place of the model, and
+    delegates attribute access, `to_dict`, `to_json`, equality and pickling to
+    the materialized model. The materialized model's own nested models and
+    list items are again LazyModels.
+
+    :param klass: the generated model class.
+    :param data: parsed JSON of the model.
+    """
+
+    __slots__ = ("_lazy_klass", "_lazy_data", "_lazy_instance")
+
+    def __init__(self, klass, data) -> None:
+        object.__setattr__(self, "_lazy_klass", klass)
+        object.__setattr__(self, "_lazy_data", data)
+        object.__setattr__(self, "_lazy_instance", None)
+
+    @property
+    def __class__(self):
+        return self._lazy_klass
+
+    def _materialize(self):
+        instance = self._lazy_instance
+        if instance is None:
+            instance = lazy_from_dict(self._lazy_klass, self._lazy_data)
+            object.__setattr__(self, "_lazy_instance", instance)
+            # The parsed JSON is no longer needed once the model holds it
+            object.__setattr__(self, "_lazy_data", None)
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self._materialize(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._materialize(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._materialize(), name)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyModel):
+            other = other._materialize()
+        return self._materialize() == other
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __repr__(self):
+        return repr(self._materialize())
+
+    def __str__(self):
+        return str(self._materialize())
+
+    def __copy__(self):
+        return self._materialize().__copy__()
+
+    def __deepcopy__(self, memo=None):
+        return self._materialize().__deepcopy__(memo)
+
+    def __reduce_ex__(self, protocol):
+        return self._materialize().__reduce_ex__(protocol)
+
+
+def is_materialized(instance):
+    """Returns False for a LazyModel that was not accessed yet, True for everything else"""
+    return object.__getattribute__(instance, "_lazy_instance") is not None if type(instance) is LazyModel else True
+
+
+def lazy_from_dict(klass, obj):
+    """Deserializes `obj` into `klass` like `klass.from_dict`, but with LazyModels for its nested models.
+
+    Only the top level model is validated. Models whose fields do not follow
+    the plain generated layout, e.g. the oneOf models, are deserialized with
+    their own `from_dict`.
+    """
+    plan = field_plan(klass)
+    if plan is None or not isinstance(obj, dict):
+        return klass.from_dict(obj)
+    values = {
+        key: _lazy_value(obj.get(key), wrap) if wrap is not None else obj.get(key)
+        for key, wrap in plan
+    }
+    for key, default in field_defaults(klass):
+        if values[key] is None:
+            values[key] = default
+    return klass.model_validate(values)
+
+
+def _lazy_value(value, wrap):
+    if value is None:
+        return None
+    container, klass = wrap
+    if container is list:
+        return [LazyModel(klass, item) for item in value]
+    if container is dict:
+        return {key: LazyModel(klass, item) for key, item in value.items()}
+    return LazyModel(klass, value)
+
+
+_field_plans = {}
+
+
+def field_plan(klass):
+    """(key, wrap) per field of `klass`, where wrap tells how to build LazyModels for the value.
+
+    wrap is None for plain values, else (container, model class) with container
+    one of None, list or dict. Returns None when some field is not understood.
+    """
+    try:
+        return _field_plans[klass]
+    except KeyError:
+        pass
+    plan = []
+    for name, field in klass.model_fields.items():
+        if name == "actual_instance":
+            plan = None
+            break
+        wrap = _field_wrap(field.annotation)
+        if wrap is False:
+            plan = None
+            break
+        plan.append((field.alias or name, wrap))
+    plan = _field_plans[klass] = tuple(plan) if plan is not None else None
+    return plan
+
+
+_field_defaults = {}
+
+
+def field_defaults(klass):
+    """(key, default) per field of `klass` that `from_dict` sets to its default when the value is missing or null"""
+    try:
+        return _field_defaults[klass]
+    except KeyError:
+        pass
+    defaults = _field_defaults[klass] = tuple(
+        (field.alias or name, field.default)
+        for name, field in klass.model_fields.items()
+        if field.default is not None and field.default is not PydanticUndefined
+    )
+    return defaults
+
+
+def _field_wrap(annotation):
+    annotation = strip_optional(annotation)
+    origin = typing.get_origin(annotation)
+    if origin in (list, dict):
+        item = strip_optional(typing.get_args(annotation)[-1])
+        if _is_model(item):
+            return (origin, item)
+        return False if _mentions_model(item) else None
+    if _is_model(annotation):
+        return (None, annotation)
+    return False if _mentions_model(annotation) else None
+
+
+def strip_optional(annotation):
+    """`annotation` without the None of an Optional"""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation):
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _mentions_model(annotation):
+    return _is_model(annotation) or any(_mentions_model(arg) for arg in typing.get_args(annotation))
@@ -0,0 +1,333 @@
+"""\
+Handwritten compact binary encoding of the generated models, e.g. for process pools and caches
+"""
+import datetime
+import io
+import pickle
+import typing
+import zlib
+from enum import Enum
+from pydantic import BaseModel, TypeAdapter
+import formlabs_local_api.models
+
+# Bumped when the layout of the packed data changes
+_FORMAT = 1
+# Protocol 4 is read by every supported Python version
+_PROTOCOL = 4
+
+
+def pack(model) -> bytes:
+    """Returns the compact binary representation of a model, which `unpack` turns back into an equal model.
+
+    Each model is packed as a list of its field values in field order, with
+    nested models, enum members and date-times turned into lists, values and
+    strings, and the result pickled. The bytes hold no classes, so they are
+    a fraction of the size of a pickled model and are unpacked without
+    validation, but only by the same version of the models.
+    """
+    klass = model.__class__
+    return _dumps(klass, False, _model_encoder(klass)(model))
+
+
+def pack_models(models, klass=None) -> bytes:
+    """Returns the compact binary representation of a list of models of one class, see `pack`.
+
+    :param models: models, all of class `klass`, or of the class of the first model.
+    :param klass: model class, needed if `models` may be empty.
+    """
+    models = list(models)
+    if klass is None:
+        if not models:
+            raise ValueError("The model class of an empty list has to be given")
+        klass = models[0].__class__
+    encode = _model_encoder(klass)
+    return _dumps(klass, True, [encode(model) for model in models])
+
+
+def unpack(data: bytes, klass=None):
+    """Returns the model packed by `pack`.
+
+    :param klass: expected model class, a ValueError is raised for others.
+    """
+    klass, rows = _loads(data, klass, False)
+    return _model_decoder(klass)(rows)
+
+
+def unpack_models(data: bytes, klass=None) -> list:
+    """Returns the list of models packed by `pack_models`.
+
+    :param klass: expected model class, a ValueError is raised for others.
+    """
+    klass, rows = _loads(data, klass, True)
+    decode = _model_decoder(klass)
+    return [decode(row) for row in rows]
+
+
+def _dumps(klass, many, rows):
+    return pickle.dumps((_FORMAT, klass.__name__, _fingerprint(klass), many, rows), protocol=_PROTOCOL)
+
+
+def _loads(data, klass, many):
+    try:
+        packed_format, name, fingerprint, packed_many, rows = _Unpickler(io.BytesIO(data)).load()
+    except (pickle.UnpicklingError, EOFError, TypeError, ValueError) as e:
+        raise ValueError(f"Not packed models: {e}") from e
+    if packed_format != _FORMAT:
+        raise ValueError(f"Models packed in format {packed_format}, expected {_FORMAT}")
+    if packed_many != many:
+        raise ValueError("A list of models was packed, use unpack_models" if packed_many else "A single model was packed, use unpack")
+    packed_klass = getattr(formlabs_local_api.models, name, None)
+    if klass is not None and packed_klass is not klass:
+        raise ValueError(f"{name} was packed, expected {klass.__name__}")
+    if packed_klass is None or _fingerprint(packed_klass) != fingerprint:
+        raise ValueError(f"{name} was packed by another version of the models")
+    return packed_klass, rows
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickles packed models, which hold only builtin values, and nothing else"""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Packed models hold no {module}.{name}")
+
+
+_fingerprints = {}
+_model_encoders = {}
+_model_decoders = {}
+# Setters of the slots of BaseModel, which model_construct sets up too
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _fingerprint(klass):
+    """Checksum of the fields of `klass` and of the models it nests, which decide the packed layout"""
+    try:
+        return _fingerprints[klass]
+    except KeyError:
+        pass
+    fields = []
+    pending = [klass]
+    seen = set()
+    while pending:
+        model = pending.pop()
+        if model in seen:
+            continue
+        seen.add(model)
+        fields.append(f"{model.__name__}({','.join(model.model_fields)})")
+        for field in model.model_fields.values():
+            pending.extend(_nested_models(field.annotation))
+    fingerprint = _fingerprints[klass] = zlib.crc32(";".join(sorted(fields)).encode("utf-8"))
+    return fingerprint
+
+
+def _nested_models(annotation):
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [model for arg in typing.get_args(annotation) for model in _nested_models(arg)]
+
+
+def _model_encoder(klass):
+    try:
+        return _model_encoders[klass]
+    except KeyError:
+        pass
+    # Registered before the fields are compiled, so that models nesting themselves find it
+    encoder = _model_encoders[klass] = _ModelEncoder(klass)
+    encoder.compile()
+    return encoder
+
+
+def _model_decoder(klass):
+    try:
+        return _model_decoders[klass]
+    except KeyError:
+        pass
+    decoder = _model_decoders[klass] = _ModelDecoder(klass)
+    decoder.compile()
+    return decoder
+
+
+class _ModelEncoder:
+    """Turns a model into the list of its encoded field values.
+
+    Models with only some fields set, e.g. built with keywords, are a tuple of
+    the bit mask of the set fields and the list instead.
+    """
+
+    def __init__(self, klass) -> None:
+        self.klass = klass
+        self.names = tuple(klass.model_fields)
+        self.converted = ()
+
+    def compile(self):
+        converted = []
+        for index, field in enumerate(self.klass.model_fields.values()):
+            encode = _encoder(field.annotation)
+            if encode is not None:
+                converted.append((index, encode))
+        self.converted = tuple(converted)
+
+    def __call__(self, model):
+        values = model.__dict__
+        row = [values[name] for name in self.names]
+        for index, encode in self.converted:
+            value = row[index]
+            if value is not None:
+                row[index] = encode(value)
+        fields_set = model.__pydantic_fields_set__
+        if len(fields_set) == len(self.names):
+            return row
+        return sum(1 << index for index, name in enumerate(self.names) if name in fields_set), row
+
+
+class _ModelDecoder:
+    """Builds a model from the row of `_ModelEncoder` without validating it"""
+
+    def __init__(self, klass) -> None:
+        self.klass = klass
+        self.names = tuple(klass.model_fields)
+        self.all_fields = frozenset(self.names)
+        self.converted = ()
+        # Private attributes and model_post_init need validation to be set up
+        self.validate = bool(klass.__private_attributes__ or klass.__pydantic_post_init__)
+
+    def compile(self):
+        converted = []
+        for name, field in self.klass.model_fields.items():
+            decode = _decoder(field.annotation)
+            if decode is not None:
+                converted.append((name, decode))
+        self.converted = tuple(converted)
+
+    def __call__(self, row):
+        if row.__class__ is tuple:
+            mask, row = row
+            fields_set = {name for index, name in enumerate(self.names) if mask >> index & 1}
+        else:
+            fields_set = set(self.all_fields)
+        values = dict(zip(self.names, row))
+        for name, decode in self.converted:
+            value = values[name]
+            if value is not None:
+                values[name] = decode(value)
+        if self.validate:
+            return self.klass.model_validate(values)
+        instance = self.klass.__new__(self.klass)
+        _set_dict(instance, values)
+        _set_fields_set(instance, fields_set)
+        _set_extra(instance, None)
+        _set_private(instance, None)
+        return instance
+
+
+def _encoder(annotation):
+    """Returns the function encoding a non-None value of `annotation` into builtin values, None to keep it as is"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _encoder(args[0])
+    if origin is typing.Union:
+        args = [arg for arg in args if arg is not type(None)]
+        encoders = [_encoder(arg) for arg in args]
+        if len(args) == 1:
+            return encoders[0]
+        if all(encode is None for encode in encoders):
+            return None
+        # The index of the member tells which decoder to use
+        classes = [_runtime_class(arg) for arg in args]
+        return lambda value: _encode_union(classes, encoders, value)
+    if origin in (list, set, frozenset):
+        encode = _encoder(args[0])
+        if encode is None:
+            return None
+        return lambda value: [None if item is None else encode(item) for item in value]
+    if origin is dict:
+        encode = _encoder(args[1])
+        if encode is None:
+            return None
+        return lambda value: {key: None if item is None else encode(item) for key, item in value.items()}
+    if origin is not None:
+        return _fallback_encoder(annotation)
+    if annotation is typing.Any or annotation in (str, int, float, bool, bytes, object):
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_encoder(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _enum_value
+    if annotation in (datetime.datetime, datetime.date):
+        return annotation.isoformat
+    return _fallback_encoder(annotation)
+
+
+def _decoder(annotation):
+    """Returns the function decoding a non-None value encoded by the `_encoder` of `annotation`"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _decoder(args[0])
+    if origin is typing.Union:
+        args = [arg for arg in args if arg is not type(None)]
+        if len(args) == 1:
+            return _decoder(args[0])
+        if all(_encoder(arg) is None for arg in args):
+            return None
+        decoders = [_decoder(arg) or _identity for arg in args]
+        return lambda value: decoders[value[0]](value[1])
+    if origin in (list, set, frozenset):
+        decode = _decoder(args[0])
+        if decode is None:
+            return None
+        if origin is list:
+            return lambda value: [None if item is None else decode(item) for item in value]
+        return lambda value: origin(None if item is None else decode(item) for item in value)
+    if origin is dict:
+        decode = _decoder(args[1])
+        if decode is None:
+            return None
+        return lambda value: {key: None if item is None else decode(item) for key, item in value.items()}
+    if origin is not None:
+        return TypeAdapter(annotation).validate_python
+    if annotation is typing.Any or annotation in (str, int, float, bool, bytes, object):
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_decoder(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        # Looking the members up skips the slow Enum call
+        return {member.value: member for member in annotation}.__getitem__
+    if annotation in (datetime.datetime, datetime.date):
+        return annotation.fromisoformat
+    return TypeAdapter(annotation).validate_python
+
+
+def _encode_union(classes, encoders, value):
+    for index, klass in enumerate(classes):
+        if isinstance(value, klass):
+            encode = encoders[index]
+            return index, value if encode is None else encode(value)
+    raise ValueError(f"{value!r} is none of {', '.join(klass.__name__ for klass in classes)}")
+
+
+def _runtime_class(annotation):
+    """Class of the values of `annotation`, e.g. list for List[str]"""
+    while typing.get_origin(annotation) is typing.Annotated:
+        annotation = typing.get_args(annotation)[0]
+    origin = typing.get_origin(annotation)
+    if origin is not None:
+        return origin if isinstance(origin, type) else object
+    return annotation if isinstance(annotation, type) else object
+
+
+def _fallback_encoder(annotation):
+    # Types the models hardly use are packed as JSON values and validated again
+    adapter = TypeAdapter(annotation)
+    return lambda value: adapter.dump_python(value, mode="json")
+
+
+def _enum_value(member):
+    return member.value
+
+
+def _identity(value):
+    return value
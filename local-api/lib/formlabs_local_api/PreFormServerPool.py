@@ -0,0 +1,112 @@
+"""\
+Handwritten pool of PreFormServer processes for preparing several scenes in parallel
+"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from formlabs_local_api.PreFormApi import _start_preform_on_free_port
+import os
+import queue
+import threading
+
+
+class PreFormServerPool:
+    """Starts several PreFormServer processes and leases them out one at a time.
+
+    Each PreFormServer keeps a single cached scene, so a lease gives its holder
+    exclusive use of one server until the `with` block exits. Every server gets
+    its own free localhost port.
+    """
+    HEALTH_CHECK_TIMEOUT = 5.0
+
+    def __init__(self, size=None, pathToPreformServer=None, start_attempts=3, startup_timeout=None, recycle_policy=None):
+        """
+        :param recycle_policy: PreFormServerRecyclePolicy checked each time a lease ends.
+        """
+        self.size = size if size is not None else (os.cpu_count() or 1)
+        self.pathToPreformServer = pathToPreformServer
+        self.startup_timeout = startup_timeout
+        self.recycle_policy = recycle_policy
+        self.start_attempts = start_attempts
+        self._idle = queue.Queue()
+        self._servers = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def start(self):
+        """Starts all servers of the pool in parallel and waits until they are ready"""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._start_server) for _ in range(self.size)]
+        try:
+            for future in futures:
+                self._idle.put(future.result())
+        except BaseException:
+            self.shutdown()
+            raise
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Gives exclusive use of one healthy server, as a `UnifiedApi`, for the duration of the `with` block
+
+        :param timeout: seconds to wait for a server to become free, waits forever if None.
+        """
+        preform = self._acquire(timeout)
+        try:
+            yield preform.api
+        finally:
+            self._release(preform)
+
+    def shutdown(self):
+        """Stops every server started by the pool"""
+        self._closed = True
+        with self._lock:
+            servers, self._servers = self._servers, []
+        for preform in servers:
+            preform.stop_preform_server()
+
+    def _acquire(self, timeout):
+        if self._closed:
+            raise RuntimeError("PreFormServerPool has been shut down.")
+        try:
+            preform = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No PreForm server became free within {timeout} seconds.")
+        # None stands for a slot whose server could not be started again
+        if preform is not None and preform.is_running(self.HEALTH_CHECK_TIMEOUT):
+            return preform
+        if preform is not None:
+            self._discard(preform)
+        try:
+            return self._start_server()
+        except BaseException:
+            # The slot stays in the pool, the next lease taking it tries again
+            self._idle.put(None)
+            raise
+
+    def _release(self, preform):
+        if not self._closed:
+            try:
+                preform.recycle_if_needed()
+            except Exception as e:
+                # A server that could not be replaced is left as it is, the next health check decides its fate
+                print(f"Failed to recycle PreForm server: {e}")
+        self._idle.put(preform)
+
+    def _start_server(self):
+        preform = _start_preform_on_free_port(self.pathToPreformServer, self.startup_timeout, self.start_attempts)
+        preform.recycle_policy = self.recycle_policy
+        with self._lock:
+            self._servers.append(preform)
+        return preform
+
+    def _discard(self, preform):
+        with self._lock:
+            if preform in self._servers:
+                self._servers.remove(preform)
+        preform.stop_preform_server()
@@ -113,4 +113,13 @@ from formlabs_local_api.models.username_and_password import UsernameAndPassword
 from formlabs_local_api.models.web_auth_tokens_model import WebAuthTokensModel
 
 # START SECTION OF CODE ADDED BY FORMLABS
-from formlabs_local_api.PreFormApi import PreFormApi
\ No newline at end of file
+from formlabs_local_api.PreFormApi import PreFormApi, PreFormServerStartupError
+from formlabs_local_api.PreFormServerPool import PreFormServerPool
+from formlabs_local_api.PreFormServerStandby import PreFormServerStandby
+from formlabs_local_api.PreFormServerRecyclePolicy import PreFormServerRecyclePolicy, PreFormServerStats
+from formlabs_local_api.AsyncUnifiedApi import AsyncUnifiedApi
+from formlabs_local_api.Instrumentation import HistogramCollector, Instrumentation, OperationRecord
+from formlabs_local_api.LazyModel import LazyModel, is_materialized
+from formlabs_local_api.UncheckedUnifiedApi import UncheckedUnifiedApi
+from formlabs_local_api.JsonBackend import JsonBackend
+from formlabs_local_api.ModelPacking import pack_models, unpack_models
\ No newline at end of file
@@ -90,7 +90,8 @@ class APIInfoApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_api_version'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -153,7 +154,8 @@ class APIInfoApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_api_version'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -216,7 +218,9 @@ class APIInfoApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_api_version',
+            _preload_content=False
         )
         return response_data.response
 
@@ -98,7 +98,8 @@ class AuthenticationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='login'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -166,7 +167,8 @@ class AuthenticationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='login'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -234,7 +236,9 @@ class AuthenticationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='login',
+            _preload_content=False
         )
         return response_data.response
 
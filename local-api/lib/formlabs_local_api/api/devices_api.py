@@ -100,7 +100,8 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='discover_devices'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -168,7 +169,8 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='discover_devices'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -236,7 +238,9 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='discover_devices',
+            _preload_content=False
         )
         return response_data.response
 
@@ -374,7 +378,8 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_device'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -442,7 +447,8 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_device'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -510,7 +516,9 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_device',
+            _preload_content=False
         )
         return response_data.response
 
@@ -631,7 +639,8 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_devices'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -695,7 +704,8 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_devices'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -759,7 +769,9 @@ class DevicesApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_devices',
+            _preload_content=False
         )
         return response_data.response
 
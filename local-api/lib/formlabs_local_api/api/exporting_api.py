@@ -98,7 +98,8 @@ class ExportingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='save_form_file'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -166,7 +167,8 @@ class ExportingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='save_form_file'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -234,7 +236,9 @@ class ExportingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='save_form_file',
+            _preload_content=False
         )
         return response_data.response
 
@@ -372,7 +376,8 @@ class ExportingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='save_screenshot'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -440,7 +445,8 @@ class ExportingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='save_screenshot'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -508,7 +514,9 @@ class ExportingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='save_screenshot',
+            _preload_content=False
         )
         return response_data.response
 
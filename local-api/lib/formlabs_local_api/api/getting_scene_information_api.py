@@ -96,7 +96,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='estimate_print_time'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -160,7 +161,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='estimate_print_time'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -224,7 +226,9 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='estimate_print_time',
+            _preload_content=False
         )
         return response_data.response
 
@@ -346,7 +350,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -414,7 +419,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -482,7 +488,9 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_model',
+            _preload_content=False
         )
         return response_data.response
 
@@ -603,7 +611,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_print_validation'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -667,7 +676,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_print_validation'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -731,7 +741,9 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_print_validation',
+            _preload_content=False
         )
         return response_data.response
 
@@ -848,7 +860,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_scene'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -911,7 +924,8 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_scene'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -974,7 +988,9 @@ class GettingSceneInformationApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='get_scene',
+            _preload_content=False
         )
         return response_data.response
 
@@ -109,7 +109,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_layout'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -177,7 +178,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_layout'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -245,7 +247,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_layout',
+            _preload_content=False
         )
         return response_data.response
 
@@ -383,7 +387,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_orient'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -451,7 +456,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_orient'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -519,7 +525,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_orient',
+            _preload_content=False
         )
         return response_data.response
 
@@ -657,7 +665,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_pack'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -725,7 +734,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_pack'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -793,7 +803,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_pack',
+            _preload_content=False
         )
         return response_data.response
 
@@ -931,7 +943,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_support'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -999,7 +1012,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_support'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1067,7 +1081,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='auto_support',
+            _preload_content=False
         )
         return response_data.response
 
@@ -1205,7 +1221,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='create_scene'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1273,7 +1290,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='create_scene'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1341,7 +1359,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='create_scene',
+            _preload_content=False
         )
         return response_data.response
 
@@ -1478,7 +1498,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='delete_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1545,7 +1566,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='delete_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1612,7 +1634,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='delete_model',
+            _preload_content=False
         )
         return response_data.response
 
@@ -1734,7 +1758,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='duplicate_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1806,7 +1831,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='duplicate_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1878,7 +1904,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='duplicate_model',
+            _preload_content=False
         )
         return response_data.response
 
@@ -2019,7 +2047,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='import_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2087,7 +2116,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='import_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2155,7 +2185,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='import_model',
+            _preload_content=False
         )
         return response_data.response
 
@@ -2292,7 +2324,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='load_form_file'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2359,7 +2392,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='load_form_file'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2426,7 +2460,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='load_form_file',
+            _preload_content=False
         )
         return response_data.response
 
@@ -2568,7 +2604,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='replace_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2640,7 +2677,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='replace_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2712,7 +2750,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='replace_model',
+            _preload_content=False
         )
         return response_data.response
 
@@ -2857,7 +2897,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='update_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2929,7 +2970,8 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='update_model'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -3001,7 +3043,9 @@ class ModifyingASceneApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='update_model',
+            _preload_content=False
         )
         return response_data.response
 
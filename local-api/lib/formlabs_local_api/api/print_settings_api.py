@@ -90,7 +90,8 @@ class PrintSettingsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='list_materials'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -153,7 +154,8 @@ class PrintSettingsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='list_materials'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -216,7 +218,9 @@ class PrintSettingsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='list_materials',
+            _preload_content=False
         )
         return response_data.response
 
@@ -96,7 +96,8 @@ class PrintingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='call_print'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -164,7 +165,8 @@ class PrintingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='call_print'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -232,7 +234,9 @@ class PrintingApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='call_print',
+            _preload_content=False
         )
         return response_data.response
 
@@ -15,7 +15,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_local_api.JsonBackend import model_json_backend
+from formlabs_local_api.ModelPacking import pack, unpack
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
 from typing import Any, ClassVar, Dict, List, Optional, Union
@@ -34,6 +35,10 @@ class AutoLayoutRequest(BaseModel):
     lock_rotation: Optional[StrictBool] = Field(default=None, description="Whether to keep model rotation about Z fixed during layout.")
     build_platform_2_optimized: Optional[StrictBool] = Field(default=None, description="Whether to optimize the build platform for two models.")
     __properties: ClassVar[List[str]] = ["models", "model_spacing_mm", "allow_overlapping_supports", "lock_rotation", "build_platform_2_optimized"]
+    read_only_fields: ClassVar[Set[str]] = set([
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -49,12 +54,21 @@ class AutoLayoutRequest(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AutoLayoutRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of AutoLayoutRequest from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
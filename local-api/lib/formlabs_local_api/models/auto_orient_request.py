@@ -13,8 +13,10 @@
 
 
 from __future__ import annotations
-import json
 import pprint
+from formlabs_local_api.JsonBackend import model_json_backend
+from formlabs_local_api.ModelPacking import pack, unpack
+from formlabs_local_api.OneOfDispatcher import OneOfDispatcher
 from pydantic import BaseModel, ConfigDict, Field, StrictStr, ValidationError, field_validator
 from typing import Any, List, Optional
 from formlabs_local_api.models.default import Default
@@ -24,6 +26,10 @@ from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
 AUTOORIENTREQUEST_ONE_OF_SCHEMAS = ["Default", "DentalMode"]
+AUTOORIENTREQUEST_ONE_OF_DISPATCHER = OneOfDispatcher({
+    "oneof_schema_1_validator": Default,
+    "oneof_schema_2_validator": DentalMode,
+})
 
 class AutoOrientRequest(BaseModel):
     """
@@ -78,36 +84,30 @@ class AutoOrientRequest(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        """Returns the object represented by the dict, validated against the schema it fits best first"""
+        error_messages = []
+        for field, schema in AUTOORIENTREQUEST_ONE_OF_DISPATCHER.order(obj):
+            try:
+                return cls.model_construct(actual_instance=AUTOORIENTREQUEST_ONE_OF_DISPATCHER.validate(cls, field, schema, obj))
+            except (ValidationError, ValueError, TypeError, AttributeError) as e:
+                error_messages.append(str(e))
+
+        # no match
+        raise ValueError("No match found when deserializing the JSON string into AutoOrientRequest with oneOf schemas: Default, DentalMode. Details: " + ", ".join(error_messages))
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
-        instance = cls.model_construct()
-        error_messages = []
-        match = 0
+        return cls.from_dict(model_json_backend().loads(json_str))
 
-        # deserialize data into Default
-        try:
-            instance.actual_instance = Default.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into DentalMode
-        try:
-            instance.actual_instance = DentalMode.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
 
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into AutoOrientRequest with oneOf schemas: Default, DentalMode. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into AutoOrientRequest with oneOf schemas: Default, DentalMode. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Create an instance of AutoOrientRequest from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -117,7 +117,7 @@ class AutoOrientRequest(BaseModel):
         if hasattr(self.actual_instance, "to_json") and callable(self.actual_instance.to_json):
             return self.actual_instance.to_json()
         else:
-            return json.dumps(self.actual_instance)
+            return model_json_backend().dumps_str(self.actual_instance)
 
     def to_dict(self) -> Optional[Union[Dict[str, Any], Default, DentalMode]]:
         """Returns the dict representation of the actual instance"""
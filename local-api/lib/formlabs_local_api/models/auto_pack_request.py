@@ -15,7 +15,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_local_api.JsonBackend import model_json_backend
+from formlabs_local_api.ModelPacking import pack, unpack
 
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, ClassVar, Dict, List, Optional, Union
@@ -29,6 +30,10 @@ class AutoPackRequest(BaseModel):
     """ # noqa: E501
     model_spacing_mm: Optional[Union[Annotated[float, Field(strict=True, ge=0)], Annotated[int, Field(strict=True, ge=0)]]] = Field(default=None, description="The minimum spacing between models when packing")
     __properties: ClassVar[List[str]] = ["model_spacing_mm"]
+    read_only_fields: ClassVar[Set[str]] = set([
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -44,12 +49,21 @@ class AutoPackRequest(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AutoPackRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of AutoPackRequest from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
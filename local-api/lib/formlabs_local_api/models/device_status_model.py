@@ -13,8 +13,10 @@
 
 
 from __future__ import annotations
-import json
 import pprint
+from formlabs_local_api.JsonBackend import model_json_backend
+from formlabs_local_api.ModelPacking import pack, unpack
+from formlabs_local_api.OneOfDispatcher import OneOfDispatcher
 from pydantic import BaseModel, ConfigDict, Field, StrictStr, ValidationError, field_validator
 from typing import Any, List, Optional
 from formlabs_local_api.models.fleet_control_printer_group import FleetControlPrinterGroup
@@ -28,6 +30,14 @@ from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
 DEVICESTATUSMODEL_ONE_OF_SCHEMAS = ["FleetControlPrinterGroup", "Form2Printer", "Form3Printer", "Form4Printer", "Fuse11Printer", "GenericDevice"]
+DEVICESTATUSMODEL_ONE_OF_DISPATCHER = OneOfDispatcher({
+    "oneof_schema_1_validator": GenericDevice,
+    "oneof_schema_2_validator": FleetControlPrinterGroup,
+    "oneof_schema_3_validator": Form4Printer,
+    "oneof_schema_4_validator": Form3Printer,
+    "oneof_schema_5_validator": Fuse11Printer,
+    "oneof_schema_6_validator": Form2Printer,
+})
 
 class DeviceStatusModel(BaseModel):
     """
@@ -110,60 +120,30 @@ class DeviceStatusModel(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        """Returns the object represented by the dict, validated against the schema it fits best first"""
+        error_messages = []
+        for field, schema in DEVICESTATUSMODEL_ONE_OF_DISPATCHER.order(obj):
+            try:
+                return cls.model_construct(actual_instance=DEVICESTATUSMODEL_ONE_OF_DISPATCHER.validate(cls, field, schema, obj))
+            except (ValidationError, ValueError, TypeError, AttributeError) as e:
+                error_messages.append(str(e))
+
+        # no match
+        raise ValueError("No match found when deserializing the JSON string into DeviceStatusModel with oneOf schemas: FleetControlPrinterGroup, Form2Printer, Form3Printer, Form4Printer, Fuse11Printer, GenericDevice. Details: " + ", ".join(error_messages))
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
-        instance = cls.model_construct()
-        error_messages = []
-        match = 0
+        return cls.from_dict(model_json_backend().loads(json_str))
 
-        # deserialize data into GenericDevice
-        try:
-            instance.actual_instance = GenericDevice.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into FleetControlPrinterGroup
-        try:
-            instance.actual_instance = FleetControlPrinterGroup.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into Form4Printer
-        try:
-            instance.actual_instance = Form4Printer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into Form3Printer
-        try:
-            instance.actual_instance = Form3Printer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into Fuse11Printer
-        try:
-            instance.actual_instance = Fuse11Printer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into Form2Printer
-        try:
-            instance.actual_instance = Form2Printer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
 
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into DeviceStatusModel with oneOf schemas: FleetControlPrinterGroup, Form2Printer, Form3Printer, Form4Printer, Fuse11Printer, GenericDevice. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into DeviceStatusModel with oneOf schemas: FleetControlPrinterGroup, Form2Printer, Form3Printer, Form4Printer, Fuse11Printer, GenericDevice. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Create an instance of DeviceStatusModel from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -173,7 +153,7 @@ class DeviceStatusModel(BaseModel):
         if hasattr(self.actual_instance, "to_json") and callable(self.actual_instance.to_json):
             return self.actual_instance.to_json()
         else:
-            return json.dumps(self.actual_instance)
+            return model_json_backend().dumps_str(self.actual_instance)
 
     def to_dict(self) -> Optional[Union[Dict[str, Any], FleetControlPrinterGroup, Form2Printer, Form3Printer, Form4Printer, Fuse11Printer, GenericDevice]]:
         """Returns the dict representation of the actual instance"""
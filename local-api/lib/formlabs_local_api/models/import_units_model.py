@@ -13,8 +13,8 @@
 
 
 from __future__ import annotations
-import json
 from enum import Enum
+from formlabs_local_api.JsonBackend import model_json_backend
 from typing_extensions import Self
 
 
@@ -33,6 +33,6 @@ class ImportUnitsModel(str, Enum):
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of ImportUnitsModel from a JSON string"""
-        return cls(json.loads(json_str))
+        return cls(model_json_backend().loads(json_str))
 
 
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""\
+Minimal stand-in for the PreFormServer executable used by the handwritten tests.
+
+It accepts the same `--port` argument, answers the API version endpoint, keeps
+a single cached scene and prints "READY FOR INPUT" once it is listening, like
+the real server does.
+Startup misbehaviour can be simulated through environment variables:
+
+- FAKE_PREFORM_STDERR_LINES: number of lines written to stderr before listening
+- FAKE_PREFORM_NO_READY_LINE: never print the "READY FOR INPUT" marker
+- FAKE_PREFORM_HANG: never start listening
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+EMPTY_SCENE = {"models": [], "layer_count": 0}
+
+
+class Handler(BaseHTTPRequestHandler):
+    scene = dict(EMPTY_SCENE)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/":
+            self._send_json(200, {"version": "3.40.0"})
+        elif self.path == "/scene/":
+            self._send_json(200, Handler.scene)
+        else:
+            self._send_json(404, {"error": {"code": "NOT_FOUND", "message": self.path}})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+        if self.path == "/scene/":
+            Handler.scene = dict(EMPTY_SCENE, scene_settings=body)
+            self._send_json(200, Handler.scene)
+        else:
+            self._send_json(404, {"error": {"code": "NOT_FOUND", "message": self.path}})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, required=True)
+    args = parser.parse_args()
+
+    for i in range(int(os.environ.get("FAKE_PREFORM_STDERR_LINES", "0"))):
+        sys.stderr.write(f"warning {i}: something noisy happened\n")
+    sys.stderr.flush()
+    if os.environ.get("FAKE_PREFORM_HANG"):
+        while True:
+            time.sleep(1)
+
+    try:
+        server = ThreadingHTTPServer(("localhost", args.port), Handler)
+    except OSError:
+        print("address is already in use", flush=True)
+        sys.exit(1)
+    if not os.environ.get("FAKE_PREFORM_NO_READY_LINE"):
+        print("READY FOR INPUT", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# coding: utf-8
+
+import json
+import unittest
+
+import urllib3
+
+from formlabs_local_api import ApiClient, models, rest
+from formlabs_local_api.exceptions import NotFoundException
+
+
+def make_response(body, status=200, content_type="application/json"):
+    response = rest.RESTResponse(urllib3.HTTPResponse(
+        body=body, status=status, headers={"Content-Type": content_type}, preload_content=True,
+    ))
+    response.read()
+    return response
+
+
+class TestApiClient(unittest.TestCase):
+    """ApiClient response decoding unit test"""
+
+    def setUp(self) -> None:
+        self.client = ApiClient()
+
+    def test_json_bytes_are_deserialized(self) -> None:
+        body = json.dumps({"models": [{"id": "a", "name": "päärt"}], "layer_count": 3}).encode("utf-8")
+        scene = self.client.response_deserialize(make_response(body), {"200": "SceneModel"}).data
+        self.assertEqual(scene.layer_count, 3)
+        self.assertEqual(scene.models[0].name, "päärt")
+
+    def test_other_charsets_are_decoded_first(self) -> None:
+        body = json.dumps({"version": "3.40.0 é"}, ensure_ascii=False).encode("latin-1")
+        response = make_response(body, content_type="application/json; charset=latin-1")
+        info = self.client.response_deserialize(response, {"200": "GetApiVersion200Response"}).data
+        self.assertEqual(info.version, "3.40.0 é")
+
+    def test_error_body_is_decoded(self) -> None:
+        response = make_response(b'{"error": {"code": "NOT_FOUND"}}', status=404)
+        with self.assertRaises(NotFoundException) as raised:
+            self.client.response_deserialize(response, {"200": "SceneModel"})
+        self.assertEqual(raised.exception.body, '{"error": {"code": "NOT_FOUND"}}')
+
+    def test_deserialize_plans_are_reused(self) -> None:
+        body = b'[{"version": "3.40.0"}, null]'
+        first = self.client.response_deserialize(make_response(body), {"200": "List[GetApiVersion200Response]"}).data
+        plan = ApiClient._deserialize_plans["List[GetApiVersion200Response]"]
+        second = ApiClient().response_deserialize(make_response(body), {"200": "List[GetApiVersion200Response]"}).data
+        self.assertIs(ApiClient._deserialize_plans["List[GetApiVersion200Response]"], plan)
+        self.assertEqual(first, second)
+        self.assertEqual(first[0].version, "3.40.0")
+        self.assertIsNone(first[1])
+
+    def test_nested_container_types(self) -> None:
+        response = make_response(b'{"a": [1, 2], "b": null, "c": ["3"]}')
+        data = self.client.response_deserialize(response, {"200": "Dict[str, List[int]]"}).data
+        self.assertEqual(data, {"a": [1, 2], "b": None, "c": [3]})
+
+    def test_models_serialize_like_to_dict(self) -> None:
+        request = models.AutoSupportRequest(models=models.ModelsSelectionModel(["a", "b"]), density=1.0)
+        self.assertEqual(self.client.sanitize_for_serialization(request), {"models": ["a", "b"], "density": 1.0})
+        update = models.UpdateModelRequest(name="part", position=models.ScenePositionModel(x=1.0, y=2.0, z=0.0), units="MILLIMETERS")
+        self.assertEqual(
+            self.client.sanitize_for_serialization(update),
+            {"name": "part", "position": {"x": 1.0, "y": 2.0, "z": 0.0}, "units": "MILLIMETERS"},
+        )
+        scene_type = models.SceneTypeModel(machine_type="FORM-4-0", material_code="FLGPGR05", layer_thickness_mm=models.SceneTypeModelLayerThicknessMm("ADAPTIVE"))
+        self.assertEqual(self.client.sanitize_for_serialization(scene_type)["layer_thickness_mm"], "ADAPTIVE")
+
+
+if __name__ == '__main__':
+    unittest.main()
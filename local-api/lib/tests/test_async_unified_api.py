@@ -0,0 +1,55 @@
+# coding: utf-8
+
+import asyncio
+import inspect
+import os
+import sys
+import unittest
+
+from formlabs_local_api import UnifiedApi
+from formlabs_local_api.AsyncUnifiedApi import AsyncUnifiedApi
+from formlabs_local_api.PreFormApi import PreFormApi
+from formlabs_local_api.models.scene_type_model import SceneTypeModel
+from formlabs_local_api.models.scene_type_model_layer_thickness_mm import SceneTypeModelLayerThicknessMm
+
+FAKE_PREFORM_SERVER = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fake_preform_server.py")
+
+
+class TestAsyncUnifiedApi(unittest.TestCase):
+    """AsyncUnifiedApi unit test"""
+
+    def test_every_operation_is_awaitable(self) -> None:
+        for name in ("auto_support", "get_scene", "save_form_file", "get_devices", "call_print", "create_scene_with_http_info"):
+            self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncUnifiedApi, name)), name)
+            self.assertEqual(getattr(AsyncUnifiedApi, name).__doc__, getattr(UnifiedApi, name).__doc__)
+        self.assertFalse(hasattr(AsyncUnifiedApi, "get_scene_without_preload_content"))
+
+
+@unittest.skipIf(sys.platform == "win32", "fake PreFormServer relies on a shebang line")
+class TestAsyncPreFormServers(unittest.IsolatedAsyncioTestCase):
+    """AsyncUnifiedApi against several servers unit test"""
+
+    async def test_one_loop_drives_several_servers(self) -> None:
+        scene_types = [
+            SceneTypeModel(
+                machine_type="FORM-4-0",
+                material_code=material_code,
+                layer_thickness_mm=SceneTypeModelLayerThicknessMm("0.1"),
+                print_setting="DEFAULT",
+            )
+            for material_code in ("FLGPGR05", "FLGPCL05")
+        ]
+        async with PreFormApi.start_preform_server_async(FAKE_PREFORM_SERVER, None) as first, \
+                PreFormApi.start_preform_server_async(FAKE_PREFORM_SERVER, None) as second:
+            await asyncio.gather(
+                first.async_api.create_scene(scene_types[0]),
+                second.async_api.create_scene(scene_types[1]),
+            )
+            scenes = await asyncio.gather(first.async_api.get_scene(), second.async_api.get_scene())
+            self.assertEqual([scene.scene_settings.material_code for scene in scenes], ["FLGPGR05", "FLGPCL05"])
+            process = first.server_process
+        self.assertIsNotNone(process.poll())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+# coding: utf-8
+
+import os
+import sys
+import unittest
+
+from formlabs_local_api.Instrumentation import HistogramCollector
+from formlabs_local_api.PreFormApi import PreFormApi, _find_free_port
+from formlabs_local_api.models.scene_type_model import SceneTypeModel
+from formlabs_local_api.models.scene_type_model_layer_thickness_mm import SceneTypeModelLayerThicknessMm
+
+FAKE_PREFORM_SERVER = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fake_preform_server.py")
+
+
+@unittest.skipIf(sys.platform == "win32", "fake PreFormServer relies on a shebang line")
+class TestInstrumentation(unittest.TestCase):
+    """ApiClient instrumentation against a fake PreFormServer unit test"""
+
+    def test_operations_are_collected(self) -> None:
+        collector = HistogramCollector()
+        with PreFormApi.start_preform_server(FAKE_PREFORM_SERVER, _find_free_port()) as preform:
+            preform.client.instrumentation = collector
+            preform.api.create_scene(SceneTypeModel(
+                machine_type="FORM-4-0",
+                material_code="FLGPGR05",
+                layer_thickness_mm=SceneTypeModelLayerThicknessMm("0.1"),
+                print_setting="DEFAULT",
+            ))
+            preform.api.get_scene()
+            preform.api.get_scene()
+        self.assertEqual(collector.histogram("wait_seconds", "get_scene").count, 2)
+        self.assertGreater(collector.histogram("request_bytes", "create_scene").sum, 50)
+        self.assertEqual(collector.histogram("request_bytes", "get_scene").sum, 0)
+        self.assertIn('formlabs_api_deserialize_seconds_count{operation="create_scene",status="200"} 1', collector.to_prometheus_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+import math
+import unittest
+
+import urllib3
+
+from formlabs_local_api import ApiClient, Configuration, ModifyingASceneApi, rest
+from formlabs_local_api.JsonBackend import JsonBackend, OrjsonBackend, StdlibJsonBackend, get_json_backend
+from formlabs_local_api.models import ScenePositionModel, UpdateModelRequest
+
+
+class RecordingBackend(StdlibJsonBackend):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj).encode("utf-8")
+
+    def loads(self, document):
+        self.calls.append("loads")
+        return super().loads(document)
+
+
+class RecordingPoolManager:
+    """Answers every request with an empty JSON object and records the request bodies"""
+
+    def __init__(self) -> None:
+        self.bodies = []
+
+    def request(self, method, url, body=None, **kwargs):
+        self.bodies.append(body)
+        return urllib3.HTTPResponse(body=b"{}", status=200, headers={"Content-Type": "application/json"}, preload_content=False)
+
+
+class TestJsonBackend(unittest.TestCase):
+    """JsonBackend unit test"""
+
+    def setUp(self) -> None:
+        self.default_configuration = Configuration._default
+
+    def tearDown(self) -> None:
+        Configuration.set_default(self.default_configuration)
+
+    def test_get_json_backend(self) -> None:
+        self.assertIs(type(get_json_backend()), JsonBackend)
+        self.assertIs(get_json_backend("default"), get_json_backend(None))
+        self.assertIsInstance(get_json_backend("json"), StdlibJsonBackend)
+        self.assertIsInstance(get_json_backend("orjson"), OrjsonBackend)
+        backend = RecordingBackend()
+        self.assertIs(get_json_backend(backend), backend)
+        with self.assertRaisesRegex(ValueError, "Unknown JSON backend 'simplejson'"):
+            get_json_backend("simplejson")
+
+    def test_orjson_falls_back_to_json(self) -> None:
+        backend = get_json_backend("orjson")
+        self.assertEqual(backend.dumps({"a": [1.5, None]}), b'{"a":[1.5,null]}')
+        self.assertEqual(backend.dumps({1: "a"}), '{"1": "a"}')
+        self.assertTrue(math.isnan(backend.loads(b'{"value": NaN}')["value"]))
+
+    def test_models_use_the_backend_of_the_default_configuration(self) -> None:
+        position = ScenePositionModel(x=1.0, y=2.5, z=0.0)
+        self.assertEqual(position.to_json(), '{"x": 1.0, "y": 2.5, "z": 0.0}')
+        configuration = Configuration()
+        configuration.json_backend = "orjson"
+        Configuration.set_default(configuration)
+        self.assertEqual(position.to_json(), '{"x":1.0,"y":2.5,"z":0.0}')
+        self.assertEqual(ScenePositionModel.from_json(position.to_json()), position)
+
+    def test_requests_and_responses_use_the_backend_of_the_configuration(self) -> None:
+        backend = RecordingBackend()
+        configuration = Configuration()
+        configuration.json_backend = backend
+        client = ApiClient(configuration)
+        client.rest_client.pool_manager = RecordingPoolManager()
+        ModifyingASceneApi(client).update_model("model-1", UpdateModelRequest(scale=2.0))
+        self.assertEqual(client.rest_client.pool_manager.bodies, [b'{"scale": 2.0}'])
+        response = rest.RESTResponse(urllib3.HTTPResponse(
+            body=b'{"version": "3.40.0"}', status=200, headers={"Content-Type": "application/json"}, preload_content=True,
+        ))
+        response.read()
+        client.response_deserialize(response, {"200": "GetApiVersion200Response"})
+        self.assertEqual(backend.calls, ["dumps", "loads"])
+
+
+if __name__ == '__main__':
+    unittest.main()
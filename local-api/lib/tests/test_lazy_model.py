@@ -0,0 +1,54 @@
+# coding: utf-8
+
+import json
+import unittest
+
+import urllib3
+
+from formlabs_local_api import ApiClient, rest
+from formlabs_local_api.LazyModel import is_materialized, lazy_from_dict
+from formlabs_local_api.models import ImportModelRequest, ModelProperties, SaveScreenshotRequest, SceneModel
+
+
+def make_scene(model_count):
+    return {
+        "models": [
+            {"id": f"model-{index}", "name": f"part_{index}", "position": {"x": index, "y": 0.0, "z": 0.0}, "scale": 1.0}
+            for index in range(model_count)
+        ],
+        "layer_count": 1000,
+    }
+
+
+class TestLazyModel(unittest.TestCase):
+    """Lazy model deserialization unit test"""
+
+    def test_models_are_validated_on_first_access(self) -> None:
+        scene = lazy_from_dict(SceneModel, make_scene(3))
+        self.assertEqual(scene.layer_count, 1000)
+        self.assertEqual([is_materialized(model) for model in scene.models], [False, False, False])
+        self.assertIsInstance(scene.models[2], ModelProperties)
+        self.assertEqual(scene.models[2].position.x, 2)
+        self.assertEqual([is_materialized(model) for model in scene.models], [False, False, True])
+        self.assertEqual(scene.to_dict(), SceneModel.from_dict(make_scene(3)).to_dict())
+
+    def test_missing_and_null_fields_get_their_defaults(self) -> None:
+        for klass, obj in ((ImportModelRequest, {"file": "part.stl", "units": None}), (SaveScreenshotRequest, {"file": "shot.png"})):
+            self.assertEqual(lazy_from_dict(klass, obj), klass.from_dict(obj))
+        self.assertEqual(lazy_from_dict(ImportModelRequest, {"file": "part.stl"}).scale, 1)
+
+    def test_api_client_lazy_models(self) -> None:
+        client = ApiClient()
+        client.lazy_models = True
+        response = rest.RESTResponse(urllib3.HTTPResponse(
+            body=json.dumps(make_scene(2)).encode("utf-8"), status=200,
+            headers={"Content-Type": "application/json"}, preload_content=True,
+        ))
+        response.read()
+        scene = client.response_deserialize(response, {"200": "SceneModel"}).data
+        self.assertFalse(any(is_materialized(model) for model in scene.models))
+        self.assertEqual([model.name for model in scene.models], ["part_0", "part_1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
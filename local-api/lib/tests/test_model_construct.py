@@ -0,0 +1,42 @@
+# coding: utf-8
+
+import unittest
+
+from formlabs_local_api.ModelConstruct import construct_from_dict
+from formlabs_local_api.models import GetDevices200Response, ImportModelRequest, ImportUnitsModel, ReplaceModelRequest, SceneModel, UnitsModel
+
+
+class TestModelConstruct(unittest.TestCase):
+    """Construction of models from trusted data unit test"""
+
+    def test_constructed_models_equal_validated_models(self) -> None:
+        scene = {
+            "models": [
+                {"id": f"model-{index}", "name": f"part_{index}", "position": {"x": index, "y": 0.0, "z": 0.0}, "units": "MILLIMETERS"}
+                for index in range(3)
+            ],
+            "scene_settings": {"machine_type": "FORM-4-0", "material_code": "FLGPGR05", "layer_thickness_mm": 0.1, "print_setting": "DEFAULT"},
+            "layer_count": 1000,
+        }
+        constructed = construct_from_dict(SceneModel, scene)
+        self.assertEqual(constructed, SceneModel.from_dict(scene))
+        self.assertIs(constructed.models[0].units, UnitsModel.MILLIMETERS)
+
+    def test_missing_and_null_fields_get_their_defaults(self) -> None:
+        for klass, obj in ((ImportModelRequest, {"file": "part.stl", "units": None}), (ReplaceModelRequest, {"file": "part.stl"})):
+            self.assertEqual(construct_from_dict(klass, obj), klass.from_dict(obj))
+        constructed = construct_from_dict(ImportModelRequest, {"file": "part.stl"})
+        self.assertEqual(constructed.scale, 1)
+        self.assertIs(constructed.units, ImportUnitsModel.DETECTED)
+
+    def test_oneof_values_are_validated(self) -> None:
+        devices = {"devices": [{
+            "id": "Form4-X", "product_name": "Form 4", "status": "IDLE", "is_remote_print_enabled": True, "connection_type": "WIFI",
+            "ip_address": "192.168.0.2", "firmware_version": "1.0", "estimated_print_time_remaining_ms": 0, "is_connected": True,
+        }]}
+        constructed = construct_from_dict(GetDevices200Response, devices)
+        self.assertEqual(constructed, GetDevices200Response.from_dict(devices))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# coding: utf-8
+
+import pickle
+import unittest
+
+from formlabs_local_api.ModelPacking import pack, pack_models, unpack, unpack_models
+from formlabs_local_api.models import DeviceStatusModel, GetDevices200Response, ModelProperties, SceneModel, ScenePositionModel, UnitsModel
+
+
+def make_scene(model_count):
+    return {
+        "models": [
+            {"id": f"model-{index}", "name": f"part_{index}", "position": {"x": index, "y": 0.0, "z": 0.0}, "units": "MILLIMETERS"}
+            for index in range(model_count)
+        ],
+        "scene_settings": {"machine_type": "FORM-4-0", "material_code": "FLGPGR05", "layer_thickness_mm": 0.1, "print_setting": "DEFAULT"},
+        "layer_count": 1000,
+    }
+
+
+class TestModelPacking(unittest.TestCase):
+    """ModelPacking unit test"""
+
+    def test_round_trip(self) -> None:
+        scene = SceneModel.from_dict(make_scene(3))
+        data = scene.to_bytes()
+        unpacked = SceneModel.from_bytes(data)
+        self.assertEqual(unpacked, scene)
+        self.assertEqual(unpacked.to_dict(), scene.to_dict())
+        self.assertIs(unpacked.models[0].units, UnitsModel.MILLIMETERS)
+        self.assertLess(len(data), len(pickle.dumps(scene)) * 2 / 3)
+
+    def test_fields_set_are_kept(self) -> None:
+        position = ScenePositionModel(x=1.0, y=2.0, z=0.0)
+        properties = ModelProperties(id="model-1", position=position)
+        unpacked = unpack(pack(properties))
+        self.assertEqual(unpacked.model_fields_set, {"id", "position"})
+        self.assertEqual(unpacked.model_dump(exclude_unset=True), properties.model_dump(exclude_unset=True))
+
+    def test_lists(self) -> None:
+        models = SceneModel.from_dict(make_scene(5)).models
+        self.assertEqual(unpack_models(pack_models(models), ModelProperties), models)
+
+    def test_one_of_models(self) -> None:
+        devices = GetDevices200Response.from_dict({"devices": [{
+            "id": "Form4-X", "product_name": "Form 4", "status": "IDLE", "is_remote_print_enabled": True, "connection_type": "WIFI",
+            "ip_address": "192.168.0.2", "firmware_version": "1.0", "estimated_print_time_remaining_ms": 0, "is_connected": True,
+        }]})
+        unpacked = unpack(pack(devices), GetDevices200Response)
+        self.assertEqual(unpacked, devices)
+        self.assertIsInstance(unpacked.devices[0], DeviceStatusModel)
+        self.assertIs(type(unpacked.devices[0].actual_instance), type(devices.devices[0].actual_instance))
+
+    def test_other_classes_are_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "ScenePositionModel was packed, expected SceneModel"):
+            SceneModel.from_bytes(ScenePositionModel(x=1.0, y=2.0, z=0.0).to_bytes())
+        with self.assertRaisesRegex(ValueError, "Not packed models"):
+            unpack(pickle.dumps(ScenePositionModel(x=1.0, y=2.0, z=0.0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
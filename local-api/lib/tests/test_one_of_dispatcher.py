@@ -0,0 +1,66 @@
+# coding: utf-8
+
+import unittest
+
+from formlabs_local_api import GetDevices200Response
+from formlabs_local_api.models.auto_orient_request import AutoOrientRequest
+from formlabs_local_api.models.dental_mode import DentalMode
+from formlabs_local_api.models.device_status_model import DeviceStatusModel
+from formlabs_local_api.models.form2_printer import Form2Printer
+from formlabs_local_api.models.form4_printer import Form4Printer
+from formlabs_local_api.models.generic_device import GenericDevice
+from formlabs_local_api.models.models_selection_model import ModelsSelectionModel
+from formlabs_local_api.models.scene_type_model_layer_thickness_mm import SceneTypeModelLayerThicknessMm
+
+GENERIC_DEVICE = {
+    "id": "Form4-Alpha",
+    "product_name": "Form 4",
+    "status": "IDLE",
+    "is_connected": True,
+    "connection_type": "WIFI",
+    "ip_address": "192.168.1.10",
+    "firmware_version": "1.2.3",
+}
+FORM4_PRINTER = dict(
+    GENERIC_DEVICE,
+    is_remote_print_enabled=True,
+    estimated_print_time_remaining_ms=0,
+    tank_id="TANK-1",
+    tank_material_code="FLGPGR05",
+    cartridge_data={"front": {"cartridgeMaterialCode": "FLGPGR05", "cartridgeEstimatedVolumeDispensed_mL": 10.0, "cartridgeOriginalVolume_mL": 1000.0}},
+    ready_to_print_now=True,
+)
+
+
+class TestOneOfDispatcher(unittest.TestCase):
+    """OneOfDispatcher unit test"""
+
+    def test_object_goes_to_the_schema_with_its_keys(self) -> None:
+        self.assertIsInstance(DeviceStatusModel.from_dict(GENERIC_DEVICE).actual_instance, GenericDevice)
+        self.assertIsInstance(DeviceStatusModel.from_dict(FORM4_PRINTER).actual_instance, Form4Printer)
+        form2 = {key: value for key, value in FORM4_PRINTER.items() if key not in ("is_remote_print_enabled", "ready_to_print_now")}
+        self.assertIsInstance(DeviceStatusModel.from_dict(form2).actual_instance, Form2Printer)
+        self.assertIsInstance(AutoOrientRequest.from_dict({"models": "ALL", "mode": "DENTAL"}).actual_instance, DentalMode)
+
+    def test_unknown_keys_go_to_the_closest_schema(self) -> None:
+        device = DeviceStatusModel.from_dict(dict(FORM4_PRINTER, added_in_a_later_release=1))
+        self.assertIsInstance(device.actual_instance, Form4Printer)
+
+    def test_primitives_go_to_the_schema_of_their_type(self) -> None:
+        self.assertEqual(SceneTypeModelLayerThicknessMm.from_json("0.1").actual_instance, 0.1)
+        self.assertEqual(SceneTypeModelLayerThicknessMm.from_json('"ADAPTIVE"').actual_instance, "ADAPTIVE")
+        self.assertEqual(ModelsSelectionModel.from_dict(["a", "b"]).actual_instance, ["a", "b"])
+
+    def test_no_match_lists_every_schema(self) -> None:
+        with self.assertRaises(ValueError) as raised:
+            DeviceStatusModel.from_dict({"id": "Form4-Alpha"})
+        self.assertIn("No match found when deserializing the JSON string into DeviceStatusModel", str(raised.exception))
+        self.assertIn("GenericDevice", str(raised.exception))
+
+    def test_device_list_round_trips(self) -> None:
+        response = GetDevices200Response.from_dict({"count": 2, "devices": [GENERIC_DEVICE, FORM4_PRINTER]})
+        self.assertEqual([device.to_dict() for device in response.devices], [GENERIC_DEVICE, FORM4_PRINTER])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# coding: utf-8
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+from formlabs_local_api.PreFormApi import PreFormApi, PreFormServerStartupError, _find_free_port, _is_compatible_version
+
+FAKE_PREFORM_SERVER = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fake_preform_server.py")
+
+
+class TestPreFormApiVersion(unittest.TestCase):
+    """PreFormApi version compatibility unit test"""
+
+    def test_is_compatible_version(self) -> None:
+        self.assertTrue(_is_compatible_version("3.40.0"))
+        self.assertTrue(_is_compatible_version("3.41.2-rc1"))
+        self.assertFalse(_is_compatible_version("3.39.9"))
+        self.assertFalse(_is_compatible_version("4.0.0"))
+        self.assertFalse(_is_compatible_version(None))
+
+
+@unittest.skipIf(sys.platform == "win32", "fake PreFormServer relies on a shebang line")
+class TestPreFormApiServer(unittest.TestCase):
+    """PreFormApi server lifecycle unit test"""
+
+    def setUp(self) -> None:
+        self.port = _find_free_port()
+
+    def test_start_preform_server_if_needed_starts_and_stops(self) -> None:
+        with PreFormApi.start_preform_server_if_needed(FAKE_PREFORM_SERVER, self.port) as preform:
+            process = preform.server_process
+            self.assertIsNotNone(process)
+            self.assertGreater(preform.startup_seconds, 0)
+            self.assertEqual(preform.probe_api_version(), "3.40.0")
+        self.assertIsNotNone(process.poll())
+
+    def test_stop_closes_output_pipes(self) -> None:
+        preform = PreFormApi.start_preform_sync(FAKE_PREFORM_SERVER, self.port)
+        process, readers = preform.server_process, preform.output_readers
+        preform.stop_preform_server()
+        self.assertTrue(process.stdout.closed)
+        self.assertTrue(process.stderr.closed)
+        self.assertFalse(any(reader.is_alive() for reader in readers))
+        self.assertEqual(preform.output_readers, ())
+
+    def test_start_preform_server_if_needed_attaches(self) -> None:
+        running = PreFormApi.start_preform_sync(FAKE_PREFORM_SERVER, self.port)
+        try:
+            with PreFormApi.start_preform_server_if_needed(FAKE_PREFORM_SERVER, self.port) as preform:
+                self.assertIsNone(preform.server_process)
+                self.assertIsNotNone(preform.startup_seconds)
+                self.assertEqual(preform.api.get_api_version().version, "3.40.0")
+            self.assertIsNone(running.server_process.poll())
+        finally:
+            running.stop_preform_server()
+
+    def test_attach_preform_server_without_server(self) -> None:
+        self.assertIsNone(PreFormApi.attach_preform_server(self.port))
+
+    def test_ready_from_http_probe_without_marker(self) -> None:
+        with mock.patch.dict(os.environ, {"FAKE_PREFORM_NO_READY_LINE": "1"}):
+            preform = PreFormApi.start_preform_sync(FAKE_PREFORM_SERVER, self.port, startup_timeout=10)
+        try:
+            self.assertEqual(preform.probe_api_version(), "3.40.0")
+        finally:
+            preform.stop_preform_server()
+
+    def test_stderr_is_drained_into_ring_buffer(self) -> None:
+        # Far more than a pipe buffer holds, the server would stall if nobody read stderr
+        with mock.patch.dict(os.environ, {"FAKE_PREFORM_STDERR_LINES": "20000"}):
+            preform = PreFormApi.start_preform_sync(FAKE_PREFORM_SERVER, self.port, startup_timeout=10)
+        try:
+            self.assertEqual(preform.probe_api_version(), "3.40.0")
+            self.assertLessEqual(len(preform.stderr_lines), PreFormApi.OUTPUT_BUFFER_LINES)
+        finally:
+            preform.stop_preform_server()
+
+    def test_startup_timeout_keeps_output(self) -> None:
+        with mock.patch.dict(os.environ, {"FAKE_PREFORM_HANG": "1", "FAKE_PREFORM_STDERR_LINES": "3"}):
+            with self.assertRaises(PreFormServerStartupError) as context:
+                PreFormApi.start_preform_sync(FAKE_PREFORM_SERVER, self.port, startup_timeout=1)
+        self.assertFalse(context.exception.port_in_use)
+        self.assertEqual(context.exception.stderr_lines[-1], "warning 2: something noisy happened\n")
+
+    def test_port_in_use(self) -> None:
+        running = PreFormApi.start_preform_sync(FAKE_PREFORM_SERVER, self.port)
+        try:
+            with self.assertRaises(PreFormServerStartupError) as context:
+                PreFormApi.start_preform_sync(FAKE_PREFORM_SERVER, self.port)
+            self.assertTrue(context.exception.port_in_use)
+        finally:
+            running.stop_preform_server()
+
+
+if __name__ == '__main__':
+    unittest.main()
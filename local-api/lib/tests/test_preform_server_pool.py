@@ -0,0 +1,87 @@
+# coding: utf-8
+
+import os
+import sys
+import unittest
+
+from formlabs_local_api.PreFormServerPool import PreFormServerPool
+from formlabs_local_api.PreFormServerRecyclePolicy import PreFormServerRecyclePolicy
+
+FAKE_PREFORM_SERVER = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fake_preform_server.py")
+
+
+@unittest.skipIf(sys.platform == "win32", "fake PreFormServer relies on a shebang line")
+class TestPreFormServerPool(unittest.TestCase):
+    """PreFormServerPool unit test"""
+
+    def setUp(self) -> None:
+        self.pool = PreFormServerPool(size=2, pathToPreformServer=FAKE_PREFORM_SERVER)
+        self.pool.start()
+
+    def tearDown(self) -> None:
+        self.pool.shutdown()
+
+    def test_servers_use_distinct_ports(self) -> None:
+        with self.pool.lease() as first, self.pool.lease() as second:
+            self.assertNotEqual(first.api_client.configuration.host, second.api_client.configuration.host)
+            self.assertEqual(first.get_api_version().version, "3.40.0")
+            self.assertEqual(second.get_api_version().version, "3.40.0")
+
+    def test_lease_times_out_when_exhausted(self) -> None:
+        with self.pool.lease(), self.pool.lease():
+            with self.assertRaises(TimeoutError):
+                with self.pool.lease(timeout=0.1):
+                    pass
+
+    def test_dead_server_is_replaced(self) -> None:
+        with self.pool.lease() as api:
+            dead_host = api.api_client.configuration.host
+        for preform in list(self.pool._servers):
+            if preform.api.api_client.configuration.host == dead_host:
+                preform.server_process.kill()
+                preform.server_process.wait()
+        hosts = set()
+        with self.pool.lease() as first, self.pool.lease() as second:
+            for api in (first, second):
+                self.assertEqual(api.get_api_version().version, "3.40.0")
+                hosts.add(api.api_client.configuration.host)
+        self.assertNotIn(dead_host, hosts)
+        self.assertEqual(len(self.pool._servers), 2)
+
+    def test_slot_is_kept_when_replacement_fails_to_start(self) -> None:
+        for preform in self.pool._servers:
+            preform.server_process.kill()
+            preform.server_process.wait()
+        self.pool.pathToPreformServer = FAKE_PREFORM_SERVER + ".missing"
+        for _ in range(2):
+            with self.assertRaises(FileNotFoundError):
+                with self.pool.lease(timeout=1):
+                    pass
+        self.pool.pathToPreformServer = FAKE_PREFORM_SERVER
+        with self.pool.lease(timeout=10) as first, self.pool.lease(timeout=10) as second:
+            self.assertEqual(first.get_api_version().version, "3.40.0")
+            self.assertEqual(second.get_api_version().version, "3.40.0")
+        self.assertEqual(len(self.pool._servers), 2)
+
+    def test_server_is_recycled_when_lease_ends(self) -> None:
+        self.pool.recycle_policy = PreFormServerRecyclePolicy(max_operations=1)
+        for preform in self.pool._servers:
+            preform.recycle_policy = self.pool.recycle_policy
+        with self.pool.lease() as api:
+            served_by = api.api_client.configuration.host
+            api.get_api_version()
+        self.assertNotIn(served_by, [preform.api.api_client.configuration.host for preform in self.pool._servers])
+        self.assertEqual(len(self.pool._servers), 2)
+
+    def test_shutdown_stops_servers(self) -> None:
+        processes = [preform.server_process for preform in self.pool._servers]
+        self.pool.shutdown()
+        for process in processes:
+            self.assertIsNotNone(process.poll())
+        with self.assertRaises(RuntimeError):
+            with self.pool.lease():
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
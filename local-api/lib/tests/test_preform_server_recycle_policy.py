@@ -0,0 +1,79 @@
+# coding: utf-8
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+from formlabs_local_api.PreFormApi import _start_preform_on_free_port
+from formlabs_local_api.PreFormServerRecyclePolicy import PreFormServerRecyclePolicy, PreFormServerStats, _process_rss_bytes
+
+FAKE_PREFORM_SERVER = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fake_preform_server.py")
+
+
+class TestPreFormServerRecyclePolicy(unittest.TestCase):
+    """PreFormServerRecyclePolicy unit test"""
+
+    def make_preform(self, latencies, window=20):
+        stats = PreFormServerStats(window=window)
+        for seconds in latencies:
+            stats.record(seconds)
+        return SimpleNamespace(stats=stats, server_process=None)
+
+    def test_p95_needs_full_window(self) -> None:
+        stats = self.make_preform([0.01] * 19).stats
+        self.assertIsNone(stats.p95())
+        stats.record(0.5)
+        self.assertEqual(stats.p95(), 0.01)
+        self.assertEqual(stats.baseline_p95, 0.01)
+
+    def test_max_operations(self) -> None:
+        policy = PreFormServerRecyclePolicy(max_operations=5)
+        self.assertIsNone(policy.recycle_reason(self.make_preform([0.01] * 4)))
+        self.assertIsNotNone(policy.recycle_reason(self.make_preform([0.01] * 5)))
+
+    def test_latency_drift(self) -> None:
+        policy = PreFormServerRecyclePolicy(max_latency_drift=2.0)
+        steady = self.make_preform([0.01] * 40)
+        self.assertIsNone(policy.recycle_reason(steady))
+        drifted = self.make_preform([0.01] * 20 + [0.05] * 20)
+        self.assertIn("p95 latency drifted", policy.recycle_reason(drifted))
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "reads /proc without psutil")
+    def test_process_rss_bytes(self) -> None:
+        self.assertGreater(_process_rss_bytes(os.getpid()), 0)
+
+
+@unittest.skipIf(sys.platform == "win32", "fake PreFormServer relies on a shebang line")
+class TestPreFormApiRecycle(unittest.TestCase):
+    """PreFormApi recycling unit test"""
+
+    def setUp(self) -> None:
+        self.preform = _start_preform_on_free_port(FAKE_PREFORM_SERVER)
+        self.preform.recycle_policy = PreFormServerRecyclePolicy(max_operations=3)
+
+    def tearDown(self) -> None:
+        self.preform.stop_preform_server()
+
+    def test_recycle_after_max_operations(self) -> None:
+        api = self.preform.api
+        old_process = self.preform.server_process
+        for _ in range(2):
+            api.get_scene()
+        self.assertIsNone(self.preform.recycle_if_needed())
+        api.get_scene()
+        self.assertIsNotNone(self.preform.recycle_if_needed())
+
+        self.assertIsNotNone(old_process.poll())
+        self.assertIsNot(self.preform.server_process, old_process)
+        self.assertEqual(self.preform.stats.operations, 0)
+        self.assertEqual(api.get_scene().layer_count, 0)
+        self.assertEqual(self.preform.stats.operations, 1)
+
+    def test_health_checks_are_not_operations(self) -> None:
+        self.assertTrue(self.preform.is_running())
+        self.assertEqual(self.preform.stats.operations, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
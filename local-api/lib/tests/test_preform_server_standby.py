@@ -0,0 +1,80 @@
+# coding: utf-8
+
+import os
+import sys
+import time
+import unittest
+
+from formlabs_local_api.PreFormServerStandby import PreFormServerStandby
+from formlabs_local_api.models.scene_type_model import SceneTypeModel
+from formlabs_local_api.models.scene_type_model_layer_thickness_mm import SceneTypeModelLayerThicknessMm
+
+FAKE_PREFORM_SERVER = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fake_preform_server.py")
+
+
+def make_scene_type(material_code) -> SceneTypeModel:
+    return SceneTypeModel(
+        machine_type="FORM-4-0",
+        material_code=material_code,
+        layer_thickness_mm=SceneTypeModelLayerThicknessMm("0.1"),
+        print_setting="DEFAULT",
+    )
+
+
+@unittest.skipIf(sys.platform == "win32", "fake PreFormServer relies on a shebang line")
+class TestPreFormServerStandby(unittest.TestCase):
+    """PreFormServerStandby unit test"""
+
+    def setUp(self) -> None:
+        self.grey = make_scene_type("FLGPGR05")
+        self.clear = make_scene_type("FLGPCL05")
+        self.standby = PreFormServerStandby([self.grey, self.clear], standby_count=1, pathToPreformServer=FAKE_PREFORM_SERVER)
+        self.standby.start()
+
+    def tearDown(self) -> None:
+        self.standby.shutdown()
+
+    def wait_for_idle(self, scene_type, count) -> None:
+        deadline = time.monotonic() + 10
+        while self.standby.idle_count(scene_type) < count:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.05)
+
+    def test_checked_out_server_has_scene_type(self) -> None:
+        with self.standby.checkout(self.clear) as api:
+            scene = api.get_scene()
+            self.assertEqual(scene.scene_settings.material_code, "FLGPCL05")
+
+    def wait_for_servers(self, count) -> None:
+        deadline = time.monotonic() + 10
+        while len(self.standby._servers) != count:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.05)
+
+    def test_checked_in_server_returns_to_standby(self) -> None:
+        with self.standby.checkout(self.grey) as api:
+            host = api.api_client.configuration.host
+            self.assertEqual(self.standby.idle_count(self.grey), 0)
+        self.wait_for_idle(self.grey, 1)
+        with self.standby.checkout(self.grey) as api:
+            self.assertEqual(api.api_client.configuration.host, host)
+        self.wait_for_idle(self.grey, 1)
+        self.assertEqual(len(self.standby._servers), 2)
+
+    def test_concurrent_checkout_starts_another_server(self) -> None:
+        with self.standby.checkout(self.grey) as api:
+            with self.standby.checkout(self.grey, timeout=10) as other:
+                self.assertNotEqual(api.api_client.configuration.host, other.api_client.configuration.host)
+        self.wait_for_idle(self.grey, 1)
+        # Only one of the two checked in servers is kept as the standby
+        self.wait_for_servers(2)
+        self.assertEqual(self.standby.idle_count(self.grey), 1)
+
+    def test_unknown_scene_type(self) -> None:
+        with self.assertRaises(ValueError):
+            with self.standby.checkout(make_scene_type("FLTO2K02")):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
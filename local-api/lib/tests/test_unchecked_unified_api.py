@@ -0,0 +1,52 @@
+# coding: utf-8
+
+import unittest
+
+import urllib3
+
+from formlabs_local_api import ApiClient, UnifiedApi, rest
+from formlabs_local_api.UncheckedUnifiedApi import UncheckedUnifiedApi
+from formlabs_local_api.models import ModelProperties, UpdateModelRequest
+
+
+class RecordingApiClient(ApiClient):
+    """Answers every request with one canned response and records the requests"""
+
+    def __init__(self, body) -> None:
+        super().__init__()
+        self.body = body
+        self.requests = []
+
+    def call_api(self, method, url, header_params=None, body=None, post_params=None, _request_timeout=None, **kwargs):
+        self.requests.append((method, url, body))
+        response = rest.RESTResponse(urllib3.HTTPResponse(
+            body=self.body, status=200, headers={"Content-Type": "application/json"}, preload_content=True,
+        ))
+        response.read()
+        return response
+
+
+class TestUncheckedUnifiedApi(unittest.TestCase):
+    """UncheckedUnifiedApi unit test"""
+
+    def test_every_operation_skips_validation(self) -> None:
+        self.assertTrue(issubclass(UncheckedUnifiedApi, UnifiedApi))
+        for name in ("get_model", "update_model", "update_model_with_http_info", "update_model_without_preload_content"):
+            self.assertTrue(hasattr(getattr(UnifiedApi, name), "raw_function"), name)
+            self.assertFalse(hasattr(getattr(UncheckedUnifiedApi, name), "raw_function"), name)
+
+    def test_requests_and_responses_match_the_checked_api(self) -> None:
+        body = b'{"id": "model-1", "name": "part", "position": {"x": 1.0, "y": 2.0, "z": 0.0}}'
+        calls = []
+        for api_class in (UnifiedApi, UncheckedUnifiedApi):
+            client = RecordingApiClient(body)
+            api = api_class(client)
+            model = api.get_model("model-1")
+            api.update_model("model-1", UpdateModelRequest(name="renamed"))
+            calls.append((client.requests, model))
+        self.assertEqual(calls[0], calls[1])
+        self.assertIsInstance(calls[1][1], ModelProperties)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""\
+Handwritten asyncio interface to the generated, blocking web API classes
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
+import threading
+import formlabs_web_api as formlabs
+from formlabs_web_api.Pagination import count_pages
+
+
+class AsyncApiClient:
+    """Runs blocking ApiClient requests for the async API classes.
+
+    All async API classes built on one AsyncApiClient share its urllib3 connection
+    pool and a worker pool of the same size, which bounds the number of requests
+    in flight at once. The async API classes built without one share the
+    client returned by `AsyncApiClient.get_default`.
+
+    :param api_client: ApiClient to send requests with.
+    :param max_concurrency: requests in flight at once, defaults to the
+        configuration's connection_pool_maxsize.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, api_client=None, max_concurrency=None) -> None:
+        if api_client is None:
+            api_client = formlabs.ApiClient.get_default()
+        self.api_client = api_client
+        if max_concurrency is None:
+            max_concurrency = api_client.configuration.connection_pool_maxsize
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="formlabs_web_api")
+
+    @classmethod
+    def get_default(cls):
+        """Returns the AsyncApiClient of the default ApiClient, created on first use"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = AsyncApiClient()
+            return cls._default
+
+    @classmethod
+    def set_default(cls, default):
+        """Sets the AsyncApiClient used by the async API classes built without one"""
+        with cls._default_lock:
+            cls._default = default
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    async def run(self, operation, *args, **kwargs):
+        """Awaits a blocking call on one of the client's workers"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(operation, *args, **kwargs))
+
+
+async def gather_pages(list_operation, per_page=100, **kwargs):
+    """Fetches every page of a paginated list operation and returns all results in order.
+
+    The first page reveals `count`, the remaining pages are then requested at
+    once, with the page size the server used for the first page.
+
+    :param list_operation: async list operation, e.g. `AsyncPrintsApi(client).prints_list`.
+    :param per_page: page size to request.
+    :param kwargs: filters passed to every page request.
+    """
+    first = await list_operation(page=1, per_page=per_page, **kwargs)
+    results = list(first.results or [])
+    page_count, _ = count_pages(first)
+    pages = await asyncio.gather(*(
+        list_operation(page=page, per_page=per_page, **kwargs) for page in range(2, page_count + 1)
+    ))
+    for page in pages:
+        results.extend(page.results or [])
+    return results
+
+
+def _make_async_operation(api_class, name):
+    blocking = getattr(api_class, name)
+
+    @functools.wraps(blocking)
+    async def operation(self, *args, **kwargs):
+        return await self.async_client.run(getattr(self._api, name), *args, **kwargs)
+
+    return operation
+
+
+def _make_async_api(api_class):
+    def __init__(self, async_client=None) -> None:
+        if async_client is None:
+            async_client = AsyncApiClient.get_default()
+        self.async_client = async_client
+        self._api = api_class(async_client.api_client)
+
+    namespace = {
+        "__init__": __init__,
+        "__doc__": f"Awaitable version of every {api_class.__name__} operation, run through an AsyncApiClient",
+        "__module__": __name__,
+    }
+    for name, _ in inspect.getmembers(api_class, inspect.isfunction):
+        # Reading the raw response of *_without_preload_content would block the event loop
+        if not name.startswith("_") and not name.endswith("_without_preload_content"):
+            namespace[name] = _make_async_operation(api_class, name)
+    return type(f"Async{api_class.__name__}", (), namespace)
+
+
+AsyncCartridgesApi = _make_async_api(formlabs.CartridgesApi)
+AsyncEventsApi = _make_async_api(formlabs.EventsApi)
+AsyncGroupsApi = _make_async_api(formlabs.GroupsApi)
+AsyncPrintersApi = _make_async_api(formlabs.PrintersApi)
+AsyncPrintsApi = _make_async_api(formlabs.PrintsApi)
+AsyncTanksApi = _make_async_api(formlabs.TanksApi)
@@ -0,0 +1,151 @@
+"""\
+Handwritten indexed snapshot of the printers of a fleet
+"""
+import datetime
+import threading
+import time
+import formlabs_web_api as formlabs
+from formlabs_web_api.Pagination import iterate_all
+
+
+class FleetSnapshot:
+    """Printers of the fleet as listed at one moment, indexed for lookups in constant time.
+
+    e.g. `FleetSnapshot.fetch(client).with_status("PRINTING")`
+
+    The lookups return tuples of printers in listing order, empty if none
+    match. Enum values can be given as members or as strings. A snapshot is
+    never updated, use `FleetSnapshot.fetch` or a `FleetSnapshotCache` for a
+    newer one.
+
+    :param printers: DeveloperAPIMyPrinter models.
+    :param taken_at: when the printers were listed, defaults to now.
+    """
+
+    def __init__(self, printers, taken_at=None) -> None:
+        self.printers = tuple(printers)
+        self.taken_at = taken_at if taken_at is not None else datetime.datetime.now(datetime.timezone.utc)
+        self._by_serial = {}
+        self._by_group = {}
+        self._by_status = {}
+        self._by_machine_type = {}
+        self._by_tank_material = {}
+        for printer in self.printers:
+            self._by_serial[printer.serial] = printer
+            _add(self._by_group, printer.group.id, printer)
+            _add(self._by_status, printer.printer_status.status, printer)
+            _add(self._by_machine_type, _value(printer.machine_type_id), printer)
+            tank = printer.tank_status.tank if printer.tank_status is not None else None
+            _add(self._by_tank_material, tank.material if tank is not None else None, printer)
+        for index in (self._by_group, self._by_status, self._by_machine_type, self._by_tank_material):
+            for key, printers in index.items():
+                index[key] = tuple(printers)
+
+    @classmethod
+    def fetch(cls, api_client=None, per_page=100, max_concurrency=None):
+        """Lists every printer, with the pages after the first one requested concurrently, see `iterate_all`"""
+        if api_client is None:
+            api_client = formlabs.ApiClient.get_default()
+        taken_at = datetime.datetime.now(datetime.timezone.utc)
+        printers_list = formlabs.PrintersApi(api_client).printers_list
+        return cls(iterate_all(printers_list, per_page=per_page, max_concurrency=max_concurrency), taken_at)
+
+    def __len__(self):
+        return len(self.printers)
+
+    def __iter__(self):
+        return iter(self.printers)
+
+    def __contains__(self, serial):
+        return serial in self._by_serial
+
+    def age(self) -> datetime.timedelta:
+        """Time since the printers were listed"""
+        return datetime.datetime.now(datetime.timezone.utc) - self.taken_at
+
+    def printer(self, serial):
+        """Returns the printer with `serial`, None if the fleet has none"""
+        return self._by_serial.get(serial)
+
+    def in_group(self, group_id):
+        """Printers in the group with id `group_id`"""
+        return self._by_group.get(group_id, ())
+
+    def with_status(self, status):
+        """Printers whose `printer_status.status` is `status`, e.g. "PRINTING" or "IDLE" """
+        return self._by_status.get(status, ())
+
+    def of_machine_type(self, machine_type_id):
+        """Printers of `machine_type_id`, e.g. "FORM-4-0" """
+        return self._by_machine_type.get(_value(machine_type_id), ())
+
+    def with_tank_material(self, material):
+        """Printers with a tank of `material`, e.g. "FLGPGR05", or without a tank for None"""
+        return self._by_tank_material.get(material, ())
+
+    def groups(self):
+        """Ids of the groups with printers"""
+        return list(self._by_group)
+
+    def statuses(self):
+        """Statuses the printers are in"""
+        return list(self._by_status)
+
+
+class FleetSnapshotCache:
+    """Hands out the latest FleetSnapshot, fetching a new one once it is `ttl` seconds old.
+
+    Callers get the whole snapshot, so that the lookups of one dashboard
+    refresh all see the same moment. Threads asking for an expired snapshot
+    wait for a single fetch instead of each listing the printers.
+
+    :param api_client: ApiClient to list the printers with.
+    :param ttl: seconds a snapshot is handed out for.
+    :param per_page: page size to request.
+    :param max_concurrency: pages requested at once, see `iterate_all`.
+    """
+
+    def __init__(self, api_client=None, ttl=30.0, per_page=100, max_concurrency=None) -> None:
+        if api_client is None:
+            api_client = formlabs.ApiClient.get_default()
+        self.api_client = api_client
+        self.ttl = ttl
+        self.per_page = per_page
+        self.max_concurrency = max_concurrency
+        self._snapshot = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> FleetSnapshot:
+        """Returns the current snapshot, fetched again if it expired"""
+        if time.monotonic() < self._expires:
+            return self._snapshot
+        with self._lock:
+            # Another thread may have fetched it while this one waited
+            if time.monotonic() >= self._expires:
+                self._fetch()
+            return self._snapshot
+
+    def refresh(self) -> FleetSnapshot:
+        """Fetches a new snapshot right away, e.g. after changing a printer"""
+        with self._lock:
+            self._fetch()
+            return self._snapshot
+
+    def invalidate(self):
+        """Makes the next `get` fetch a new snapshot"""
+        self._expires = 0.0
+
+    def _fetch(self):
+        snapshot = FleetSnapshot.fetch(self.api_client, per_page=self.per_page, max_concurrency=self.max_concurrency)
+        self._snapshot = snapshot
+        self._expires = time.monotonic() + self.ttl
+
+
+def _add(index, key, printer):
+    index.setdefault(key, []).append(printer)
+
+
+def _value(member):
+    # Models built without validation hold the raw strings
+    return getattr(member, "value", member)
@@ -0,0 +1,103 @@
+"""\
+Handwritten pluggable JSON encoding and decoding of the models and the transport
+"""
+import json
+from typing import Any, Union
+import formlabs_web_api.configuration
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonBackend:
+    """Encodes and decodes the JSON of request bodies, responses and models.
+
+    The default backend encodes with `json` and decodes with orjson when it is
+    installed. Set `Configuration.json_backend` to "json", "orjson" or an
+    instance of a subclass of JsonBackend to use another library. Models'
+    `to_json` and `from_json` use the backend of `Configuration.get_default()`.
+    """
+
+    name = "default"
+
+    def dumps(self, obj: Any) -> Union[bytes, str]:
+        """Encodes `obj`, as UTF-8 bytes or as str"""
+        return json.dumps(obj)
+
+    def loads(self, document: Union[bytes, str]) -> Any:
+        """Parses a JSON document given as bytes or str"""
+        if orjson is not None:
+            return _orjson_loads(document)
+        return json.loads(document)
+
+    def dumps_str(self, obj: Any) -> str:
+        """Encodes `obj` as str"""
+        document = self.dumps(obj)
+        return document.decode("utf-8") if isinstance(document, bytes) else document
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class StdlibJsonBackend(JsonBackend):
+    """Encodes and decodes with the `json` module only"""
+
+    name = "json"
+
+    def loads(self, document: Union[bytes, str]) -> Any:
+        return json.loads(document)
+
+
+class OrjsonBackend(JsonBackend):
+    """Encodes and decodes with orjson, falling back to `json` for what orjson rejects"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("The orjson JSON backend needs the orjson package")
+
+    def dumps(self, obj: Any) -> Union[bytes, str]:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits or keys that are not strings
+            return json.dumps(obj)
+
+    def loads(self, document: Union[bytes, str]) -> Any:
+        return _orjson_loads(document)
+
+
+def _orjson_loads(document):
+    try:
+        return orjson.loads(document)
+    except orjson.JSONDecodeError:
+        # orjson rejects some documents json accepts, e.g. NaN or Infinity
+        return json.loads(document)
+
+
+_default_backend = JsonBackend()
+_named_backends = {"default": _default_backend, "json": StdlibJsonBackend()}
+
+
+def get_json_backend(setting=None) -> JsonBackend:
+    """Returns the backend of a `Configuration.json_backend` setting: None, a name or a JsonBackend"""
+    if setting is None:
+        return _default_backend
+    if not isinstance(setting, str):
+        return setting
+    try:
+        return _named_backends[setting]
+    except KeyError:
+        pass
+    if setting != "orjson":
+        raise ValueError(f"Unknown JSON backend {setting!r}, expected one of default, json, orjson or a JsonBackend")
+    backend = _named_backends[setting] = OrjsonBackend()
+    return backend
+
+
+def model_json_backend() -> JsonBackend:
+    """Returns the backend of the models' `to_json` and `from_json`"""
+    return get_json_backend(formlabs_web_api.configuration.Configuration.get_default().json_backend)
@@ -0,0 +1,136 @@
+"""\
+Handwritten construction of the generated models from trusted data without validation
+"""
+import datetime
+import typing
+from enum import Enum
+from dateutil.parser import parse
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+
+def construct_from_dict(klass, obj):
+    """Builds `klass` from parsed JSON like `klass.from_dict`, but without validating it.
+
+    The values are trusted to have the types the API documents, so they are
+    only converted where the model holds another type than JSON does: nested
+    objects become their models, enum values their Enum members and date-times
+    datetime objects. Fields with a default get it when their value is missing
+    or null, as in `from_dict`. The models are set up the way pydantic's
+    `model_construct` does it. oneOf models are still deserialized with their
+    own `from_dict`, since the schema of their value has to be found by
+    validating it.
+    """
+    plan = _construct_plan(klass)
+    if plan is None or not isinstance(obj, dict):
+        return klass.from_dict(obj)
+    plain_fields, converted_fields, defaults, field_names, template = plan
+    if template is not None:
+        # Field names are the JSON keys, so the values are copied in one go
+        values = template.copy()
+        values.update(obj)
+        if len(values) != len(template):
+            # Leave out keys the models do not know, e.g. from a newer API version
+            values = {name: values[name] for name in template}
+    else:
+        values = {name: obj.get(key) for name, key in plain_fields}
+    for name, key, convert in converted_fields:
+        value = obj.get(key)
+        values[name] = None if value is None else convert(value)
+    for name, default in defaults:
+        if values[name] is None:
+            values[name] = default
+    instance = klass.__new__(klass)
+    _object_setattr(instance, "__dict__", values)
+    # Like from_dict, every field counts as set
+    _object_setattr(instance, "__pydantic_fields_set__", set(field_names))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
+
+
+_object_setattr = object.__setattr__
+_construct_plans = {}
+
+
+def _construct_plan(klass):
+    """Fields of `klass` kept as parsed and converted, None if `klass` cannot be constructed without validation"""
+    try:
+        return _construct_plans[klass]
+    except KeyError:
+        pass
+    plan = None
+    # Private attributes and model_post_init need pydantic's own model_construct
+    if "actual_instance" not in klass.model_fields and not klass.__private_attributes__ and not klass.__pydantic_post_init__:
+        plain_fields = []
+        converted_fields = []
+        for name, field in klass.model_fields.items():
+            convert = field_converter(field.annotation)
+            if convert is False:
+                break
+            if convert is None:
+                plain_fields.append((name, field.alias or name))
+            else:
+                converted_fields.append((name, field.alias or name, convert))
+        else:
+            template = None
+            if all(name == key for name, key in plain_fields) and all(name == key for name, key, _ in converted_fields):
+                template = dict.fromkeys(klass.model_fields)
+            defaults = tuple(
+                (name, field.default)
+                for name, field in klass.model_fields.items()
+                if field.default is not None and field.default is not PydanticUndefined
+            )
+            plan = (tuple(plain_fields), tuple(converted_fields), defaults, frozenset(klass.model_fields), template)
+    _construct_plans[klass] = plan
+    return plan
+
+
+def field_converter(annotation):
+    """Returns the function converting a non-None JSON value into `annotation`.
+
+    None means the JSON value is kept as is, False that the value has to be validated.
+    """
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return field_converter(args[0])
+    if origin is typing.Union:
+        converters = [field_converter(arg) for arg in args if arg is not type(None)]
+        if len(converters) == 1:
+            return converters[0]
+        return None if all(convert is None for convert in converters) else False
+    if origin is list:
+        convert = field_converter(args[0])
+        if convert is None or convert is False:
+            return convert
+        return lambda value: [None if item is None else convert(item) for item in value]
+    if origin is dict:
+        convert = field_converter(args[1])
+        if convert is None or convert is False:
+            return convert
+        return lambda value: {key: None if item is None else convert(item) for key, item in value.items()}
+    if origin is not None:
+        return None if all(field_converter(arg) is None for arg in args) else False
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, BaseModel):
+        if "actual_instance" in annotation.model_fields:
+            return annotation.from_dict
+        return lambda value: construct_from_dict(annotation, value)
+    if issubclass(annotation, Enum):
+        return annotation
+    if issubclass(annotation, datetime.datetime):
+        return parse_datetime
+    if issubclass(annotation, datetime.date):
+        return datetime.date.fromisoformat
+    return None
+
+
+def parse_datetime(value):
+    """Parses an ISO 8601 date and time of a JSON response"""
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        # fromisoformat only accepts a trailing Z from Python 3.11 on
+        return parse(value)
@@ -0,0 +1,91 @@
+"""\
+Handwritten schema selection for the generated oneOf models
+"""
+from enum import Enum
+
+
+class OneOfDispatcher:
+    """Orders the schemas of a oneOf model by how well a value fits them.
+
+    The generated oneOf models validated a value against every schema and
+    required exactly one of them to accept it. Since the generated models ignore
+    unknown keys, an object meant for one schema is often also accepted by a
+    schema with fewer properties, e.g. a Form 4 printer is also a generic device.
+    Instead, the generated `from_dict` tries the schemas in order of fit and
+    the first one that validates wins, so a value is usually validated once:
+
+    * objects go to the models whose properties are exactly the object's keys,
+      then to the models with all their required keys present and the fewest
+      unknown keys, then to the rest;
+    * enum members and other JSON values go to the schemas of their JSON type.
+
+    :param validators: `oneof_schema_<n>_validator` field name to the model
+        class, Enum class or primitive type name (e.g. "str", "List[str]") of
+        the schema it validates, in declaration order.
+    """
+
+    def __init__(self, validators) -> None:
+        self.validators = validators
+        self._key_sets = {}
+
+    def order(self, obj):
+        """Returns the (field, schema) pairs ordered by how well `obj` fits them"""
+        return sorted(self.validators.items(), key=lambda item: self._fit(item[1], obj))
+
+    def validate(self, cls, field, schema, obj):
+        """Returns `obj` deserialized into `schema`, the schema of the validator field `field` of the oneOf model `cls`"""
+        if isinstance(schema, str):
+            instance = cls.model_construct()
+            # validate_assignment checks the value against the validator's type
+            setattr(instance, field, obj)
+            return getattr(instance, field)
+        if issubclass(schema, Enum):
+            return schema(obj)
+        value = schema.from_dict(obj)
+        if value is None:
+            raise ValueError(f"{schema.__name__} cannot be null")
+        return value
+
+    def _fit(self, schema, obj):
+        if isinstance(schema, str):
+            return (0,) if isinstance(obj, _json_types(schema)) else (3,)
+        if issubclass(schema, Enum):
+            values = schema._value2member_map_
+            if isinstance(obj, (str, int, float)) and obj in values:
+                return (0,)
+            return (3,)
+        if not isinstance(obj, dict):
+            return (3,)
+        required, properties = self._keys(schema)
+        missing = len(required.difference(obj))
+        if missing:
+            return (2, missing)
+        unknown = sum(1 for key in obj if key not in properties)
+        return (0,) if not unknown else (1, unknown)
+
+    def _keys(self, schema):
+        keys = self._key_sets.get(schema)
+        if keys is None:
+            required = set()
+            properties = set()
+            for name, field in schema.model_fields.items():
+                key = field.alias or name
+                properties.add(key)
+                if field.is_required():
+                    required.add(key)
+            keys = self._key_sets[schema] = (frozenset(required), frozenset(properties))
+        return keys
+
+
+def _json_types(type_name):
+    """Python types json.loads returns for values of a primitive oneOf schema"""
+    if type_name.startswith("List["):
+        return (list,)
+    if type_name.startswith("Dict["):
+        return (dict,)
+    return {
+        "str": (str,),
+        "bool": (bool,),
+        "int": (int,),
+        "float": (float, int),
+    }.get(type_name, (object,))
@@ -0,0 +1,95 @@
+"""\
+Handwritten field projection of the web API list operations
+"""
+import collections
+import functools
+import inspect
+import typing
+from pydantic import TypeAdapter
+import formlabs_web_api as formlabs
+from formlabs_web_api.JsonBackend import get_json_backend
+from formlabs_web_api.ModelConstruct import field_converter
+
+
+def project(list_operation, fields, **kwargs):
+    """Calls a list operation and returns its page with results holding only `fields`.
+
+    e.g. `project(PrintsApi(client).prints_list, ("guid", "status", "created_at"), page=2)`
+
+    The results are records of the `record_type` of the result model and
+    fields, instead of full models, which take a fraction of the memory and of
+    the time to build. Field values are converted to the types the model holds,
+    e.g. enum members and datetime objects, but are not validated.
+    The page is a record of all fields of the paginated model.
+
+    Like `*_without_preload_content`, projected operations are not recorded by
+    the ApiClient's instrumentation.
+
+    :param list_operation: list operation of an API instance, e.g. `PrintsApi(client).prints_list`.
+    :param fields: names of the result model fields to keep.
+    :param kwargs: parameters of the list operation.
+    """
+    page_model = inspect.signature(list_operation).return_annotation
+    item_model = results_model(page_model)
+    record = record_type(item_model, fields)
+    page_record = record_type(page_model, tuple(page_model.model_fields))
+
+    page = fetch_json(list_operation, **kwargs)
+    results = page.pop("results", None)
+    return _make_record(page_record, page)._replace(
+        results=None if results is None else [_make_record(record, row) for row in results]
+    )
+
+
+def record_type(model, fields):
+    """Returns the namedtuple type of records holding `fields` of `model`, e.g. `PrintRunWithFleetControlDataRecord`"""
+    return _record_type(model, tuple(fields))
+
+
+@functools.lru_cache(maxsize=None)
+def _record_type(model, fields):
+    unknown = [field for field in fields if field not in model.model_fields]
+    if unknown:
+        raise ValueError(f"{model.__name__} has no fields {', '.join(unknown)}")
+    record = collections.namedtuple(f"{model.__name__}Record", fields)
+    record._keys = tuple(model.model_fields[field].alias or field for field in fields)
+    converters = []
+    for index, field in enumerate(fields):
+        annotation = model.model_fields[field].annotation
+        convert = field_converter(annotation)
+        if convert is False:
+            # Values of oneOf models have to be validated to find their schema
+            convert = TypeAdapter(annotation).validate_python
+        if convert is not None:
+            converters.append((index, convert))
+    record._converters = tuple(converters)
+    return record
+
+
+def fetch_json(operation, *args, **kwargs):
+    """Calls an operation of an API instance and returns its parsed JSON response, without deserializing it"""
+    api = operation.__self__
+    raw_response = getattr(api, f"{operation.__name__}_without_preload_content")(*args, **kwargs)
+    response_data = formlabs.rest.RESTResponse(raw_response)
+    response_data.read()
+    if not 200 <= response_data.status <= 299:
+        # Raises the ApiException of the status
+        api.api_client.response_deserialize(response_data, {})
+    return get_json_backend(api.api_client.configuration.json_backend).loads(response_data.data)
+
+
+def _make_record(record, obj):
+    values = [obj.get(key) for key in record._keys]
+    for index, convert in record._converters:
+        value = values[index]
+        if value is not None:
+            values[index] = convert(value)
+    return tuple.__new__(record, values)
+
+
+def results_model(page_model):
+    """Model of the `results` items of a paginated model"""
+    annotation = page_model.model_fields["results"].annotation
+    while typing.get_origin(annotation) is typing.Union:
+        annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    return typing.get_args(annotation)[0]
@@ -0,0 +1,205 @@
+"""\
+Handwritten incremental mirror of web API records in a local SQLite database
+"""
+import datetime
+import json
+import sqlite3
+import types
+import formlabs_web_api as formlabs
+from formlabs_web_api.ModelConstruct import parse_datetime
+from formlabs_web_api.Pagination import iterate_all
+from formlabs_web_api.Projection import fetch_json
+
+# Statuses after which a print run no longer changes
+FINAL_PRINT_STATUSES = frozenset(("FINISHED", "ABORTED", "ERROR"))
+# `date__gt` leaves out records created at the date itself, and may ignore fractions of seconds
+_BEFORE = datetime.timedelta(seconds=1)
+
+_TABLES = {
+    # collection: (key column, indexed columns, results model)
+    "prints": ("guid", ("created_at", "status", "printer"), "PrintRunWithFleetControlData"),
+    "events": ("id", ("created_at", "type", "printer"), "UserEventReadOnly"),
+    "tanks": ("serial", ("last_modified",), "Tank"),
+    "cartridges": ("serial", ("last_modified",), "Cartridge"),
+}
+
+
+class SqliteMirror:
+    """Keeps a local SQLite copy of the prints, events, tanks and cartridges of the web API.
+
+    e.g. `with SqliteMirror("fleet.sqlite", client) as mirror: mirror.sync()`
+
+    Each record is stored as its JSON document in a table named after the
+    collection, next to columns of its key and of the fields worth querying,
+    e.g. `SELECT data FROM prints WHERE status = 'ERROR'`. `sync` only
+    requests what may have changed since the previous sync:
+
+    * prints created after the stored high-water mark, or after the oldest
+      print run of the mirror that had not finished yet, unless it was created
+      more than `max_lookback` before the high-water mark,
+    * events created after the high-water mark, since events do not change,
+    * all tanks and cartridges, which cannot be filtered by date, but are
+      only written if their `last_modified` changed.
+
+    Records deleted from the web API stay in the mirror. A print run that
+    stays unfinished, e.g. because it was deleted while printing, stops
+    widening the requests after `max_lookback`, and keeps its last status.
+    Changes to a print run after it finished, e.g. a new note, are only
+    mirrored when it is requested again: while it is within `overlap` of the
+    high-water mark, or newer than a print run still going on.
+
+    :param path: SQLite database file, created if missing.
+    :param api_client: ApiClient to request the records with.
+    :param per_page: page size to request.
+    :param batch_size: records written per transaction.
+    :param overlap: time before the high-water mark that is requested again,
+        for records the web API lists late.
+    :param max_concurrency: pages requested at once, see `iterate_all`.
+    :param max_lookback: time before the high-water mark up to which
+        unfinished print runs are requested again.
+    """
+
+    def __init__(self, path, api_client=None, per_page=100, batch_size=500, overlap=datetime.timedelta(minutes=5), max_concurrency=None,
+                 max_lookback=datetime.timedelta(days=7)) -> None:
+        if api_client is None:
+            api_client = formlabs.ApiClient.get_default()
+        self.api_client = api_client
+        self.per_page = per_page
+        self.batch_size = batch_size
+        self.overlap = overlap
+        self.max_lookback = max_lookback
+        if max_concurrency is None:
+            max_concurrency = api_client.configuration.connection_pool_maxsize
+        self.max_concurrency = max_concurrency
+        self.connection = sqlite3.connect(path)
+        self._create_tables()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def sync(self, collections=tuple(_TABLES)):
+        """Brings the mirror up to date and returns the number of records written per collection"""
+        unknown = [collection for collection in collections if collection not in _TABLES]
+        if unknown:
+            raise ValueError(f"Unknown collections {', '.join(unknown)}, expected some of {', '.join(_TABLES)}")
+        written = {}
+        for collection in collections:
+            written[collection] = getattr(self, f"_sync_{collection}")()
+        return written
+
+    def high_water_mark(self, collection):
+        """Returns the `created_at` of the newest record of `collection` mirrored so far, None before the first sync"""
+        row = self.connection.execute("SELECT high_water_mark FROM sync_state WHERE collection = ?", (collection,)).fetchone()
+        return None if row is None or row[0] is None else parse_datetime(row[0])
+
+    def records(self, collection, where="", parameters=()):
+        """Yields the mirrored records of `collection` as models, optionally filtered by an SQL condition.
+
+        e.g. `mirror.records("prints", "status = ? AND printer = ?", ("ERROR", "Form4-Alpha"))`
+        """
+        key, columns, model_name = _TABLES[collection]
+        model = getattr(formlabs, model_name)
+        order = f"created_at, {key}" if "created_at" in columns else key
+        query = f"SELECT data FROM {collection}" + (f" WHERE {where}" if where else "") + f" ORDER BY {order}"
+        for (data,) in self.connection.execute(query, parameters):
+            yield model.from_dict(json.loads(data))
+
+    def _sync_prints(self):
+        since = self.high_water_mark("prints")
+        if since is not None:
+            # Print runs that were still going on may have changed since, older ones are taken as stuck or deleted
+            oldest = since - self.max_lookback
+            for (created_at,) in self.connection.execute(
+                f"SELECT created_at FROM prints WHERE status NOT IN ({', '.join('?' * len(FINAL_PRINT_STATUSES))})",
+                tuple(FINAL_PRINT_STATUSES),
+            ):
+                created_at = parse_datetime(created_at)
+                if created_at >= oldest:
+                    since = min(since, created_at - _BEFORE)
+        return self._sync_created("prints", formlabs.PrintsApi(self.api_client).prints_list, since)
+
+    def _sync_events(self):
+        return self._sync_created("events", formlabs.EventsApi(self.api_client).events_list, self.high_water_mark("events"))
+
+    def _sync_tanks(self):
+        return self._sync_modified("tanks", formlabs.TanksApi(self.api_client).tanks_list)
+
+    def _sync_cartridges(self):
+        return self._sync_modified("cartridges", formlabs.CartridgesApi(self.api_client).cartridges_list)
+
+    def _sync_created(self, collection, list_operation, since):
+        filters = {}
+        if since is not None:
+            filters["date__gt"] = since - self.overlap
+        newest = self.high_water_mark(collection)
+        written = 0
+        for batch in self._batches(list_operation, **filters):
+            for record in batch:
+                created_at = parse_datetime(record["created_at"])
+                if newest is None or created_at > newest:
+                    newest = created_at
+            with self.connection:
+                written += self._upsert(collection, batch, "")
+        # Stored last, since pages may list the newest records first
+        with self.connection:
+            self._store_high_water_mark(collection, newest)
+        return written
+
+    def _sync_modified(self, collection, list_operation):
+        written = 0
+        for batch in self._batches(list_operation):
+            with self.connection:
+                written += self._upsert(collection, batch, f"WHERE excluded.last_modified IS NOT {collection}.last_modified")
+        with self.connection:
+            self._store_high_water_mark(collection, None)
+        return written
+
+    def _batches(self, list_operation, **filters):
+        def fetch_page(**kwargs):
+            return types.SimpleNamespace(**fetch_json(list_operation, **kwargs))
+
+        batch = []
+        for record in iterate_all(fetch_page, per_page=self.per_page, max_concurrency=self.max_concurrency, **filters):
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _upsert(self, collection, records, condition):
+        key, columns, _ = _TABLES[collection]
+        names = (key, *columns, "data")
+        cursor = self.connection.executemany(
+            f"INSERT INTO {collection} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT({key}) DO UPDATE SET {', '.join(f'{name} = excluded.{name}' for name in names[1:])} {condition}",
+            [(record[key], *(record.get(column) for column in columns), json.dumps(record)) for record in records],
+        )
+        return cursor.rowcount
+
+    def _store_high_water_mark(self, collection, mark):
+        self.connection.execute(
+            "INSERT INTO sync_state (collection, high_water_mark, synced_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(collection) DO UPDATE SET high_water_mark = excluded.high_water_mark, synced_at = excluded.synced_at",
+            (collection, None if mark is None else mark.isoformat(), datetime.datetime.now(datetime.timezone.utc).isoformat()),
+        )
+
+    def _create_tables(self):
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (collection TEXT PRIMARY KEY, high_water_mark TEXT, synced_at TEXT)"
+            )
+            for collection, (key, columns, _) in _TABLES.items():
+                key_type = "INTEGER" if key == "id" else "TEXT"
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {collection} "
+                    f"({key} {key_type} PRIMARY KEY, {', '.join(f'{column} TEXT' for column in columns)}, data TEXT NOT NULL)"
+                )
+                for column in columns:
+                    self.connection.execute(f"CREATE INDEX IF NOT EXISTS {collection}_{column} ON {collection} ({column})")
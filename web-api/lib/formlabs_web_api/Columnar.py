@@ -0,0 +1,232 @@
+"""\
+Handwritten columnar export of the web API list operations to Arrow, Parquet and NumPy
+"""
+import datetime
+import inspect
+import types
+import typing
+from enum import Enum
+from pydantic import BaseModel
+from formlabs_web_api.ModelConstruct import parse_datetime
+from formlabs_web_api.Pagination import iterate_all
+from formlabs_web_api.Projection import fetch_json, results_model
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def iterate_columns(list_operation, *args, columns=None, batch_size=10000, per_page=100, max_concurrency=None, **kwargs):
+    """Yields the results of every page of a list operation as columns, `batch_size` rows at a time.
+
+    e.g. `for batch in iterate_columns(PrintsApi(client).prints_list, columns=("material", "volume_ml")): ...`
+
+    Each batch is a dict of column name to the list of its values. The pages
+    are parsed as JSON and never turned into models, values are converted to
+    the types the model holds: int, float, bool, str, timezone-aware datetime
+    and date, with enum members as their value. Only `batch_size` rows and the
+    pages requested ahead by `iterate_all` are held at once.
+
+    :param list_operation: list operation of an API instance, e.g. `PrintsApi(client).prints_list`.
+    :param args: path parameters, e.g. the serial of `printers_prints_list`.
+    :param columns: fields of the result model, dotted for nested models, e.g.
+        "group.name". Defaults to every field holding a single value.
+    :param batch_size: rows per batch.
+    :param per_page: page size to request.
+    :param max_concurrency: pages requested at once, see `iterate_all`.
+    :param kwargs: filters passed to every page request.
+    """
+    specs = column_specs(list_operation, columns)
+    yield from _iterate_batches(list_operation, args, specs, batch_size, per_page, max_concurrency, kwargs)
+
+
+def column_specs(list_operation, columns=None):
+    """Returns the (column name, kind, nullable) of the columns exported from `list_operation`.
+
+    Kinds are "int", "float", "bool", "str", "enum", "datetime" and "date".
+    """
+    model = results_model(inspect.signature(list_operation).return_annotation)
+    if columns is None:
+        columns = [name for name, field in model.model_fields.items() if _kind(field.annotation) is not None]
+    specs = []
+    for column in columns:
+        kind, nullable = _column_kind(model, column)
+        specs.append((column, kind, nullable))
+    return specs
+
+
+def to_arrow(list_operation, *args, columns=None, batch_size=10000, per_page=100, max_concurrency=None, **kwargs):
+    """Returns the results of every page of a list operation as a pyarrow Table, see `iterate_columns`.
+
+    Datetimes are UTC timestamps in microseconds, enum fields are dictionary encoded.
+    """
+    schema, batches = _arrow_batches(list_operation, args, columns, batch_size, per_page, max_concurrency, kwargs)
+    return pyarrow.Table.from_batches(list(batches), schema=schema)
+
+
+def write_parquet(path, list_operation, *args, columns=None, batch_size=10000, per_page=100, max_concurrency=None, **kwargs):
+    """Writes the results of every page of a list operation to a Parquet file and returns the number of rows.
+
+    Each batch of `iterate_columns` is written as a row group as soon as it is
+    complete, so the results never have to fit in memory together.
+    """
+    schema, batches = _arrow_batches(list_operation, args, columns, batch_size, per_page, max_concurrency, kwargs)
+    rows = 0
+    with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def to_numpy(list_operation, *args, columns=None, batch_size=10000, per_page=100, max_concurrency=None, **kwargs):
+    """Returns the results of every page of a list operation as a NumPy structured array, see `iterate_columns`.
+
+    Numbers are int64 and float64 fields, nullable integers and booleans are
+    float64 with NaN for null. Datetimes are naive UTC datetime64[us] with NaT
+    for null. Strings and enum values are Python objects.
+    """
+    if numpy is None:
+        raise ImportError("to_numpy needs the numpy package")
+    specs = column_specs(list_operation, columns)
+    dtype = numpy.dtype([(column, _NUMPY_TYPES[kind, nullable]) for column, kind, nullable in specs])
+    arrays = []
+    for batch in _iterate_batches(list_operation, args, specs, batch_size, per_page, max_concurrency, kwargs):
+        array = numpy.empty(len(batch[specs[0][0]]), dtype=dtype)
+        for column, kind, _ in specs:
+            values = batch[column]
+            if kind == "datetime":
+                values = [None if value is None else value.astimezone(datetime.timezone.utc).replace(tzinfo=None) for value in values]
+            array[column] = numpy.array(values, dtype=dtype[column])
+        arrays.append(array)
+    if not arrays:
+        return numpy.empty(0, dtype=dtype)
+    return arrays[0] if len(arrays) == 1 else numpy.concatenate(arrays)
+
+
+_NUMPY_TYPES = {
+    ("int", False): "i8", ("int", True): "f8",
+    ("float", False): "f8", ("float", True): "f8",
+    ("bool", False): "?", ("bool", True): "f8",
+    ("str", False): "O", ("str", True): "O",
+    ("enum", False): "O", ("enum", True): "O",
+    ("datetime", False): "datetime64[us]", ("datetime", True): "datetime64[us]",
+    ("date", False): "datetime64[D]", ("date", True): "datetime64[D]",
+}
+
+
+def _arrow_batches(list_operation, args, columns, batch_size, per_page, max_concurrency, kwargs):
+    if pyarrow is None:
+        raise ImportError("Arrow and Parquet export needs the pyarrow package")
+    specs = column_specs(list_operation, columns)
+    arrow_types = {
+        "int": pyarrow.int64(),
+        "float": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+        "str": pyarrow.string(),
+        "enum": pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        "datetime": pyarrow.timestamp("us", tz="UTC"),
+        "date": pyarrow.date32(),
+    }
+    schema = pyarrow.schema([pyarrow.field(column, arrow_types[kind], nullable) for column, kind, nullable in specs])
+
+    def batches():
+        for batch in _iterate_batches(list_operation, args, specs, batch_size, per_page, max_concurrency, kwargs):
+            yield pyarrow.RecordBatch.from_arrays(
+                [
+                    pyarrow.array(batch[column], type=pyarrow.string()).dictionary_encode() if kind == "enum"
+                    else pyarrow.array(batch[column], type=schema.field(column).type)
+                    for column, kind, _ in specs
+                ],
+                schema=schema,
+            )
+
+    return schema, batches()
+
+
+def _iterate_batches(list_operation, args, specs, batch_size, per_page, max_concurrency, kwargs):
+    def fetch_page(*args, **kwargs):
+        return types.SimpleNamespace(**fetch_json(list_operation, *args, **kwargs))
+
+    if max_concurrency is None:
+        max_concurrency = list_operation.__self__.api_client.configuration.connection_pool_maxsize
+    getters = [(column, column.split("."), _PARSERS.get(kind)) for column, kind, _ in specs]
+    batch = {column: [] for column, _, _ in specs}
+    rows = 0
+    for record in iterate_all(fetch_page, *args, per_page=per_page, max_concurrency=max_concurrency, **kwargs):
+        for column, path, parse in getters:
+            value = record
+            for key in path:
+                value = value.get(key) if value is not None else None
+            if parse is not None and value is not None:
+                value = parse(value)
+            batch[column].append(value)
+        rows += 1
+        if rows == batch_size:
+            yield batch
+            batch = {column: [] for column, _, _ in specs}
+            rows = 0
+    if rows:
+        yield batch
+
+
+_PARSERS = {
+    "datetime": parse_datetime,
+    "date": datetime.date.fromisoformat,
+    "float": float,
+}
+
+
+def _column_kind(model, column):
+    """Returns the kind of the values of a dotted field path of `model`, and whether they may be null"""
+    nullable = False
+    annotation = model
+    for name in column.split("."):
+        if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)) or name not in annotation.model_fields:
+            raise ValueError(f"{model.__name__} has no field {column}")
+        annotation, optional = _strip_optional(annotation.model_fields[name].annotation)
+        nullable = nullable or optional
+    kind = _kind(annotation)
+    if kind is None:
+        raise ValueError(f"{model.__name__}.{column} does not hold single values, which columns are made of")
+    return kind, nullable
+
+
+def _strip_optional(annotation):
+    optional = False
+    while True:
+        origin = typing.get_origin(annotation)
+        if origin is typing.Annotated:
+            annotation = typing.get_args(annotation)[0]
+        elif origin is typing.Union and type(None) in typing.get_args(annotation):
+            optional = True
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            annotation = args[0] if len(args) == 1 else typing.Union[tuple(args)]
+        else:
+            return annotation, optional
+
+
+def _kind(annotation):
+    annotation, _ = _strip_optional(annotation)
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        kinds = {_kind(arg) for arg in typing.get_args(annotation)}
+        # Union[StrictFloat, StrictInt] holds numbers
+        return "float" if kinds == {"float", "int"} else None
+    if origin is not None or not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, Enum):
+        return "enum"
+    if issubclass(annotation, bool):
+        return "bool"
+    for klass, kind in ((int, "int"), (float, "float"), (str, "str"), (datetime.datetime, "datetime"), (datetime.date, "date")):
+        if issubclass(annotation, klass):
+            return kind
+    return None
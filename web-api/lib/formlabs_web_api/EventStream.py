@@ -0,0 +1,128 @@
+"""\
+Handwritten stream of new web API events, polled with adaptive intervals
+"""
+import asyncio
+import datetime
+import threading
+import urllib3
+import formlabs_web_api as formlabs
+from formlabs_web_api.Pagination import iterate_all
+
+# Events after which a printer is printing, and after which it no longer is
+_PRINT_STARTED = frozenset(("PRINT_START", "PRINT_RESUMED"))
+_PRINT_ENDED = frozenset(("PRINT_FINISHED", "PRINT_ABORTED", "PRINT_ERROR", "PRINT_PAUSED"))
+
+
+class EventStream:
+    """Yields the events of the web API as they are created, by polling `events_list`.
+
+    e.g. `for event in EventStream(client, types=("PRINT_FINISHED", "PRINT_ERROR")): ...`
+    or `async for event in EventStream(client): ...`
+
+    Every poll only requests the events created after a cursor, the
+    `created_at` of the newest event seen, less `overlap` for events that the
+    web API lists late. The ids of the events seen within the overlap are
+    kept, so that no event is yielded twice.
+
+    Polls follow each other after `min_interval` while events keep coming,
+    and after `active_interval` while a printer is printing, since its print
+    run may end at any time. The interval then grows by `backoff` up to
+    `max_interval` while nothing happens.
+
+    Iterating goes on through errors that may pass, connection errors and
+    responses with status 429 or 5xx: the interval grows as after a poll
+    without new events, and the next poll resumes from the cursor. `poll`
+    itself raises them.
+
+    :param api_client: ApiClient to request the events with.
+    :param types: event types to yield, all by default. Other events still
+        move the cursor and tell which printers are printing.
+    :param printer: serial of the only printer to yield events of.
+    :param since: yields the events created after this date, defaults to now.
+    :param min_interval: seconds between polls after new events.
+    :param active_interval: longest seconds between polls while a printer is printing.
+    :param max_interval: longest seconds between polls.
+    :param backoff: factor the interval grows by after a poll without new events.
+    :param overlap: time before the cursor that is requested again.
+    :param per_page: page size to request.
+    """
+
+    def __init__(self, api_client=None, types=None, printer=None, since=None, min_interval=2.0, active_interval=10.0,
+                 max_interval=60.0, backoff=2.0, overlap=datetime.timedelta(seconds=30), per_page=100) -> None:
+        if not 0 < min_interval <= active_interval <= max_interval:
+            raise ValueError("Expected 0 < min_interval <= active_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if api_client is None:
+            api_client = formlabs.ApiClient.get_default()
+        self._events_list = formlabs.EventsApi(api_client).events_list
+        self.types = None if types is None else frozenset(getattr(event_type, "value", event_type) for event_type in types)
+        self.printer = printer
+        self.cursor = since if since is not None else datetime.datetime.now(datetime.timezone.utc)
+        self.min_interval = min_interval
+        self.active_interval = active_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.overlap = overlap
+        self.per_page = per_page
+        # Seconds to wait before the next poll
+        self.interval = min_interval
+        self.printing = set()
+        self._seen = {}
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        while not self._closed.is_set():
+            yield from self._poll_through_errors()
+            self._closed.wait(self.interval)
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        while not self._closed.is_set():
+            for event in await loop.run_in_executor(None, self._poll_through_errors):
+                yield event
+            await asyncio.sleep(self.interval)
+
+    def close(self):
+        """Ends the iteration, after the poll in progress if any"""
+        self._closed.set()
+
+    def poll(self):
+        """Requests the events created since the previous poll, and returns the new ones, oldest first"""
+        filters = {"date__gt": self.cursor - self.overlap}
+        if self.printer is not None:
+            filters["printer"] = self.printer
+        new = [
+            event for event in iterate_all(self._events_list, per_page=self.per_page, **filters)
+            if event.id not in self._seen
+        ]
+        new.sort(key=lambda event: (event.created_at, event.id))
+        for event in new:
+            self._seen[event.id] = event.created_at
+            self.cursor = max(self.cursor, event.created_at)
+            event_type = getattr(event.type, "value", event.type)
+            if event_type in _PRINT_STARTED:
+                self.printing.add(event.printer)
+            elif event_type in _PRINT_ENDED:
+                self.printing.discard(event.printer)
+        # Events older than the overlap are not requested again
+        horizon = self.cursor - self.overlap
+        self._seen = {event_id: created_at for event_id, created_at in self._seen.items() if created_at > horizon}
+        if new:
+            self.interval = self.min_interval
+        else:
+            longest = self.active_interval if self.printing else self.max_interval
+            self.interval = min(longest, max(self.interval * self.backoff, self.min_interval))
+        if self.types is None:
+            return new
+        return [event for event in new if getattr(event.type, "value", event.type) in self.types]
+
+    def _poll_through_errors(self):
+        try:
+            return self.poll()
+        except (formlabs.ApiException, urllib3.exceptions.HTTPError) as e:
+            if isinstance(e, formlabs.ApiException) and e.status != 429 and (e.status or 0) < 500:
+                raise
+            # The cursor only moves after a complete poll, the next one requests the same events again
+            self.interval = min(self.max_interval, max(self.interval * self.backoff, self.min_interval))
+            return []
@@ -0,0 +1,170 @@
+"""\
+Handwritten per-operation instrumentation of the ApiClient
+"""
+from bisect import bisect_left
+import threading
+
+
+class OperationRecord:
+    """Timings and sizes of one API operation, passed to `Instrumentation.record`.
+
+    `wait_seconds` runs from sending the request to receiving the response
+    headers, so it covers the server's processing and a network round trip.
+    `transfer_seconds` is the time spent reading the response body and
+    `deserialize_seconds` the time spent building the response models.
+    """
+
+    __slots__ = (
+        "operation", "method", "url", "status", "wait_seconds", "transfer_seconds", "deserialize_seconds",
+        "request_bytes", "response_bytes", "_received_at",
+    )
+
+    def __init__(self, operation, method, url) -> None:
+        self.operation = operation
+        self.method = method
+        self.url = url
+        self.status = None
+        self.wait_seconds = 0.0
+        self.transfer_seconds = 0.0
+        self.deserialize_seconds = 0.0
+        self.request_bytes = None
+        self.response_bytes = None
+        self._received_at = None
+
+    @property
+    def wire_seconds(self):
+        return self.wait_seconds + self.transfer_seconds
+
+    def __repr__(self):
+        return (
+            f"OperationRecord({self.operation!r}, status={self.status}, wait={self.wait_seconds:.4f}s, "
+            f"transfer={self.transfer_seconds:.4f}s, deserialize={self.deserialize_seconds:.4f}s, "
+            f"request_bytes={self.request_bytes}, response_bytes={self.response_bytes})"
+        )
+
+
+class Instrumentation:
+    """Receives an OperationRecord after every operation of an ApiClient.
+
+    Set an instance as `ApiClient.instrumentation` to enable it. `record` is
+    called from the thread that ran the operation, also when the request
+    failed, in which case `status` is None. Operations called with
+    `_without_preload_content` are recorded once the response headers are
+    received, without `transfer_seconds`, `deserialize_seconds` and
+    `response_bytes`, since the caller reads the response.
+    """
+
+    def record(self, record: OperationRecord) -> None:
+        pass
+
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+
+class Histogram:
+    """Counts of observed values per bucket, with Prometheus `le` bucket semantics"""
+
+    def __init__(self, bounds) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile, inf if it is above the last bound"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class HistogramCollector(Instrumentation):
+    """Instrumentation that keeps histograms per operation and response status.
+
+    Comparing `wait_seconds` with `transfer_seconds` and `deserialize_seconds`
+    tells whether slow operations are bound by the server, the network or the
+    client. `to_prometheus_text` exports all histograms in the Prometheus text
+    exposition format.
+
+    :param seconds_buckets: bucket bounds of the timing histograms.
+    :param bytes_buckets: bucket bounds of the payload size histograms.
+    """
+
+    SECONDS_METRICS = ("wait_seconds", "transfer_seconds", "deserialize_seconds")
+    BYTES_METRICS = ("request_bytes", "response_bytes")
+
+    def __init__(self, seconds_buckets=SECONDS_BUCKETS, bytes_buckets=BYTES_BUCKETS) -> None:
+        self.seconds_buckets = tuple(seconds_buckets)
+        self.bytes_buckets = tuple(bytes_buckets)
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: OperationRecord) -> None:
+        status = "error" if record.status is None else str(record.status)
+        with self._lock:
+            for metric in self.SECONDS_METRICS + self.BYTES_METRICS:
+                value = getattr(record, metric)
+                if value is None:
+                    continue
+                key = (metric, record.operation, status)
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    bounds = self.seconds_buckets if metric in self.SECONDS_METRICS else self.bytes_buckets
+                    histogram = self.histograms[key] = Histogram(bounds)
+                histogram.observe(value)
+
+    def histogram(self, metric, operation, status=None):
+        """Returns the histogram of one metric of an operation, merged over statuses unless one is given"""
+        with self._lock:
+            matching = [
+                histogram for (m, o, s), histogram in self.histograms.items()
+                if m == metric and o == operation and (status is None or s == str(status))
+            ]
+            if not matching:
+                return None
+            merged = Histogram(matching[0].bounds)
+            for histogram in matching:
+                merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+                merged.count += histogram.count
+                merged.sum += histogram.sum
+            return merged
+
+    def to_prometheus_text(self, prefix="formlabs_api"):
+        """Returns all histograms in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for metric in self.SECONDS_METRICS + self.BYTES_METRICS:
+                name = f"{prefix}_{metric}"
+                entries = sorted((key, histogram) for key, histogram in self.histograms.items() if key[0] == metric)
+                if not entries:
+                    continue
+                lines.append(f"# TYPE {name} histogram")
+                for (_, operation, status), histogram in entries:
+                    labels = f'operation="{_escape_label(operation)}",status="{status}"'
+                    cumulative = 0
+                    for bound, count in zip(histogram.bounds, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{labels},le="{_format_number(bound)}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{name}_sum{{{labels}}} {_format_number(histogram.sum)}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
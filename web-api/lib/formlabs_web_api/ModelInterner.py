@@ -0,0 +1,150 @@
+"""\
+Handwritten sharing of equal nested objects between the models of web API responses
+"""
+import threading
+import typing
+from formlabs_web_api.LazyModel import field_defaults, field_plan, strip_optional
+
+
+class ModelInterner:
+    """Deserializes responses with one shared instance for equal nested objects.
+
+    In a page of print runs or events, the same group, user or note appears
+    over and over. Set an instance as `ApiClient.interner` and every nested
+    object of an interned model class is looked up by its JSON value first, so
+    equal objects become the same model instance, within a response and across
+    all responses of the client, e.g. while iterating over pages. The interner
+    keeps the instances it shares, up to `max_size`, and drops the oldest ones
+    beyond it. A class interned by default whose objects turn out to be
+    mostly unique, e.g. because they hold the id of their print run, is no
+    longer interned after `min_lookups` lookups, so that its keys do not take
+    more memory than sharing saves.
+
+    Shared instances are meant to be read only: assigning to a field of one
+    changes it everywhere it is shared. An interner can be used by several
+    threads at once, e.g. by an ApiClient shared between them.
+
+    :param classes: model classes to intern, by default the models with at most
+        `max_fields` fields and no list or dict fields.
+    :param max_fields: field count up to which models are interned by default.
+    :param max_size: number of instances kept for sharing.
+    :param min_lookups: lookups after which a class interned by default is no
+        longer interned if less than `min_hit_ratio` of them found an instance.
+    :param min_hit_ratio: share of the lookups of such a class that have to find an instance.
+    """
+
+    def __init__(self, classes=None, max_fields=8, max_size=100000, min_lookups=1000, min_hit_ratio=0.2) -> None:
+        self.classes = frozenset(classes) if classes is not None else None
+        self.max_fields = max_fields
+        self.max_size = max_size
+        self.min_lookups = min_lookups
+        self.min_hit_ratio = min_hit_ratio
+        self.hits = 0
+        self.misses = 0
+        self._instances = {}
+        self._interned_classes = {}
+        # [hits, misses] of the classes interned by default
+        self._lookups = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._instances)
+
+    def clear(self):
+        """Drops the kept instances, later responses no longer share them"""
+        with self._lock:
+            self._instances.clear()
+
+    def from_dict(self, klass, obj):
+        """Deserializes `obj` into `klass` like `klass.from_dict`, sharing the instances of its nested objects"""
+        plan = field_plan(klass)
+        if plan is None or not isinstance(obj, dict):
+            return klass.from_dict(obj)
+        values = {
+            key: self._nested(obj.get(key), wrap) if wrap is not None else obj.get(key)
+            for key, wrap in plan
+        }
+        for key, default in field_defaults(klass):
+            if values[key] is None:
+                values[key] = default
+        # Validation keeps the model instances given for nested model fields
+        return klass.model_validate(values)
+
+    def _nested(self, value, wrap):
+        if value is None:
+            return None
+        container, klass = wrap
+        if container is list:
+            return [self._model(klass, item) for item in value]
+        if container is dict:
+            return {key: self._model(klass, item) for key, item in value.items()}
+        return self._model(klass, value)
+
+    def _model(self, klass, obj):
+        if not isinstance(obj, dict) or not self._interns(klass):
+            return self.from_dict(klass, obj)
+        key = (klass, _freeze(obj))
+        with self._lock:
+            lookups = self._lookups.get(klass)
+            instance = self._instances.get(key)
+            if instance is not None:
+                self.hits += 1
+                if lookups is not None:
+                    lookups[0] += 1
+                return instance
+            self.misses += 1
+            if lookups is not None:
+                lookups[1] += 1
+                hits, misses = lookups
+                if hits + misses >= self.min_lookups and hits < self.min_hit_ratio * (hits + misses):
+                    self._stop_interning(klass)
+        # Nested objects are looked up while the model is built, so it is built without the lock
+        instance = self.from_dict(klass, obj)
+        with self._lock:
+            if not self._interned_classes[klass]:
+                return instance
+            while len(self._instances) >= self.max_size:
+                del self._instances[next(iter(self._instances))]
+            instance = self._instances.setdefault(key, instance)
+        return instance
+
+    def _interns(self, klass):
+        interned = self._interned_classes.get(klass)
+        if interned is not None:
+            return interned
+        if self.classes is not None:
+            interned = klass in self.classes
+        else:
+            plan = field_plan(klass)
+            interned = (
+                plan is not None
+                and len(plan) <= self.max_fields
+                and not any(
+                    typing.get_origin(strip_optional(field.annotation)) in (list, dict, set)
+                    for field in klass.model_fields.values()
+                )
+            )
+        with self._lock:
+            # Another thread may have decided first, and since stopped interning the class
+            if klass not in self._interned_classes:
+                self._interned_classes[klass] = interned
+                if interned and self.classes is None:
+                    self._lookups[klass] = [0, 0]
+            return self._interned_classes[klass]
+
+    def _stop_interning(self, klass):
+        # Called with the lock held
+        self._interned_classes[klass] = False
+        self._lookups.pop(klass, None)
+        self._instances = {key: instance for key, instance in self._instances.items() if key[0] is not klass}
+
+
+def _freeze(value):
+    """Hashable key of a parsed JSON value, telling apart e.g. 1, 1.0 and True"""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    if isinstance(value, str):
+        return value
+    return (value.__class__, value)
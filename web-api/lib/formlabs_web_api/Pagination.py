@@ -0,0 +1,66 @@
+"""\
+Handwritten iteration over all pages of the web API list operations
+"""
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import math
+
+
+def iterate_all(list_operation, *args, per_page=100, max_concurrency=None, **kwargs):
+    """Yields the results of every page of a paginated list operation, in order.
+
+    e.g. `for run in iterate_all(PrintsApi(client).prints_list, status="FINISHED"): ...`
+
+    The first page reveals `count`, the following pages are then requested
+    concurrently, up to `max_concurrency` pages ahead of the one being
+    yielded, so that pulling a full history takes a few round trips instead
+    of one per page. Closing the generator early cancels the pages not
+    requested yet.
+
+    :param list_operation: list operation of an API instance, e.g. `PrintsApi(client).prints_list`.
+    :param args: path parameters, e.g. the serial of `printers_prints_list`.
+    :param per_page: page size to request.
+    :param max_concurrency: pages requested at once, defaults to the
+        configuration's connection_pool_maxsize.
+    :param kwargs: filters passed to every page request.
+    """
+    first = list_operation(*args, page=1, per_page=per_page, **kwargs)
+    yield from first.results or ()
+    page_count, page_size = count_pages(first)
+    if page_count < 2:
+        return
+    if max_concurrency is None:
+        max_concurrency = list_operation.__self__.api_client.configuration.connection_pool_maxsize
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, page_count - 1)), thread_name_prefix="formlabs_web_api")
+    pending = collections.deque()
+    next_number = 2
+    try:
+        while True:
+            while next_number <= page_count and len(pending) < max_concurrency:
+                pending.append((next_number, executor.submit(list_operation, *args, page=next_number, per_page=per_page, **kwargs)))
+                next_number += 1
+            if not pending:
+                return
+            number, future = pending.popleft()
+            page = future.result()
+            yield from page.results or ()
+            if not page.next:
+                return
+            # Records added since the first page was requested make for more pages
+            page_count = max(page_count, math.ceil(page.count / page_size), number + 1)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def count_pages(first):
+    """Returns the number of pages of a paginated list operation and their size, from its first page.
+
+    The server may cap the page size below the requested `per_page`, so the
+    size of the first page is the one the following pages have.
+    """
+    if not first.next or not first.results:
+        return 1, len(first.results or ())
+    page_size = len(first.results)
+    return math.ceil(first.count / page_size), page_size
@@ -0,0 +1,138 @@
+"""\
+Handwritten client-side rate limiting for the web API
+"""
+from email.utils import parsedate_to_datetime
+import datetime
+import random
+import threading
+import time
+import urllib3
+import formlabs_web_api as formlabs
+
+
+class RateLimiter:
+    """Token bucket that paces requests to a sustained rate.
+
+    Tokens refill continuously at `rate` per second up to `burst`, and every
+    request takes one, so callers queue up and are released evenly instead of
+    sending a burst and then all waiting on the server's rate limit together.
+    After a rate limited response, `pause` holds back every caller until the
+    server's Retry-After has passed.
+
+    :param rate: sustained requests per second.
+    :param burst: requests that may be sent back to back after an idle period.
+    """
+
+    def __init__(self, rate, burst=1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - max(self._updated, self._paused_until)) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Holds back every caller for `seconds`, then resumes from an empty bucket"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class RateLimitedApiClient(formlabs.ApiClient):
+    """ApiClient that paces its requests and retries rate limited ones.
+
+    Every request, including every retry, waits for a token from `rate_limiter`,
+    which is shared by all API classes and threads using this client. A 429
+    response is retried after its Retry-After delay, plus an exponential
+    backoff with full jitter so that clients which were limited together do not
+    retry together. The Retry-After delay also pauses the rate limiter. A 503
+    response may come after the server acted on the request, so it is only
+    retried for the methods in `retry_methods`.
+
+    :param configuration: Configuration of the client.
+    :param rate_limiter: RateLimiter to pace requests with, requests are not paced if None.
+    :param max_retries: retries of a rate limited request before its response is returned.
+    :param backoff: base of the exponential backoff in seconds.
+    :param max_backoff: upper bound of the backoff in seconds.
+    :param retry_methods: methods whose 503 responses are retried.
+    """
+
+    # Retried for every method, the server did not act on the request
+    RETRY_STATUSES = (429,)
+    # Retried for the methods in retry_methods only
+    RETRY_STATUSES_OF_METHODS = (503,)
+
+    def __init__(self, configuration=None, rate_limiter=None, max_retries=5, backoff=0.5, max_backoff=60.0,
+                 retry_methods=("GET", "HEAD", "OPTIONS"), **kwargs) -> None:
+        super().__init__(configuration, **kwargs)
+        self.rate_limiter = rate_limiter
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # urllib3 would otherwise sleep through Retry-After itself, outside of the rate limiter
+        retries = urllib3.Retry.from_int(self.configuration.retries)
+        self.rest_client.pool_manager.connection_pool_kw["retries"] = retries.new(respect_retry_after_header=False)
+
+    def call_api(self, method, url, *args, **kwargs):
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = super().call_api(method, url, *args, **kwargs)
+            if not self._retries(method, response.status) or attempt >= self.max_retries:
+                return response
+            # Read the body so that the connection goes back to the pool
+            response.read()
+            record = getattr(response, "operation_record", None)
+            if record is not None and self.instrumentation is not None:
+                response.operation_record = None
+                record.response_bytes = len(response.data)
+                self.instrumentation.record(record)
+            retry_after = _retry_after_seconds(response.getheader("Retry-After"))
+            if retry_after and self.rate_limiter is not None:
+                self.rate_limiter.pause(retry_after)
+            time.sleep((retry_after or 0) + random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt)))
+            attempt += 1
+
+    def _retries(self, method, status):
+        if status in self.RETRY_STATUSES:
+            return True
+        return status in self.RETRY_STATUSES_OF_METHODS and method.upper() in self.retry_methods
+
+
+def _retry_after_seconds(value):
+    """Parses a Retry-After header given either in seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (moment - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
@@ -89,3 +89,19 @@ from formlabs_web_api.models.workgroup import Workgroup
 from formlabs_web_api.models.workgroup_membership import WorkgroupMembership
 from formlabs_web_api.models.workgroup_settings import WorkgroupSettings
 from formlabs_web_api.models.workgroup_settings_update_mode import WorkgroupSettingsUpdateMode
+
+# START SECTION OF CODE ADDED BY FORMLABS
+from formlabs_web_api.AsyncApi import AsyncApiClient, AsyncCartridgesApi, AsyncEventsApi, AsyncGroupsApi, AsyncPrintersApi, AsyncPrintsApi, AsyncTanksApi, gather_pages
+from formlabs_web_api.RateLimiter import RateLimiter, RateLimitedApiClient
+from formlabs_web_api.Instrumentation import HistogramCollector, Instrumentation, OperationRecord
+from formlabs_web_api.LazyModel import LazyModel, is_materialized
+from formlabs_web_api.UncheckedApi import UncheckedCartridgesApi, UncheckedEventsApi, UncheckedGroupsApi, UncheckedPrintersApi, UncheckedPrintsApi, UncheckedTanksApi, unchecked_api
+from formlabs_web_api.Projection import project, record_type
+from formlabs_web_api.ModelInterner import ModelInterner
+from formlabs_web_api.JsonBackend import JsonBackend
+from formlabs_web_api.ModelPacking import pack_models, unpack_models
+from formlabs_web_api.Pagination import iterate_all
+from formlabs_web_api.SqliteMirror import SqliteMirror
+from formlabs_web_api.EventStream import EventStream
+from formlabs_web_api.FleetSnapshot import FleetSnapshot, FleetSnapshotCache
+from formlabs_web_api.Columnar import iterate_columns, to_arrow, to_numpy, write_parquet
\ No newline at end of file
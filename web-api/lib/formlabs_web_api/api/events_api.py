@@ -131,7 +131,8 @@ class EventsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='events_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -230,7 +231,8 @@ class EventsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='events_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -329,7 +331,9 @@ class EventsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='events_list',
+            _preload_content=False
         )
         return response_data.response
 
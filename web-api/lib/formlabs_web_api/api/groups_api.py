@@ -106,7 +106,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_create'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -173,7 +174,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_create'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -240,7 +242,9 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_create',
+            _preload_content=False
         )
         return response_data.response
 
@@ -380,7 +384,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_destroy'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -447,7 +452,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_destroy'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -514,7 +520,9 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_destroy',
+            _preload_content=False
         )
         return response_data.response
 
@@ -636,7 +644,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -707,7 +716,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -778,7 +788,9 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_list',
+            _preload_content=False
         )
         return response_data.response
 
@@ -914,7 +926,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_create'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -985,7 +998,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_create'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1056,7 +1070,9 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_create',
+            _preload_content=False
         )
         return response_data.response
 
@@ -1203,7 +1219,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_destroy'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1274,7 +1291,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_destroy'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1345,7 +1363,9 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_destroy',
+            _preload_content=False
         )
         return response_data.response
 
@@ -1483,7 +1503,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_update'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1554,7 +1575,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_update'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1625,7 +1647,9 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_members_update',
+            _preload_content=False
         )
         return response_data.response
 
@@ -1772,7 +1796,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_partial_update'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1843,7 +1868,8 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_partial_update'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1914,7 +1940,9 @@ class GroupsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='groups_partial_update',
+            _preload_content=False
         )
         return response_data.response
 
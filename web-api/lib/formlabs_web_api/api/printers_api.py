@@ -105,7 +105,8 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -176,7 +177,8 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -247,7 +249,9 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_list',
+            _preload_content=False
         )
         return response_data.response
 
@@ -419,7 +423,8 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_prints_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -526,7 +531,8 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_prints_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -633,7 +639,9 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_prints_list',
+            _preload_content=False
         )
         return response_data.response
 
@@ -836,7 +844,8 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_retrieve'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -903,7 +912,8 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_retrieve'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -970,7 +980,9 @@ class PrintersApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='printers_retrieve',
+            _preload_content=False
         )
         return response_data.response
 
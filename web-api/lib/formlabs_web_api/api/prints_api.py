@@ -135,7 +135,8 @@ class PrintsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='prints_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -238,7 +239,8 @@ class PrintsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='prints_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -341,7 +343,9 @@ class PrintsApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='prints_list',
+            _preload_content=False
         )
         return response_data.response
 
@@ -102,7 +102,8 @@ class TanksApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='tanks_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -173,7 +174,8 @@ class TanksApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='tanks_list'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -244,7 +246,9 @@ class TanksApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation='tanks_list',
+            _preload_content=False
         )
         return response_data.response
 
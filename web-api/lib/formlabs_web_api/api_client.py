@@ -17,20 +17,25 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
-import json
+import functools
 import mimetypes
 import os
 import re
 import tempfile
+import time
 
-from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from urllib.parse import quote, urlsplit
+from typing import Tuple, Optional, List, Dict, Union, get_args
+from pydantic import BaseModel, SecretStr
 
 from formlabs_web_api.configuration import Configuration
 from formlabs_web_api.api_response import ApiResponse, T as ApiResponseT
 import formlabs_web_api.models
 from formlabs_web_api import rest
+from formlabs_web_api.Instrumentation import OperationRecord
+from formlabs_web_api.JsonBackend import get_json_backend
+from formlabs_web_api.LazyModel import lazy_from_dict
+from formlabs_web_api.ModelConstruct import construct_from_dict
 from formlabs_web_api.exceptions import (
     ApiValueError,
     ApiException,
@@ -43,6 +48,81 @@ from formlabs_web_api.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+
+def _model_serialize_plan(cls):
+    """Serializes generated models like `sanitize_for_serialization(obj.to_dict())` in one pass.
+
+    `to_dict` dumps the model with pydantic, dumps the nested models again
+    with their own `to_dict`, and leaves enums and dates to be converted by a
+    further walk over the result. The plan outputs the same keys, from the
+    `model_fields` of the class and the `read_only_fields` and
+    `nullable_fields` that the model template emits: readOnly fields are left
+    out, except for the fields holding models, which `to_dict` adds back when
+    truthy, and nullable fields are output as None when they were set.
+    Returns None for classes without this metadata, which are serialized with
+    their `to_dict`.
+    """
+    if not issubclass(cls, BaseModel):
+        return None
+    if 'actual_instance' in cls.model_fields:
+        # oneOf models serialize their actual instance
+        return lambda client, obj: client.sanitize_for_serialization(obj.actual_instance)
+    read_only_fields = getattr(cls, 'read_only_fields', None)
+    nullable_fields = getattr(cls, 'nullable_fields', None)
+    if read_only_fields is None or nullable_fields is None or 'additional_properties' in cls.model_fields:
+        return None
+
+    fields = []
+    for name, field in cls.model_fields.items():
+        if name not in read_only_fields:
+            output = _OUTPUT_NOT_NONE
+        elif _holds_models(field.annotation):
+            output = _OUTPUT_TRUTHY
+        else:
+            output = _OUTPUT_NEVER
+        if output != _OUTPUT_NEVER or name in nullable_fields:
+            fields.append((name, field.alias or name, output, name in nullable_fields))
+    fields = tuple(fields)
+
+    def plan(client, obj):
+        values = obj.__dict__
+        obj_dict = {}
+        for name, key, output, nullable in fields:
+            value = values.get(name)
+            if value is None:
+                if nullable and name in obj.model_fields_set:
+                    obj_dict[key] = None
+            elif output == _OUTPUT_NOT_NONE or (output == _OUTPUT_TRUTHY and value):
+                obj_dict[key] = client.sanitize_for_serialization(value)
+        return obj_dict
+    return plan
+
+
+def _holds_models(annotation):
+    """Whether a field annotation holds models, directly or in lists and dicts"""
+    if isinstance(annotation, type):
+        return issubclass(annotation, BaseModel)
+    return any(_holds_models(arg) for arg in get_args(annotation))
+
+_OUTPUT_NEVER, _OUTPUT_NOT_NONE, _OUTPUT_TRUTHY = range(3)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_content_type(content_type: Optional[str]) -> Tuple[str, bool]:
+    """Returns the charset of a content-type header and whether the body can be parsed as JSON bytes."""
+    match = None
+    if content_type is not None:
+        match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
+    encoding = match.group(1) if match else "utf-8"
+    # json and orjson detect UTF-8 themselves, anything else needs decoding first
+    is_utf8_json = (
+        content_type is not None
+        and content_type.startswith("application/json")
+        and encoding.lower() in ("utf-8", "utf8")
+    )
+    return encoding, is_utf8_json
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -72,6 +152,10 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    # Deserialization plans by response type, shared by all clients
+    _deserialize_plans = {}
+    # Serialization plans by class of the serialized object, shared by all clients
+    _serialize_plans = {}
 
     def __init__(
         self,
@@ -93,6 +177,15 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/0.8.0/python'
         self.client_side_validation = configuration.client_side_validation
+        # Instrumentation that receives an OperationRecord after every operation
+        self.instrumentation = None
+        # Deserialize nested models and list items of responses on first attribute access
+        self.lazy_models = False
+        # Build response models without validating them, for data from a trusted server.
+        # Takes precedence over lazy_models.
+        self.trusted_responses = False
+        # ModelInterner sharing equal nested objects between response models
+        self.interner = None
 
     def __enter__(self):
         return self
@@ -255,7 +348,9 @@ class ApiClient:
         header_params=None,
         body=None,
         post_params=None,
-        _request_timeout=None
+        _request_timeout=None,
+        _operation=None,
+        _preload_content=True
     ) -> rest.RESTResponse:
         """Makes the HTTP request (synchronous)
         :param method: Method to call.
@@ -266,9 +361,18 @@ class ApiClient:
         :param post_params dict: Request post form parameters,
             for `application/x-www-form-urlencoded`, `multipart/form-data`.
         :param _request_timeout: timeout setting for this request.
+        :param _operation: id of the operation, recorded by the instrumentation.
+        :param _preload_content: False if the caller reads the response itself,
+            which is then recorded as soon as its headers are received.
         :return: RESTResponse
         """
 
+        instrumentation = self.instrumentation
+        record = None
+        if instrumentation is not None:
+            record = OperationRecord(_operation or method + " " + urlsplit(url).path, method, url)
+            started = time.perf_counter()
+
         try:
             # perform request and return response
             response_data = self.rest_client.request(
@@ -278,9 +382,23 @@ class ApiClient:
                 _request_timeout=_request_timeout
             )
 
-        except ApiException as e:
-            raise e
-
+        except Exception:
+            if record is not None:
+                record.wait_seconds = time.perf_counter() - started
+                instrumentation.record(record)
+            raise
+
+        if record is not None:
+            record._received_at = time.perf_counter()
+            record.wait_seconds = record._received_at - started
+            record.status = response_data.status
+            record.request_bytes = response_data.request_bytes
+            if _preload_content:
+                response_data.operation_record = record
+            else:
+                record.transfer_seconds = None
+                record.deserialize_seconds = None
+                instrumentation.record(record)
         return response_data
 
     def response_deserialize(
@@ -297,6 +415,22 @@ class ApiClient:
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
         assert response_data.data is not None, msg
 
+        record = getattr(response_data, "operation_record", None)
+        if record is None:
+            return self.__response_deserialize(response_data, response_types_map)
+        response_data.operation_record = None
+        started = time.perf_counter()
+        record.transfer_seconds = started - record._received_at
+        record.response_bytes = len(response_data.data)
+        try:
+            return self.__response_deserialize(response_data, response_types_map)
+        finally:
+            record.deserialize_seconds = time.perf_counter() - started
+            instrumentation = self.instrumentation
+            if instrumentation is not None:
+                instrumentation.record(record)
+
+    def __response_deserialize(self, response_data, response_types_map):
         response_type = response_types_map.get(str(response_data.status), None)
         if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
             # if not found, look for '1XX', '2XX', etc.
@@ -311,13 +445,14 @@ class ApiClient:
             elif response_type == "file":
                 return_data = self.__deserialize_file(response_data)
             elif response_type is not None:
-                match = None
                 content_type = response_data.getheader('content-type')
-                if content_type is not None:
-                    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
-                encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                encoding, is_utf8_json = _parse_content_type(content_type)
+                if is_utf8_json:
+                    # Parse the bytes directly, ApiException decodes the body on errors
+                    return_data = self.deserialize(response_data.data, response_type, content_type)
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -351,47 +486,64 @@ class ApiClient:
         """
         if obj is None:
             return None
-        elif isinstance(obj, Enum):
-            return obj.value
-        elif isinstance(obj, SecretStr):
-            return obj.get_secret_value()
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [
-                self.sanitize_for_serialization(sub_obj) for sub_obj in obj
+
+        cls = obj.__class__
+        try:
+            plan = self._serialize_plans[cls]
+        except KeyError:
+            plan = self._serialize_plans[cls] = self.__compile_serialize_plan(cls)
+        return plan(self, obj)
+
+    def __compile_serialize_plan(self, cls):
+        """Returns the function of the ApiClient and an object of class `cls` that serializes it."""
+        if issubclass(cls, Enum):
+            return lambda client, obj: obj.value
+        elif issubclass(cls, SecretStr):
+            return lambda client, obj: obj.get_secret_value()
+        elif issubclass(cls, self.PRIMITIVE_TYPES):
+            return lambda client, obj: obj
+        elif issubclass(cls, list):
+            return lambda client, obj: [
+                client.sanitize_for_serialization(sub_obj) for sub_obj in obj
             ]
-        elif isinstance(obj, tuple):
-            return tuple(
-                self.sanitize_for_serialization(sub_obj) for sub_obj in obj
+        elif issubclass(cls, tuple):
+            return lambda client, obj: tuple(
+                client.sanitize_for_serialization(sub_obj) for sub_obj in obj
             )
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-        elif isinstance(obj, decimal.Decimal):
-            return str(obj)
-
-        elif isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except
-            # attributes `openapi_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
+        elif issubclass(cls, (datetime.datetime, datetime.date)):
+            return lambda client, obj: obj.isoformat()
+        elif issubclass(cls, decimal.Decimal):
+            return lambda client, obj: str(obj)
+        elif issubclass(cls, dict):
+            return lambda client, obj: {
+                key: client.sanitize_for_serialization(val)
+                for key, val in obj.items()
+            }
+
+        model_plan = _model_serialize_plan(cls)
+        if model_plan is not None:
+            return model_plan
+
+        # Convert model obj to dict except
+        # attributes `openapi_types`, `attribute_map`
+        # and attributes which value is not None.
+        # Convert attribute name to json key in
+        # model definition for request.
+        def plan(client, obj):
             if hasattr(obj, 'to_dict') and callable(getattr(obj, 'to_dict')):
                 obj_dict = obj.to_dict()
             else:
                 obj_dict = obj.__dict__
+            return {
+                key: client.sanitize_for_serialization(val)
+                for key, val in obj_dict.items()
+            }
+        return plan
 
-        return {
-            key: self.sanitize_for_serialization(val)
-            for key, val in obj_dict.items()
-        }
-
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(self, response_text: Union[bytes, str], response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body, UTF-8 encoded bytes are parsed without decoding.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -400,16 +552,17 @@ class ApiClient:
         """
 
         # fetch data from response object
+        json_loads = get_json_backend(self.configuration.json_backend).loads
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = json_loads(response_text)
             except ValueError:
                 data = response_text
         elif content_type.startswith("application/json"):
-            if response_text == "":
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = json_loads(response_text)
         elif content_type.startswith("text/plain"):
             data = response_text
         else:
@@ -431,20 +584,44 @@ class ApiClient:
         if data is None:
             return None
 
+        return self.__deserialize_plan(klass)(self, data)
+
+    def __deserialize_plan(self, klass):
+        """Returns the deserialization plan of a type, compiling it on first use.
+
+        A plan is a function of the ApiClient and the non-None data that
+        deserializes the data into `klass`, so that type strings are only
+        parsed and model classes only looked up once per type.
+
+        :param klass: class literal, or string of class name.
+        :return: plan function.
+        """
+        try:
+            return self._deserialize_plans[klass]
+        except KeyError:
+            pass
+        plan = self._deserialize_plans[klass] = self.__compile_deserialize_plan(klass)
+        return plan
+
+    def __compile_deserialize_plan(self, klass):
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                sub_plan = self.__deserialize_plan(m.group(1))
+                return lambda client, data: [
+                    None if sub_data is None else sub_plan(client, sub_data)
+                    for sub_data in data
+                ]
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                sub_plan = self.__deserialize_plan(m.group(2))
+                return lambda client, data: {
+                    k: None if v is None else sub_plan(client, v)
+                    for k, v in data.items()
+                }
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -453,19 +630,19 @@ class ApiClient:
                 klass = getattr(formlabs_web_api.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return lambda client, data: client.__deserialize_primitive(data, klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return lambda client, data: client.__deserialize_object(data)
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return lambda client, data: client.__deserialize_date(data)
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return lambda client, data: client.__deserialize_datetime(data)
         elif klass == decimal.Decimal:
-            return decimal.Decimal(data)
+            return lambda client, data: decimal.Decimal(data)
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            return lambda client, data: client.__deserialize_enum(data, klass)
         else:
-            return self.__deserialize_model(data, klass)
+            return lambda client, data: client.__deserialize_model(data, klass)
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -513,7 +690,7 @@ class ApiClient:
             if isinstance(v, (int, float)):
                 v = str(v)
             if isinstance(v, dict):
-                v = json.dumps(v)
+                v = get_json_backend(self.configuration.json_backend).dumps_str(v)
 
             if k in collection_formats:
                 collection_format = collection_formats[k]
@@ -786,4 +963,10 @@ class ApiClient:
         :return: model object.
         """
 
+        if self.trusted_responses:
+            return construct_from_dict(klass, data)
+        if self.interner is not None:
+            return self.interner.from_dict(klass, data)
+        if self.lazy_models:
+            return lazy_from_dict(klass, data)
         return klass.from_dict(data)
@@ -200,6 +200,12 @@ class Configuration:
         """date format
         """
 
+        self.json_backend = None
+        """JSON backend of request bodies and responses: None for the default,
+           "json", "orjson" or a JsonBackend. The one of the default
+           configuration is also used by the models' to_json and from_json.
+        """
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, field_validator
 from typing import Any, ClassVar, Dict, List, Optional
@@ -34,6 +35,11 @@ class BasicUser(BaseModel):
     last_name: Optional[Annotated[str, Field(strict=True, max_length=150)]] = None
     email: Optional[Annotated[str, Field(strict=True, max_length=254)]] = None
     __properties: ClassVar[List[str]] = ["id", "username", "first_name", "last_name", "email"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "id",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+    ])
 
     @field_validator('username')
     def username_validate_regular_expression(cls, value):
@@ -56,12 +62,21 @@ class BasicUser(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of BasicUser from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of BasicUser from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
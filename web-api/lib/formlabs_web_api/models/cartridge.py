@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr
@@ -49,6 +50,20 @@ class Cartridge(BaseModel):
     created_at: Optional[datetime]
     last_print_date: Optional[datetime]
     __properties: ClassVar[List[str]] = ["serial", "machine_type_id", "material", "initial_volume_ml", "volume_dispensed_ml", "dispense_count", "write_count", "mechanical_version", "manufacture_date", "manufacturer", "display_name", "lot_number", "last_modified", "is_empty", "inside_printer", "connected_group", "created_at", "last_print_date"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "last_modified",
+        "is_empty",
+        "inside_printer",
+        "created_at",
+        "last_print_date",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "material",
+        "dispense_count",
+        "connected_group",
+        "created_at",
+        "last_print_date",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -64,12 +79,21 @@ class Cartridge(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of Cartridge from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of Cartridge from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr
@@ -41,6 +42,24 @@ class CartridgeReadOnly(BaseModel):
     last_print_date: Optional[datetime]
     machine_type_id: MachineTypeIdAdbEnum = Field(description="Available values are: `FORM-1-0` - Form 1   `FORM-1-1` - Form 1+   `FORM-2-0` - Form 2   `FORM-2-1` - Form 2.1   `FORM-3-0` - Form 3   `FORM-3-1` - Form 3   `FORM-3-2` - Form 3+   `DGJR-1-0` - Form 3   `FRML-3-0` - Form 3L   `FRBL-3-0` - Form 3BL   `FRMB-3-0` - Form 3B   `DGSR-1-0` - Form 3L   `FRMB-3-1` - Form 3B+   `PILK-1-0` - Fuse 1   `SIFT-1` - Sift   `UNKNOWN` - Unknown   `PILK-1-1` - Fuse 1   `SIFT-1-0` - Sift   `SIFT-1-1` - Sift   `CURL-1-1` - Cure L   `CURL-1-0` - Cure L   `WSHL-1-0` - Wash L   `FS30-1-0` - Fuse 1+ (30W)   `FS30-1-1` - Fuse 1+ (30W)   `FORM-4-0` - Form 4")
     __properties: ClassVar[List[str]] = ["serial", "material", "initial_volume_ml", "volume_dispensed_ml", "display_name", "is_empty", "inside_printer", "connected_group", "created_at", "last_print_date", "machine_type_id"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "serial",
+        "material",
+        "initial_volume_ml",
+        "volume_dispensed_ml",
+        "is_empty",
+        "inside_printer",
+        "connected_group",
+        "created_at",
+        "last_print_date",
+        "machine_type_id",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "material",
+        "connected_group",
+        "created_at",
+        "last_print_date",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -56,12 +75,21 @@ class CartridgeReadOnly(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CartridgeReadOnly from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of CartridgeReadOnly from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
@@ -45,6 +46,21 @@ class DeveloperAPIMyPrinter(BaseModel):
     firmware_version: StrictStr
     location: Optional[StrictStr] = Field(description="This is a user defined physical location of the printer")
     __properties: ClassVar[List[str]] = ["serial", "machine_type_id", "total_print_time_ms", "total_number_of_prints", "printer_status", "cartridge_status", "tank_status", "group", "previous_print_run", "firmware_version", "location"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "serial",
+        "machine_type_id",
+        "total_print_time_ms",
+        "printer_status",
+        "cartridge_status",
+        "tank_status",
+        "group",
+        "previous_print_run",
+        "firmware_version",
+        "location",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "location",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -60,12 +76,21 @@ class DeveloperAPIMyPrinter(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of DeveloperAPIMyPrinter from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of DeveloperAPIMyPrinter from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
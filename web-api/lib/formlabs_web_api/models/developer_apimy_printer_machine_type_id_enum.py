@@ -14,8 +14,8 @@
 
 
 from __future__ import annotations
-import json
 from enum import Enum
+from formlabs_web_api.JsonBackend import model_json_backend
 from typing_extensions import Self
 
 
@@ -56,6 +56,6 @@ class DeveloperAPIMyPrinterMachineTypeIdEnum(str, Enum):
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of DeveloperAPIMyPrinterMachineTypeIdEnum from a JSON string"""
-        return cls(json.loads(json_str))
+        return cls(model_json_backend().loads(json_str))
 
 
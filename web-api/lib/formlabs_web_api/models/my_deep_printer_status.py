@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
@@ -53,6 +54,21 @@ class MyDeepPrinterStatus(BaseModel):
     printernet_capabilities: Optional[List[Annotated[str, Field(strict=True, max_length=100)]]] = None
     camera_status: Optional[CameraStatusEnum] = None
     __properties: ClassVar[List[str]] = ["status", "last_pinged_at", "hopper_level", "material_credit", "hopper_material", "last_modified", "current_temperature", "current_print_run", "form_cell", "last_printer_cooldown_started", "outer_boundary_offset_corrections", "build_platform_contents", "tank_mixer_state", "ready_to_print", "printer_capabilities", "printernet_capabilities", "camera_status"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "status",
+        "last_modified",
+        "current_print_run",
+        "form_cell",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "last_pinged_at",
+        "hopper_level",
+        "material_credit",
+        "current_temperature",
+        "last_printer_cooldown_started",
+        "outer_boundary_offset_corrections",
+        "printernet_capabilities",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -68,12 +84,21 @@ class MyDeepPrinterStatus(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of MyDeepPrinterStatus from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of MyDeepPrinterStatus from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
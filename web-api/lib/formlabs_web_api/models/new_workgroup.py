@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
@@ -35,6 +36,13 @@ class NewWorkgroup(BaseModel):
     has_fleet_control: Optional[StrictBool] = None
     has_fleet_control_updated_by: Optional[StrictInt] = None
     __properties: ClassVar[List[str]] = ["id", "name", "created_at", "has_fleet_control", "has_fleet_control_updated_by"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "id",
+        "created_at",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "has_fleet_control_updated_by",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -50,12 +58,21 @@ class NewWorkgroup(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of NewWorkgroup from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of NewWorkgroup from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
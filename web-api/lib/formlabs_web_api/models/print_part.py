@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional, Union
@@ -38,6 +39,13 @@ class PrintPart(BaseModel):
     volume_ml: Optional[Union[StrictFloat, StrictInt]] = None
     prepared_scene: StrictStr
     __properties: ClassVar[List[str]] = ["id", "guid", "display_name", "end_layer", "name", "raw_mesh_hash", "start_layer", "volume_ml", "prepared_scene"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "id",
+        "guid",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "raw_mesh_hash",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -53,12 +61,21 @@ class PrintPart(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of PrintPart from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of PrintPart from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
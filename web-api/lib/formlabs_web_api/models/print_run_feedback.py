@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
@@ -36,6 +37,13 @@ class PrintRunFeedback(BaseModel):
     issue_description: Optional[StrictStr] = None
     form_file_exists: StrictBool
     __properties: ClassVar[List[str]] = ["print_run", "created_at", "issue_category", "issue_subcategory", "issue_description", "form_file_exists"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "created_at",
+        "form_file_exists",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "created_at",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -51,12 +59,21 @@ class PrintRunFeedback(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of PrintRunFeedback from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of PrintRunFeedback from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
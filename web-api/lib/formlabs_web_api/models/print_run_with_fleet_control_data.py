@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, StrictBool, StrictFloat, StrictInt, StrictStr
@@ -81,6 +82,68 @@ class PrintRunWithFleetControlData(BaseModel):
     harvest_status: Optional[HarvestStatusEnum]
     parts: List[PrintPart]
     __properties: ClassVar[List[str]] = ["guid", "name", "printer", "status", "using_open_mode", "z_height_offset_mm", "print_started_at", "print_finished_at", "layer_count", "volume_ml", "material", "layer_thickness_mm", "currently_printing_layer", "estimated_duration_ms", "elapsed_duration_ms", "estimated_time_remaining_ms", "created_at", "print_run_success", "feedback", "firmware_version", "cartridge", "front_cartridge", "back_cartridge", "tank", "cylinder", "note", "print_thumbnail", "post_print_photo_url", "user", "user_custom_label", "group", "adaptive_thickness", "probably_finished", "message", "print_job", "material_name", "print_settings_name", "print_settings_code", "cloud_queue_item", "form_auto_serial", "form_auto_fw_version", "harvest_status", "parts"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "printer",
+        "status",
+        "using_open_mode",
+        "z_height_offset_mm",
+        "print_started_at",
+        "print_finished_at",
+        "layer_count",
+        "volume_ml",
+        "material",
+        "layer_thickness_mm",
+        "currently_printing_layer",
+        "estimated_duration_ms",
+        "elapsed_duration_ms",
+        "estimated_time_remaining_ms",
+        "created_at",
+        "print_run_success",
+        "feedback",
+        "firmware_version",
+        "cartridge",
+        "front_cartridge",
+        "back_cartridge",
+        "tank",
+        "cylinder",
+        "note",
+        "print_thumbnail",
+        "post_print_photo_url",
+        "user",
+        "user_custom_label",
+        "group",
+        "adaptive_thickness",
+        "probably_finished",
+        "message",
+        "print_job",
+        "material_name",
+        "print_settings_name",
+        "print_settings_code",
+        "cloud_queue_item",
+        "form_auto_serial",
+        "form_auto_fw_version",
+        "parts",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "using_open_mode",
+        "z_height_offset_mm",
+        "print_started_at",
+        "print_finished_at",
+        "material",
+        "firmware_version",
+        "cartridge",
+        "front_cartridge",
+        "back_cartridge",
+        "tank",
+        "cylinder",
+        "post_print_photo_url",
+        "message",
+        "print_job",
+        "cloud_queue_item",
+        "form_auto_serial",
+        "form_auto_fw_version",
+        "harvest_status",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -96,12 +159,21 @@ class PrintRunWithFleetControlData(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of PrintRunWithFleetControlData from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of PrintRunWithFleetControlData from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -16,7 +16,8 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from formlabs_web_api.JsonBackend import model_json_backend
+from formlabs_web_api.ModelPacking import pack, unpack
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, StrictBool, StrictInt, StrictStr
@@ -44,6 +45,24 @@ class UserEventReadOnly(BaseModel):
     was_read: StrictBool
     group: PrinterGroup
     __properties: ClassVar[List[str]] = ["id", "printer", "created_at", "print_run", "tank", "cartridge", "type", "type_label", "action", "message", "was_read", "group"]
+    read_only_fields: ClassVar[Set[str]] = set([
+        "id",
+        "printer",
+        "created_at",
+        "print_run",
+        "tank",
+        "cartridge",
+        "type",
+        "type_label",
+        "action",
+        "message",
+        "was_read",
+    ])
+    nullable_fields: ClassVar[Set[str]] = set([
+        "printer",
+        "tank",
+        "cartridge",
+    ])
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -59,12 +78,21 @@ class UserEventReadOnly(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return model_json_backend().dumps_str(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of UserEventReadOnly from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(model_json_backend().loads(json_str))
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of the model, see ModelPacking"""
+        return pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional[Self]:
+        """Create an instance of UserEventReadOnly from its compact binary representation"""
+        return unpack(data, cls)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -14,13 +14,13 @@
 
 
 import io
-import json
 import re
 import ssl
 
 import urllib3
 
 from formlabs_web_api.exceptions import ApiException, ApiValueError
+from formlabs_web_api.JsonBackend import get_json_backend
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
@@ -36,13 +36,22 @@ def is_socks_proxy_url(url):
         return split_section[0].lower() in SUPPORTED_SOCKS_PROXIES
 
 
+def _body_size(body):
+    """Returns the size in bytes of a request body as urllib3 sends it"""
+    if body is None:
+        return 0
+    return len(body.encode("utf-8") if isinstance(body, str) else body)
+
+
 class RESTResponse(io.IOBase):
 
-    def __init__(self, resp) -> None:
+    def __init__(self, resp, request_bytes=None) -> None:
         self.response = resp
         self.status = resp.status
         self.reason = resp.reason
         self.data = None
+        # Size of the request body, None for form data encoded by urllib3
+        self.request_bytes = request_bytes
 
     def read(self):
         if self.data is None:
@@ -61,6 +70,7 @@ class RESTResponse(io.IOBase):
 class RESTClientObject:
 
     def __init__(self, configuration) -> None:
+        self.configuration = configuration
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -167,6 +177,7 @@ class RESTClientObject:
                     read=_request_timeout[1]
                 )
 
+        request_bytes = None
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
@@ -179,7 +190,8 @@ class RESTClientObject:
                 ):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = get_json_backend(self.configuration.json_backend).dumps(body)
+                    request_bytes = _body_size(request_body)
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -204,7 +216,7 @@ class RESTClientObject:
                     # overwritten.
                     del headers['Content-Type']
                     # Ensures that dict objects are serialized
-                    post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a,b) for a, b in post_params]
+                    post_params = [(a, get_json_backend(self.configuration.json_backend).dumps_str(b)) if isinstance(b, dict) else (a,b) for a, b in post_params]
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -218,6 +230,7 @@ class RESTClientObject:
                 # other content types than JSON when `body` argument is
                 # provided in serialized form.
                 elif isinstance(body, str) or isinstance(body, bytes):
+                    request_bytes = _body_size(body)
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -228,6 +241,7 @@ class RESTClientObject:
                     )
                 elif headers['Content-Type'] == 'text/plain' and isinstance(body, bool):
                     request_body = "true" if body else "false"
+                    request_bytes = _body_size(request_body)
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -243,6 +257,7 @@ class RESTClientObject:
                     raise ApiException(status=0, reason=msg)
             # For `GET`, `HEAD`
             else:
+                request_bytes = 0
                 r = self.pool_manager.request(
                     method,
                     url,
@@ -255,4 +270,4 @@ class RESTClientObject:
             msg = "\n".join([type(e).__name__, str(e)])
             raise ApiException(status=0, reason=msg)
 
-        return RESTResponse(r)
+        return RESTResponse(r, request_bytes)
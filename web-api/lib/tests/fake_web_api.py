@@ -0,0 +1,286 @@
+# coding: utf-8
+
+"""\
+In-process stand-in for api.formlabs.com used by the handwritten tests.
+
+Records are plain dicts shaped like the real API responses. FakeWebApi serves
+them with the same paginated envelopes, `page`/`per_page` parameters and the
+`date__gt`, `printer`, `type` and `status` filters.
+"""
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import formlabs_web_api
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def isoformat(moment):
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def make_group(index=0):
+    return {"id": f"00000000-0000-0000-0000-{index:012d}", "name": f"Group {index}"}
+
+
+def make_user(index=0):
+    return {"id": index + 1, "username": f"user{index}", "first_name": "Ada", "last_name": "Lovelace", "email": f"user{index}@example.com"}
+
+
+def make_print_run(index, printer="Form4-Alpha", created_at=None, group=0, status="FINISHED"):
+    created_at = created_at or EPOCH + timedelta(minutes=index)
+    guid = f"print-{index:08d}"
+    return {
+        "guid": guid,
+        "name": f"Job {index}",
+        "printer": printer,
+        "status": status,
+        "using_open_mode": False,
+        "z_height_offset_mm": 0.0,
+        "print_started_at": isoformat(created_at),
+        "print_finished_at": isoformat(created_at + timedelta(hours=2)),
+        "layer_count": 1000 + index % 50,
+        "volume_ml": 12.5 + index % 7,
+        "material": "FLGPGR05",
+        "layer_thickness_mm": 0.05,
+        "currently_printing_layer": 1000 + index % 50,
+        "estimated_duration_ms": 7200000,
+        "elapsed_duration_ms": 7100000 + index,
+        "estimated_time_remaining_ms": 0,
+        "created_at": isoformat(created_at),
+        "print_run_success": {"print_run": guid, "print_run_success": "SUCCESS", "created_at": isoformat(created_at)},
+        "feedback": {"print_run": guid, "created_at": None, "form_file_exists": True},
+        "firmware_version": "1.2.3",
+        "cartridge": "CART-1",
+        "front_cartridge": None,
+        "back_cartridge": None,
+        "tank": "TANK-1",
+        "cylinder": None,
+        "note": {"print_run": guid, "note": "", "author": make_user(0), "updated_at": isoformat(created_at)},
+        "print_thumbnail": {"thumbnail": f"https://example.com/{guid}.png"},
+        "post_print_photo_url": None,
+        "user": make_user(0),
+        "user_custom_label": "",
+        "group": make_group(group),
+        "adaptive_thickness": False,
+        "probably_finished": True,
+        "message": None,
+        "print_job": None,
+        "material_name": "Grey V5",
+        "print_settings_name": "Default",
+        "print_settings_code": "DEFAULT",
+        "cloud_queue_item": None,
+        "form_auto_serial": None,
+        "form_auto_fw_version": None,
+        "harvest_status": None,
+        "parts": [
+            {"id": index * 10 + part, "guid": f"{guid}-part-{part}", "display_name": f"Part {part}", "prepared_scene": "scene"}
+            for part in range(2)
+        ],
+    }
+
+
+def make_event(index, type="PRINT_FINISHED", printer="Form4-Alpha", created_at=None):
+    created_at = created_at or EPOCH + timedelta(minutes=index)
+    print_run = make_print_run(index, printer=printer, created_at=created_at)
+    del print_run["cloud_queue_item"], print_run["parts"]
+    return {
+        "id": index + 1,
+        "printer": printer,
+        "created_at": isoformat(created_at),
+        "print_run": print_run,
+        "tank": "TANK-1",
+        "cartridge": "CART-1",
+        "type": type,
+        "type_label": type.replace("_", " ").title(),
+        "action": "",
+        "message": f"Event {index}",
+        "was_read": False,
+        "group": make_group(0),
+    }
+
+
+def make_tank(index, material="FLGPGR05", printer=""):
+    return {
+        "serial": f"TANK-{index}",
+        "material": material,
+        "layers_printed": 100 * index,
+        "print_time_ms": 3600000 * index,
+        "heatmap_gif": None,
+        "layer_count": 100 * index,
+        "last_modified": isoformat(EPOCH + timedelta(days=index)),
+        "inside_printer": printer,
+        "created_at": isoformat(EPOCH),
+        "last_print_date": isoformat(EPOCH + timedelta(days=index)),
+    }
+
+
+def make_cartridge(index, material="FLGPGR05", printer=""):
+    return {
+        "serial": f"CART-{index}",
+        "machine_type_id": "FORM-3-0",
+        "material": material,
+        "initial_volume_ml": 1000.0,
+        "volume_dispensed_ml": 10.0 * index,
+        "last_modified": isoformat(EPOCH + timedelta(days=index)),
+        "is_empty": False,
+        "inside_printer": printer,
+        "created_at": isoformat(EPOCH),
+        "last_print_date": isoformat(EPOCH + timedelta(days=index)),
+    }
+
+
+def make_printer(index, status="IDLE", group=0, material="FLGPGR05", machine_type_id="FORM-3-0"):
+    serial = f"Printer-{index}"
+    tank = make_tank(index, material=material, printer=serial)
+    cartridge = make_cartridge(index, material=material, printer=serial)
+    current_print_run = make_print_run(index, printer=serial)
+    del current_print_run["cloud_queue_item"], current_print_run["parts"]
+    return {
+        "serial": serial,
+        "machine_type_id": machine_type_id,
+        "total_print_time_ms": 1000 * index,
+        "total_number_of_prints": index,
+        "printer_status": {
+            "status": status,
+            "last_modified": isoformat(EPOCH),
+            "current_print_run": current_print_run,
+            "form_cell": {"serial": "", "firmware_version": "", "status": "", "rotation": ""},
+        },
+        "cartridge_status": {"cartridge": {
+            k: cartridge[k] for k in ("serial", "material", "initial_volume_ml", "volume_dispensed_ml", "is_empty", "inside_printer", "created_at", "last_print_date", "machine_type_id")
+        } | {"connected_group": None}, "last_modified": isoformat(EPOCH)},
+        "tank_status": {"tank": {
+            k: tank[k] for k in ("serial", "material", "print_time_ms", "layers_printed", "heatmap_gif", "layer_count", "inside_printer", "created_at", "last_print_date")
+        } | {"first_fill_date": None, "tank_type": None, "connected_group": None}, "last_modified": isoformat(EPOCH)},
+        "group": make_group(group),
+        "previous_print_run": {},
+        "firmware_version": "1.2.3",
+        "location": None,
+    }
+
+
+class FakeWebApi:
+    """Serves lists of records on a free localhost port, use as a context manager.
+
+    :param latency: seconds each response is delayed by, to make concurrency measurable.
+    :param rate_limit_every: answer every n-th request with 429 and a Retry-After header.
+    :param max_per_page: largest page size served, smaller than the requested `per_page` if needed.
+    """
+
+    def __init__(self, prints=(), events=(), printers=(), tanks=(), cartridges=(), groups=(), latency=0.0, rate_limit_every=None, retry_after="0", max_per_page=None):
+        self.collections = {
+            "prints": list(prints),
+            "events": list(events),
+            "printers": list(printers),
+            "tanks": list(tanks),
+            "cartridges": list(cartridges),
+            "groups": list(groups),
+        }
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.max_per_page = max_per_page
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    def __enter__(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("localhost", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def host(self):
+        return f"http://localhost:{self._server.server_address[1]}"
+
+    def api_client(self, **configuration_kwargs):
+        configuration = formlabs_web_api.Configuration(host=self.host, **configuration_kwargs)
+        return formlabs_web_api.ApiClient(configuration)
+
+    def _handle(self, handler):
+        with self._lock:
+            self.requests.append(handler.path)
+            count = len(self.requests)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if self.rate_limit_every and count % self.rate_limit_every == 0:
+                self._send(handler, 429, {"detail": "Request was throttled."}, {"Retry-After": self.retry_after})
+                return
+            status, payload = self._route(urlsplit(handler.path))
+            self._send(handler, status, payload)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _send(self, handler, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _route(self, url):
+        parts = [part for part in url.path.split("/") if part][2:]
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if not parts or parts[0] not in self.collections:
+            return 404, {"detail": "Not found."}
+        records = self.collections[parts[0]]
+        if parts[0] == "printers" and len(parts) >= 2:
+            printer = next((p for p in records if p["serial"] == parts[1]), None)
+            if printer is None:
+                return 404, {"detail": "Not found."}
+            if len(parts) == 2:
+                return 200, printer
+            records = [p for p in self.collections["prints"] if p["printer"] == parts[1]]
+        return self._page(url.path, self._filter(records, query), query)
+
+    def _filter(self, records, query):
+        if "date__gt" in query:
+            threshold = datetime.fromisoformat(query["date__gt"].replace("Z", "+00:00"))
+            records = [r for r in records if datetime.fromisoformat(r["created_at"].replace("Z", "+00:00")) > threshold]
+        for key in ("printer", "type", "status"):
+            if key in query:
+                records = [r for r in records if r.get(key) == query[key]]
+        return records
+
+    def _page(self, path, records, query):
+        page = int(query.get("page", 1))
+        per_page = int(query.get("per_page", 100))
+        if self.max_per_page is not None:
+            per_page = min(per_page, self.max_per_page)
+        page_count = max(1, math.ceil(len(records) / per_page))
+        if page > page_count:
+            return 404, {"detail": "Invalid page."}
+        return 200, {
+            "count": len(records),
+            "next": f"{self.host}{path}?page={page + 1}&per_page={per_page}" if page < page_count else None,
+            "previous": f"{self.host}{path}?page={page - 1}&per_page={per_page}" if page > 1 else None,
+            "results": records[(page - 1) * per_page:page * per_page],
+        }
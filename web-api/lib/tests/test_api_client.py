@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import json
+import unittest
+
+import urllib3
+
+from formlabs_web_api import ApiClient, models, rest
+from formlabs_web_api.exceptions import NotFoundException
+from tests.fake_web_api import make_print_run, make_tank
+
+
+def make_response(body, status=200, content_type="application/json"):
+    response = rest.RESTResponse(urllib3.HTTPResponse(
+        body=body, status=status, headers={"Content-Type": content_type}, preload_content=True,
+    ))
+    response.read()
+    return response
+
+
+class TestApiClient(unittest.TestCase):
+    """ApiClient response decoding unit test"""
+
+    def setUp(self) -> None:
+        self.client = ApiClient()
+
+    def test_json_bytes_are_deserialized(self) -> None:
+        page = {"count": 2, "next": None, "previous": None, "results": [make_tank(1, material="Résine"), make_tank(2)]}
+        body = json.dumps(page, ensure_ascii=False).encode("utf-8")
+        tanks = self.client.response_deserialize(make_response(body), {"200": "PaginatedTankList"}).data
+        self.assertEqual([tank.serial for tank in tanks.results], ["TANK-1", "TANK-2"])
+        self.assertEqual(tanks.results[0].material, "Résine")
+
+    def test_other_charsets_are_decoded_first(self) -> None:
+        page = {"count": 1, "next": None, "previous": None, "results": [make_tank(1, material="Résine")]}
+        body = json.dumps(page, ensure_ascii=False).encode("latin-1")
+        response = make_response(body, content_type="application/json; charset=latin-1")
+        tanks = self.client.response_deserialize(response, {"200": "PaginatedTankList"}).data
+        self.assertEqual(tanks.results[0].material, "Résine")
+
+    def test_error_body_is_decoded(self) -> None:
+        response = make_response(b'{"detail": "Not found."}', status=404)
+        with self.assertRaises(NotFoundException) as raised:
+            self.client.response_deserialize(response, {"200": "PaginatedTankList"})
+        self.assertEqual(raised.exception.body, '{"detail": "Not found."}')
+
+    def test_deserialize_plans_are_reused(self) -> None:
+        body = b'[{"id": 1, "username": "ada"}, null]'
+        first = self.client.response_deserialize(make_response(body), {"200": "List[BasicUser]"}).data
+        plan = ApiClient._deserialize_plans["List[BasicUser]"]
+        second = ApiClient().response_deserialize(make_response(body), {"200": "List[BasicUser]"}).data
+        self.assertIs(ApiClient._deserialize_plans["List[BasicUser]"], plan)
+        self.assertEqual(first, second)
+        self.assertEqual(first[0].username, "ada")
+        self.assertIsNone(first[1])
+
+    def test_nested_container_types(self) -> None:
+        response = make_response(b'{"a": [1, 2], "b": null, "c": ["3"]}')
+        data = self.client.response_deserialize(response, {"200": "Dict[str, List[int]]"}).data
+        self.assertEqual(data, {"a": [1, 2], "b": None, "c": [3]})
+
+    def test_models_serialize_like_to_dict(self) -> None:
+        run = models.PrintRunWithFleetControlData.from_dict(make_print_run(1))
+        tank = models.Tank.from_dict(make_tank(1))
+        tank.heatmap_gif = None
+        serialized = self.client.sanitize_for_serialization([run, tank])
+        # readOnly fields are left out, except nested models and nullable fields set to None
+        self.assertNotIn("status", serialized[0])
+        self.assertEqual(serialized[0]["user"]["username"], "user0")
+        self.assertEqual(serialized[0]["parts"][1]["display_name"], "Part 1")
+        self.assertEqual(serialized[1]["serial"], "TANK-1")
+        self.assertIsNone(serialized[1]["heatmap_gif"])
+        self.assertNotIn("created_at", serialized[1])
+        self.assertEqual(serialized[0]["print_run_success"]["print_run_success"], "SUCCESS")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# coding: utf-8
+
+import inspect
+import unittest
+
+from formlabs_web_api import PrintsApi
+from formlabs_web_api.AsyncApi import AsyncApiClient, AsyncPrintersApi, AsyncPrintsApi, gather_pages
+from tests.fake_web_api import FakeWebApi, make_print_run, make_printer
+
+
+class TestAsyncApi(unittest.TestCase):
+    """Async web API classes unit test"""
+
+    def test_every_operation_is_awaitable(self) -> None:
+        for name in ("prints_list", "prints_list_with_http_info"):
+            self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncPrintsApi, name)), name)
+            self.assertEqual(getattr(AsyncPrintsApi, name).__doc__, getattr(PrintsApi, name).__doc__)
+        self.assertFalse(hasattr(AsyncPrintsApi, "prints_list_without_preload_content"))
+
+    def test_api_classes_without_a_client_share_the_default_one(self) -> None:
+        self.assertIs(AsyncPrintsApi().async_client, AsyncApiClient.get_default())
+        self.assertIs(AsyncPrintersApi().async_client, AsyncApiClient.get_default())
+
+
+class TestAsyncApiAgainstServer(unittest.IsolatedAsyncioTestCase):
+    """Async web API classes against a fake server unit test"""
+
+    async def test_gather_pages_fetches_pages_concurrently_in_order(self) -> None:
+        prints = [make_print_run(index) for index in range(45)]
+        with FakeWebApi(prints=prints, latency=0.05) as server:
+            async with AsyncApiClient(server.api_client(), max_concurrency=4) as client:
+                results = await gather_pages(AsyncPrintsApi(client).prints_list, per_page=10)
+        self.assertEqual([run.guid for run in results], [run["guid"] for run in prints])
+        self.assertEqual(len(server.requests), 5)
+        self.assertGreater(server.max_in_flight, 1)
+        self.assertLessEqual(server.max_in_flight, 4)
+
+    async def test_gather_pages_uses_the_page_size_of_the_server(self) -> None:
+        prints = [make_print_run(index) for index in range(45)]
+        with FakeWebApi(prints=prints, max_per_page=10) as server:
+            async with AsyncApiClient(server.api_client()) as client:
+                results = await gather_pages(AsyncPrintsApi(client).prints_list, per_page=25)
+        self.assertEqual([run.guid for run in results], [run["guid"] for run in prints])
+        self.assertEqual(len(server.requests), 5)
+
+    async def test_api_classes_share_the_client(self) -> None:
+        with FakeWebApi(printers=[make_printer(1)], prints=[make_print_run(1, printer="Printer-1")]) as server:
+            async with AsyncApiClient(server.api_client()) as client:
+                printer = await AsyncPrintersApi(client).printers_retrieve("Printer-1")
+                prints = await gather_pages(AsyncPrintsApi(client).prints_list, printer="Printer-1")
+        self.assertEqual(printer.serial, "Printer-1")
+        self.assertEqual([run.printer for run in prints], ["Printer-1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
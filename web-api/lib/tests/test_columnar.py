@@ -0,0 +1,98 @@
+# coding: utf-8
+
+import datetime
+import os
+import tempfile
+import unittest
+
+from formlabs_web_api import PrintersApi, PrintsApi
+from formlabs_web_api.Columnar import column_specs, iterate_columns, to_arrow, to_numpy, write_parquet
+from tests.fake_web_api import EPOCH, FakeWebApi, make_print_run
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+COLUMNS = ("guid", "printer", "status", "material", "volume_ml", "layer_count", "print_finished_at", "created_at", "group.name")
+
+
+class TestColumnar(unittest.TestCase):
+    """Columnar export unit test"""
+
+    def setUp(self) -> None:
+        prints = [make_print_run(index, printer=f"Form4-{index % 3}", status="ERROR" if index % 4 == 0 else "FINISHED") for index in range(25)]
+        prints[3]["print_finished_at"] = None
+        prints[3]["material"] = None
+        self.server = FakeWebApi(prints=prints)
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.prints_list = PrintsApi(self.server.api_client()).prints_list
+
+    def test_column_specs(self) -> None:
+        specs = dict((column, (kind, nullable)) for column, kind, nullable in column_specs(self.prints_list, COLUMNS))
+        self.assertEqual(specs["status"], ("enum", False))
+        self.assertEqual(specs["volume_ml"], ("float", False))
+        self.assertEqual(specs["print_finished_at"], ("datetime", True))
+        self.assertEqual(specs["group.name"], ("str", False))
+        default = [column for column, _, _ in column_specs(self.prints_list)]
+        self.assertIn("elapsed_duration_ms", default)
+        self.assertNotIn("parts", default)
+        with self.assertRaisesRegex(ValueError, "does not hold single values"):
+            column_specs(self.prints_list, ["parts"])
+        with self.assertRaisesRegex(ValueError, "has no field group.size"):
+            column_specs(self.prints_list, ["group.size"])
+
+    def test_iterate_columns_in_batches(self) -> None:
+        batches = list(iterate_columns(self.prints_list, columns=COLUMNS, batch_size=10, per_page=4, printer="Form4-1"))
+        self.assertEqual([len(batch["guid"]) for batch in batches], [8])
+        batches = list(iterate_columns(self.prints_list, columns=COLUMNS, batch_size=10, per_page=4))
+        self.assertEqual([len(batch["guid"]) for batch in batches], [10, 10, 5])
+        first = batches[0]
+        self.assertEqual(first["status"][:2], ["ERROR", "FINISHED"])
+        self.assertEqual(first["volume_ml"][1], 13.5)
+        self.assertIsInstance(first["volume_ml"][0], float)
+        self.assertEqual(first["created_at"][2], EPOCH + datetime.timedelta(minutes=2))
+        self.assertIsNone(first["print_finished_at"][3])
+        self.assertEqual(first["group.name"][0], "Group 0")
+
+    @unittest.skipUnless(numpy, "needs numpy")
+    def test_to_numpy(self) -> None:
+        array = to_numpy(self.prints_list, columns=COLUMNS, batch_size=7, per_page=5)
+        self.assertEqual(len(array), 25)
+        self.assertEqual(array.dtype["layer_count"], numpy.dtype("i8"))
+        self.assertEqual(array["volume_ml"][(array["status"] == "ERROR")].sum(), sum(12.5 + index % 7 for index in range(0, 25, 4)))
+        self.assertEqual(array["created_at"][1], numpy.datetime64("2024-01-01T00:01:00"))
+        self.assertTrue(numpy.isnat(array["print_finished_at"][3]))
+        empty = to_numpy(self.prints_list, columns=COLUMNS, printer="Form2")
+        self.assertEqual((len(empty), empty.dtype), (0, array.dtype))
+
+    @unittest.skipUnless(pyarrow, "needs pyarrow")
+    def test_to_arrow_and_parquet(self) -> None:
+        table = to_arrow(self.prints_list, columns=COLUMNS, batch_size=10, per_page=5)
+        self.assertEqual(table.num_rows, 25)
+        self.assertEqual(table.schema.field("status").type, pyarrow.dictionary(pyarrow.int32(), pyarrow.string()))
+        self.assertEqual(table.schema.field("created_at").type, pyarrow.timestamp("us", tz="UTC"))
+        self.assertEqual(table.column("material").null_count, 1)
+        self.assertEqual(table.column("guid").to_pylist(), [f"print-{index:08d}" for index in range(25)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "prints.parquet")
+            self.assertEqual(write_parquet(path, self.prints_list, columns=COLUMNS, batch_size=10, per_page=5), 25)
+            parquet = pyarrow.parquet.ParquetFile(path)
+            self.assertEqual(parquet.metadata.num_row_groups, 3)
+            self.assertTrue(parquet.read().cast(table.schema).equals(table))
+
+    def test_path_parameters(self) -> None:
+        self.server.collections["printers"].append({"serial": "Form4-2"})
+        batches = list(iterate_columns(PrintersApi(self.server.api_client()).printers_prints_list, "Form4-2", columns=["guid"]))
+        self.assertEqual(len(batches[0]["guid"]), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
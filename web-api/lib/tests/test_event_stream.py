@@ -0,0 +1,113 @@
+# coding: utf-8
+
+import asyncio
+import datetime
+import threading
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+from formlabs_web_api.EventStream import EventStream
+from tests.fake_web_api import EPOCH, FakeWebApi, make_event
+
+
+class TestEventStream(unittest.TestCase):
+    """EventStream unit test"""
+
+    def setUp(self) -> None:
+        self.server = FakeWebApi(events=[make_event(index) for index in range(5)])
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+    def stream(self, **kwargs):
+        kwargs.setdefault("since", EPOCH - datetime.timedelta(minutes=1))
+        return EventStream(self.server.api_client(), per_page=2, **kwargs)
+
+    def test_polls_yield_each_event_once(self) -> None:
+        stream = self.stream(overlap=datetime.timedelta(minutes=10), min_interval=1, active_interval=3, max_interval=5)
+        self.assertEqual([event.id for event in stream.poll()], [1, 2, 3, 4, 5])
+        self.assertEqual(stream.interval, 1)
+        self.server.requests.clear()
+        # The overlap lists every event again
+        self.assertEqual(stream.poll(), [])
+        self.assertEqual(parse_qs(urlsplit(self.server.requests[0]).query)["date__gt"], ["2023-12-31T23:54:00.000000+0000"])
+        self.assertEqual(stream.interval, 2)
+        self.assertEqual(stream.poll(), [])
+        self.assertEqual(stream.poll(), [])
+        self.assertEqual(stream.interval, 5)
+        self.server.collections["events"].insert(0, make_event(5))
+        self.assertEqual([event.id for event in stream.poll()], [6])
+        self.assertEqual(stream.interval, 1)
+        self.assertEqual(stream.cursor, EPOCH + datetime.timedelta(minutes=5))
+
+    def test_backs_off_less_while_printing(self) -> None:
+        stream = self.stream(types=["PRINT_FINISHED"], min_interval=1, active_interval=3, max_interval=60)
+        stream.poll()
+        self.server.collections["events"].append(make_event(5, type="PRINT_START", printer="Form4-Beta"))
+        self.assertEqual(stream.poll(), [])
+        self.assertEqual(stream.printing, {"Form4-Beta"})
+        for _ in range(4):
+            stream.poll()
+        self.assertEqual(stream.interval, 3)
+        self.server.collections["events"].append(make_event(6, printer="Form4-Beta"))
+        self.assertEqual([event.id for event in stream.poll()], [7])
+        self.assertEqual(stream.printing, set())
+        for _ in range(4):
+            stream.poll()
+        self.assertEqual(stream.interval, 16)
+
+    def test_iterators(self) -> None:
+        stream = self.stream(min_interval=0.01, active_interval=0.01, max_interval=0.01)
+        events = []
+        for event in stream:
+            events.append(event.id)
+            if len(events) == 5:
+                self.server.collections["events"].append(make_event(5))
+            if len(events) == 6:
+                stream.close()
+        self.assertEqual(events, [1, 2, 3, 4, 5, 6])
+
+        async def consume():
+            stream = self.stream(min_interval=0.01, active_interval=0.01, max_interval=0.01)
+            async for event in stream:
+                if event.id == 6:
+                    stream.close()
+            return stream.cursor
+
+        self.assertEqual(asyncio.run(consume()), EPOCH + datetime.timedelta(minutes=5))
+
+    def test_iterators_resume_after_transient_errors(self) -> None:
+        def throttle_for_a_while():
+            self.server.rate_limit_every = 1
+            timer = threading.Timer(0.2, setattr, (self.server, "rate_limit_every", None))
+            timer.start()
+            self.addCleanup(timer.cancel)
+
+        throttle_for_a_while()
+        stream = self.stream(min_interval=0.01, active_interval=0.05, max_interval=0.05)
+        events = []
+        for event in stream:
+            events.append(event.id)
+            if len(events) == 5:
+                stream.close()
+        self.assertEqual(events, [1, 2, 3, 4, 5])
+        self.assertGreater(len(self.server.requests), 3)
+
+        async def consume():
+            stream = self.stream(min_interval=0.01, active_interval=0.05, max_interval=0.05)
+            events = []
+            async for event in stream:
+                events.append(event.id)
+                if len(events) == 5:
+                    stream.close()
+            return events
+
+        throttle_for_a_while()
+        self.assertEqual(asyncio.run(consume()), [1, 2, 3, 4, 5])
+
+    def test_invalid_intervals(self) -> None:
+        with self.assertRaises(ValueError):
+            EventStream(self.server.api_client(), min_interval=10, max_interval=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# coding: utf-8
+
+import datetime
+import unittest
+
+from formlabs_web_api import DeveloperAPIMyPrinterMachineTypeIdEnum
+from formlabs_web_api.FleetSnapshot import FleetSnapshot, FleetSnapshotCache
+from tests.fake_web_api import FakeWebApi, make_group, make_printer
+
+
+def make_fleet():
+    return [
+        make_printer(index, status="PRINTING" if index % 3 == 0 else "IDLE", group=index % 2,
+                     material="FLGPGR05" if index < 4 else "FLTO2001", machine_type_id="FORM-4-0" if index < 2 else "FORM-3-0")
+        for index in range(7)
+    ]
+
+
+class TestFleetSnapshot(unittest.TestCase):
+    """FleetSnapshot unit test"""
+
+    def test_fetch_indexes_every_printer(self) -> None:
+        with FakeWebApi(printers=make_fleet()) as server:
+            snapshot = FleetSnapshot.fetch(server.api_client(), per_page=2, max_concurrency=3)
+        self.assertEqual(len(server.requests), 4)
+        self.assertEqual([printer.serial for printer in snapshot], [f"Printer-{index}" for index in range(7)])
+        self.assertLess(snapshot.age(), datetime.timedelta(minutes=1))
+
+        def serials(printers):
+            return [printer.serial for printer in printers]
+
+        self.assertEqual(snapshot.printer("Printer-5").serial, "Printer-5")
+        self.assertIsNone(snapshot.printer("Printer-9"))
+        self.assertIn("Printer-0", snapshot)
+        self.assertEqual(serials(snapshot.with_status("PRINTING")), ["Printer-0", "Printer-3", "Printer-6"])
+        self.assertEqual(serials(snapshot.in_group(make_group(1)["id"])), ["Printer-1", "Printer-3", "Printer-5"])
+        self.assertEqual(serials(snapshot.of_machine_type("FORM-4-0")), ["Printer-0", "Printer-1"])
+        self.assertEqual(snapshot.of_machine_type(DeveloperAPIMyPrinterMachineTypeIdEnum.FORM_MINUS_3_MINUS_0), snapshot.printers[2:])
+        self.assertEqual(serials(snapshot.with_tank_material("FLTO2001")), ["Printer-4", "Printer-5", "Printer-6"])
+        self.assertEqual(snapshot.with_status("ERROR"), ())
+        self.assertEqual(sorted(snapshot.statuses()), ["IDLE", "PRINTING"])
+
+    def test_cache_fetches_again_after_ttl(self) -> None:
+        with FakeWebApi(printers=make_fleet()) as server:
+            cache = FleetSnapshotCache(server.api_client(), ttl=60)
+            snapshot = cache.get()
+            self.assertIs(cache.get(), snapshot)
+            self.assertEqual(len(server.requests), 1)
+            server.collections["printers"][1]["printer_status"]["status"] = "PRINTING"
+            cache.invalidate()
+            refreshed = cache.get()
+            self.assertIsNot(refreshed, snapshot)
+            self.assertEqual(len(refreshed.with_status("PRINTING")), 4)
+            # Snapshots handed out before are left as they were
+            self.assertEqual(len(snapshot.with_status("PRINTING")), 3)
+            cache.ttl = 0
+            self.assertIsNot(cache.refresh(), refreshed)
+            self.assertEqual(len(server.requests), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
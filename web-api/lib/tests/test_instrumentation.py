@@ -0,0 +1,94 @@
+# coding: utf-8
+
+import unittest
+
+import urllib3
+
+from formlabs_web_api import ApiClient, Configuration, PrintersApi, TanksApi
+from formlabs_web_api.exceptions import NotFoundException
+from formlabs_web_api.Instrumentation import Histogram, HistogramCollector, Instrumentation
+from tests.fake_web_api import FakeWebApi, make_printer, make_tank
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self) -> None:
+        self.records = []
+
+    def record(self, record) -> None:
+        self.records.append(record)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """ApiClient instrumentation unit test"""
+
+    def test_operations_are_recorded(self) -> None:
+        with FakeWebApi(printers=[make_printer(1)], tanks=[make_tank(1), make_tank(2)]) as server:
+            client = server.api_client()
+            client.instrumentation = RecordingInstrumentation()
+            TanksApi(client).tanks_list(per_page=1)
+            PrintersApi(client).printers_retrieve_with_http_info("Printer-1")
+            with self.assertRaises(NotFoundException):
+                PrintersApi(client).printers_retrieve("Printer-2")
+        tanks, printer, missing = client.instrumentation.records
+        self.assertEqual([tanks.operation, printer.operation, missing.operation], ["tanks_list", "printers_retrieve", "printers_retrieve"])
+        self.assertEqual([tanks.status, printer.status, missing.status], [200, 200, 404])
+        self.assertEqual(tanks.method, "GET")
+        self.assertEqual(tanks.request_bytes, 0)
+        self.assertGreater(tanks.response_bytes, 100)
+        self.assertGreater(tanks.wait_seconds, 0)
+        self.assertGreater(tanks.deserialize_seconds, 0)
+
+    def test_operation_without_preload_content_is_recorded(self) -> None:
+        with FakeWebApi(tanks=[make_tank(1)]) as server:
+            client = server.api_client()
+            client.instrumentation = RecordingInstrumentation()
+            TanksApi(client).tanks_list_without_preload_content().read()
+        [record] = client.instrumentation.records
+        self.assertEqual(record.operation, "tanks_list")
+        self.assertEqual(record.status, 200)
+        self.assertEqual(record.request_bytes, 0)
+        self.assertIsNone(record.response_bytes)
+        self.assertIsNone(record.deserialize_seconds)
+
+    def test_failed_request_is_recorded_without_status(self) -> None:
+        configuration = Configuration(host="http://localhost:9")
+        configuration.retries = 0
+        client = ApiClient(configuration)
+        client.instrumentation = RecordingInstrumentation()
+        with self.assertRaises(urllib3.exceptions.HTTPError):
+            TanksApi(client).tanks_list()
+        [record] = client.instrumentation.records
+        self.assertEqual(record.operation, "tanks_list")
+        self.assertIsNone(record.status)
+
+
+class TestHistogramCollector(unittest.TestCase):
+    """HistogramCollector unit test"""
+
+    def test_histogram_buckets(self) -> None:
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.quantile(0.5), 1)
+        self.assertEqual(histogram.quantile(1.0), float("inf"))
+
+    def test_prometheus_text(self) -> None:
+        collector = HistogramCollector(seconds_buckets=(0.1, 1.0), bytes_buckets=(1000,))
+        with FakeWebApi(tanks=[make_tank(1)]) as server:
+            client = server.api_client()
+            client.instrumentation = collector
+            TanksApi(client).tanks_list()
+            TanksApi(client).tanks_list()
+        self.assertEqual(collector.histogram("wait_seconds", "tanks_list").count, 2)
+        self.assertEqual(collector.histogram("response_bytes", "tanks_list", status=200).count, 2)
+        self.assertIsNone(collector.histogram("response_bytes", "tanks_list", status=500))
+        text = collector.to_prometheus_text()
+        self.assertIn("# TYPE formlabs_api_wait_seconds histogram\n", text)
+        self.assertIn('formlabs_api_wait_seconds_bucket{operation="tanks_list",status="200",le="+Inf"} 2\n', text)
+        self.assertIn('formlabs_api_request_bytes_bucket{operation="tanks_list",status="200",le="1000"} 2\n', text)
+        self.assertIn('formlabs_api_response_bytes_count{operation="tanks_list",status="200"} 2\n', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+import json
+import math
+import unittest
+
+import urllib3
+
+from formlabs_web_api import ApiClient, Configuration, GroupsApi, PrintersApi
+from formlabs_web_api.JsonBackend import JsonBackend, OrjsonBackend, StdlibJsonBackend, get_json_backend
+from formlabs_web_api.models import PartialWorkGroupRequest
+from tests.fake_web_api import FakeWebApi, make_group, make_printer
+
+
+class RecordingBackend(StdlibJsonBackend):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj).encode("utf-8")
+
+    def loads(self, document):
+        self.calls.append("loads")
+        return super().loads(document)
+
+
+class RecordingPoolManager:
+    """Answers every request with a new group and records the request bodies"""
+
+    def __init__(self) -> None:
+        self.bodies = []
+
+    def request(self, method, url, body=None, **kwargs):
+        self.bodies.append(body)
+        return urllib3.HTTPResponse(body=json.dumps(dict(make_group(1), created_at="2024-01-01T00:00:00Z")).encode("utf-8"), status=201, headers={"Content-Type": "application/json"}, preload_content=False)
+
+
+class TestJsonBackend(unittest.TestCase):
+    """JsonBackend unit test"""
+
+    def setUp(self) -> None:
+        self.default_configuration = Configuration._default
+
+    def tearDown(self) -> None:
+        Configuration.set_default(self.default_configuration)
+
+    def test_get_json_backend(self) -> None:
+        self.assertIs(type(get_json_backend()), JsonBackend)
+        self.assertIs(get_json_backend("default"), get_json_backend(None))
+        self.assertIsInstance(get_json_backend("json"), StdlibJsonBackend)
+        self.assertIsInstance(get_json_backend("orjson"), OrjsonBackend)
+        self.assertIs(get_json_backend("orjson"), get_json_backend("orjson"))
+        backend = RecordingBackend()
+        self.assertIs(get_json_backend(backend), backend)
+        with self.assertRaisesRegex(ValueError, "Unknown JSON backend 'simplejson'"):
+            get_json_backend("simplejson")
+
+    def test_orjson_falls_back_to_json(self) -> None:
+        backend = get_json_backend("orjson")
+        self.assertEqual(backend.dumps({"a": [1, None]}), b'{"a":[1,null]}')
+        self.assertEqual(backend.dumps({"a": 2 ** 70}), '{"a": 1180591620717411303424}')
+        self.assertEqual(backend.dumps_str({"a": "é"}), '{"a":"é"}')
+        self.assertTrue(math.isnan(backend.loads(b'{"value": NaN}')["value"]))
+
+    def test_models_use_the_backend_of_the_default_configuration(self) -> None:
+        request = PartialWorkGroupRequest(name="Lab")
+        self.assertEqual(request.to_json(), '{"name": "Lab"}')
+        configuration = Configuration()
+        configuration.json_backend = "orjson"
+        Configuration.set_default(configuration)
+        self.assertEqual(request.to_json(), '{"name":"Lab"}')
+        self.assertEqual(PartialWorkGroupRequest.from_json(request.to_json()), request)
+
+    def test_responses_are_decoded_by_the_backend_of_the_configuration(self) -> None:
+        backend = RecordingBackend()
+        with FakeWebApi(printers=[make_printer(0)]) as server:
+            client = server.api_client()
+            client.configuration.json_backend = backend
+            printer = PrintersApi(client).printers_retrieve("Printer-0")
+        self.assertEqual(printer.serial, "Printer-0")
+        self.assertEqual(backend.calls, ["loads"])
+
+    def test_request_bodies_are_encoded_by_the_backend_of_the_configuration(self) -> None:
+        configuration = Configuration()
+        configuration.json_backend = "orjson"
+        client = ApiClient(configuration)
+        client.rest_client.pool_manager = RecordingPoolManager()
+        GroupsApi(client).groups_create(PartialWorkGroupRequest(name="Lab"))
+        self.assertEqual(client.rest_client.pool_manager.bodies, [b'{"name":"Lab"}'])
+
+
+if __name__ == '__main__':
+    unittest.main()
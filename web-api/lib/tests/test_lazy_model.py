@@ -0,0 +1,77 @@
+# coding: utf-8
+
+import copy
+import pickle
+import unittest
+
+from formlabs_web_api import PrintsApi
+from formlabs_web_api.LazyModel import LazyModel, is_materialized, lazy_from_dict
+from formlabs_web_api.models import (
+    BasicUser, DeveloperAPIMyPrinter, PaginatedDeveloperAPIMyPrinterList, PaginatedPrintRunWithFleetControlDataList,
+    PrintRunWithFleetControlData,
+)
+from tests.fake_web_api import FakeWebApi, make_print_run, make_printer
+
+
+def make_page(results):
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+class TestLazyModel(unittest.TestCase):
+    """Lazy model deserialization unit test"""
+
+    def test_items_are_validated_on_first_access(self) -> None:
+        page = lazy_from_dict(PaginatedPrintRunWithFleetControlDataList, make_page([make_print_run(index) for index in range(3)]))
+        self.assertIsInstance(page, PaginatedPrintRunWithFleetControlDataList)
+        self.assertEqual([is_materialized(run) for run in page.results], [False, False, False])
+        self.assertIsInstance(page.results[1], PrintRunWithFleetControlData)
+        self.assertEqual(page.results[1].guid, "print-00000001")
+        self.assertEqual([is_materialized(run) for run in page.results], [False, True, False])
+        self.assertIsInstance(page.results[1].user, BasicUser)
+        self.assertFalse(is_materialized(page.results[1].user))
+        self.assertEqual(page.results[1].user.username, "user0")
+        self.assertEqual(page.results[1].parts[1].display_name, "Part 1")
+
+    def test_lazy_models_match_eager_models(self) -> None:
+        for klass, payload in (
+            (PaginatedPrintRunWithFleetControlDataList, make_page([make_print_run(index) for index in range(3)])),
+            (PaginatedDeveloperAPIMyPrinterList, make_page([make_printer(1), make_printer(2, machine_type_id="FORM-4-0")])),
+        ):
+            lazy = lazy_from_dict(klass, payload)
+            eager = klass.from_dict(payload)
+            self.assertEqual(lazy.to_dict(), eager.to_dict())
+            self.assertEqual(lazy.to_json(), eager.to_json())
+            self.assertEqual(lazy, eager)
+
+    def test_oneof_fields_are_deserialized_with_their_from_dict(self) -> None:
+        page = lazy_from_dict(PaginatedDeveloperAPIMyPrinterList, make_page([make_printer(4)]))
+        self.assertEqual(page.results[0].total_number_of_prints.actual_instance, 4)
+
+    def test_copies_and_pickles_are_models(self) -> None:
+        run = LazyModel(PrintRunWithFleetControlData, make_print_run(7))
+        for copied in (copy.copy(run), copy.deepcopy(run), pickle.loads(pickle.dumps(run))):
+            self.assertIs(type(copied), PrintRunWithFleetControlData)
+            self.assertEqual(copied, PrintRunWithFleetControlData.from_dict(make_print_run(7)))
+
+    def test_assignment_goes_to_the_model(self) -> None:
+        printer = LazyModel(DeveloperAPIMyPrinter, make_printer(1))
+        printer.location = "Lab"
+        self.assertEqual(printer.location, "Lab")
+        self.assertEqual(printer.model_dump()["location"], "Lab")
+
+
+class TestLazyModelAgainstServer(unittest.TestCase):
+    """ApiClient.lazy_models against a fake server unit test"""
+
+    def test_api_client_returns_lazy_items(self) -> None:
+        with FakeWebApi(prints=[make_print_run(index) for index in range(5)]) as server:
+            client = server.api_client()
+            client.lazy_models = True
+            page = PrintsApi(client).prints_list()
+        self.assertEqual(page.count, 5)
+        self.assertFalse(any(is_materialized(run) for run in page.results))
+        self.assertEqual([run.status.value for run in page.results], ["FINISHED"] * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
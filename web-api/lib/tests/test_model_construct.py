@@ -0,0 +1,54 @@
+# coding: utf-8
+
+import unittest
+
+from formlabs_web_api import PrintsApi
+from formlabs_web_api.ModelConstruct import construct_from_dict
+from formlabs_web_api.models import (
+    PaginatedDeveloperAPIMyPrinterList, PaginatedPrintRunWithFleetControlDataList, PaginatedUserEventReadOnlyList,
+    PrintRunWithFleetControlData, StatusEnum,
+)
+from tests.fake_web_api import FakeWebApi, make_event, make_print_run, make_printer
+
+
+def make_page(results):
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+class TestModelConstruct(unittest.TestCase):
+    """Construction of models from trusted data unit test"""
+
+    def test_constructed_models_equal_validated_models(self) -> None:
+        for klass, payload in (
+            (PaginatedPrintRunWithFleetControlDataList, make_page([make_print_run(index) for index in range(3)])),
+            (PaginatedDeveloperAPIMyPrinterList, make_page([make_printer(1), make_printer(2, machine_type_id="FORM-4-0")])),
+            (PaginatedUserEventReadOnlyList, make_page([make_event(1)])),
+        ):
+            constructed = construct_from_dict(klass, payload)
+            self.assertEqual(constructed, klass.from_dict(payload))
+            self.assertEqual(constructed.to_dict(), klass.from_dict(payload).to_dict())
+
+    def test_values_are_not_validated(self) -> None:
+        payload = make_print_run(1)
+        payload["layer_count"] = "1000"
+        payload["unknown"] = 1
+        run = construct_from_dict(PrintRunWithFleetControlData, payload)
+        self.assertEqual(run.layer_count, "1000")
+        self.assertIs(run.status, StatusEnum.FINISHED)
+        self.assertEqual(run.print_started_at.year, 2024)
+        self.assertNotIn("unknown", run.__dict__)
+        # Assignments are still validated
+        with self.assertRaises(ValueError):
+            run.volume_ml = "a lot"
+
+    def test_api_client_trusted_responses(self) -> None:
+        with FakeWebApi(prints=[make_print_run(index) for index in range(3)]) as server:
+            client = server.api_client()
+            validated = PrintsApi(client).prints_list()
+            client.trusted_responses = True
+            trusted = PrintsApi(client).prints_list()
+        self.assertEqual(trusted, validated)
+
+
+if __name__ == '__main__':
+    unittest.main()
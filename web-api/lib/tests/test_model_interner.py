@@ -0,0 +1,79 @@
+# coding: utf-8
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from formlabs_web_api import PrintsApi
+from formlabs_web_api.ModelInterner import ModelInterner, _freeze
+from formlabs_web_api.models import BasicUser, PaginatedPrintRunWithFleetControlDataList, PrinterGroup, PrintRunWithFleetControlData
+from tests.fake_web_api import FakeWebApi, make_print_run
+
+
+class TestModelInterner(unittest.TestCase):
+    """ModelInterner unit test"""
+
+    def test_equal_nested_objects_are_shared_across_pages(self) -> None:
+        with FakeWebApi(prints=[make_print_run(index, group=index % 3) for index in range(20)]) as server:
+            client = server.api_client()
+            client.interner = ModelInterner()
+            api = PrintsApi(client)
+            first = api.prints_list(page=1, per_page=10).results
+            second = api.prints_list(page=2, per_page=10).results
+        self.assertIs(first[0].user, second[0].user)
+        self.assertIs(first[0].group, first[3].group)
+        self.assertIs(first[0].group, second[2].group)
+        self.assertIsNot(first[0].group, first[1].group)
+        self.assertEqual(first[1].group.name, "Group 1")
+
+    def test_models_equal_from_dict(self) -> None:
+        page = {"count": 5, "next": None, "previous": None, "results": [make_print_run(index) for index in range(5)]}
+        interner = ModelInterner()
+        interned = interner.from_dict(PaginatedPrintRunWithFleetControlDataList, page)
+        expected = PaginatedPrintRunWithFleetControlDataList.from_dict(page)
+        self.assertEqual(interned, expected)
+        self.assertEqual(interned.to_dict(), expected.to_dict())
+        self.assertGreater(interner.hits, 0)
+        self.assertGreater(len(interner), 0)
+        interner.clear()
+        self.assertEqual(len(interner), 0)
+
+    def test_explicit_classes(self) -> None:
+        runs = [make_print_run(index) for index in range(3)]
+        interner = ModelInterner(classes=(PrinterGroup,))
+        first, second = (interner.from_dict(PrintRunWithFleetControlData, run) for run in runs[:2])
+        self.assertIs(first.group, second.group)
+        self.assertIsNot(first.user, second.user)
+        self.assertEqual(first.user, second.user)
+
+    def test_mostly_unique_classes_are_no_longer_interned(self) -> None:
+        interner = ModelInterner(min_lookups=10)
+        for index in range(20):
+            interner.from_dict(PrintRunWithFleetControlData, make_print_run(index))
+        self.assertTrue(interner._interns(BasicUser))
+        self.assertTrue(interner._interns(PrinterGroup))
+        self.assertEqual({key[0] for key in interner._instances}, {BasicUser, PrinterGroup})
+
+    def test_max_size(self) -> None:
+        interner = ModelInterner(classes=(PrinterGroup,), max_size=2)
+        groups = [interner.from_dict(PrintRunWithFleetControlData, make_print_run(index, group=index)).group for index in range(3)]
+        self.assertEqual(len(interner), 2)
+        self.assertIsNot(interner.from_dict(PrintRunWithFleetControlData, make_print_run(0, group=0)).group, groups[0])
+        self.assertIs(interner.from_dict(PrintRunWithFleetControlData, make_print_run(2, group=2)).group, groups[2])
+
+    def test_concurrent_lookups_are_counted(self) -> None:
+        interner = ModelInterner(classes=(PrinterGroup,))
+        runs = [make_print_run(index, group=index % 3) for index in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            groups = list(executor.map(lambda run: interner.from_dict(PrintRunWithFleetControlData, run).group, runs))
+        self.assertEqual(interner.hits + interner.misses, len(runs))
+        self.assertEqual(len(interner), 3)
+        self.assertIs(groups[0], groups[3])
+
+    def test_freeze_tells_apart_json_types(self) -> None:
+        self.assertEqual(len({_freeze(1), _freeze(1.0), _freeze(True), _freeze("1")}), 4)
+        self.assertNotEqual(_freeze({"a": [1]}), _freeze({"a": (1,)}))
+        self.assertEqual(_freeze({"a": [1, {"b": None}]}), _freeze({"a": [1, {"b": None}]}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import pickle
+import unittest
+
+from formlabs_web_api import ModelPacking
+from formlabs_web_api.LazyModel import lazy_from_dict
+from formlabs_web_api.ModelPacking import pack, pack_models, unpack, unpack_models
+from formlabs_web_api.models import (
+    BasicUser,
+    DeveloperAPIMyPrinter,
+    PrinterGroup,
+    PrintRunWithFleetControlData,
+    StatusEnum,
+    WorkgroupSettings,
+    WorkgroupSettingsUpdateMode,
+)
+from tests.fake_web_api import make_print_run, make_printer
+
+
+class TestModelPacking(unittest.TestCase):
+    """ModelPacking unit test"""
+
+    def test_round_trip(self) -> None:
+        run = PrintRunWithFleetControlData.from_dict(make_print_run(3, status="ERROR"))
+        data = run.to_bytes()
+        unpacked = PrintRunWithFleetControlData.from_bytes(data)
+        self.assertEqual(unpacked, run)
+        self.assertEqual(unpacked.to_dict(), run.to_dict())
+        self.assertIs(unpacked.status, StatusEnum.ERROR)
+        self.assertEqual(unpacked.created_at, run.created_at)
+        self.assertLess(len(data), len(pickle.dumps(run)) * 2 / 3)
+
+    def test_fields_set_are_kept(self) -> None:
+        user = BasicUser.model_construct(id=1, username="ada")
+        unpacked = unpack(pack(user))
+        self.assertEqual(unpacked.model_fields_set, {"id", "username"})
+        self.assertEqual(unpacked.model_dump(exclude_unset=True), {"id": 1, "username": "ada"})
+        unpacked.first_name = "Ada"
+        self.assertEqual(unpacked.model_fields_set, {"id", "username", "first_name"})
+
+    def test_lists(self) -> None:
+        printers = [DeveloperAPIMyPrinter.from_dict(make_printer(index, status="PRINTING")) for index in range(5)]
+        self.assertEqual(unpack_models(pack_models(printers), DeveloperAPIMyPrinter), printers)
+        self.assertEqual(unpack_models(pack_models([], PrinterGroup)), [])
+        with self.assertRaisesRegex(ValueError, "has to be given"):
+            pack_models([])
+
+    def test_one_of_models(self) -> None:
+        settings = WorkgroupSettings.from_dict({"group": "group-1", "update_mode": "UNATTENDED"})
+        unpacked = WorkgroupSettings.from_bytes(settings.to_bytes())
+        self.assertEqual(unpacked, settings)
+        self.assertIsInstance(unpacked.update_mode, WorkgroupSettingsUpdateMode)
+        self.assertIs(unpacked.update_mode.actual_instance, settings.update_mode.actual_instance)
+
+    def test_lazy_models(self) -> None:
+        run = lazy_from_dict(PrintRunWithFleetControlData, make_print_run(1))
+        self.assertEqual(unpack(pack(run)), PrintRunWithFleetControlData.from_dict(make_print_run(1)))
+
+    def test_mismatches(self) -> None:
+        data = pack(PrinterGroup(id="group-1", name="Lab"))
+        with self.assertRaisesRegex(ValueError, "PrinterGroup was packed, expected BasicUser"):
+            BasicUser.from_bytes(data)
+        with self.assertRaisesRegex(ValueError, "use unpack$"):
+            unpack_models(data)
+        with self.assertRaisesRegex(ValueError, "use unpack_models"):
+            unpack(pack_models([PrinterGroup(id="group-1", name="Lab")]))
+        with self.assertRaisesRegex(ValueError, "another version"):
+            unpack(pickle.dumps((ModelPacking._FORMAT, "PrinterGroup", 0, False, ["group-1", "Lab"]), protocol=4))
+
+    def test_only_builtin_values_are_unpickled(self) -> None:
+        data = pickle.dumps((ModelPacking._FORMAT, "PrinterGroup", 0, False, PrinterGroup(id="group-1", name="Lab")))
+        with self.assertRaisesRegex(ValueError, "Not packed models"):
+            unpack(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+# coding: utf-8
+
+import unittest
+
+from formlabs_web_api.models.blank_enum import BlankEnum
+from formlabs_web_api.models.cartridge_slot_enum import CartridgeSlotEnum
+from formlabs_web_api.models.developer_apimy_printer_total_number_of_prints import DeveloperAPIMyPrinterTotalNumberOfPrints
+from formlabs_web_api.models.printer_cartridge_status_cartridge_slot import PrinterCartridgeStatusCartridgeSlot
+
+
+class TestOneOfDispatcher(unittest.TestCase):
+    """OneOfDispatcher unit test"""
+
+    def test_enum_values_go_to_their_enum(self) -> None:
+        slot = next(iter(CartridgeSlotEnum))
+        self.assertIs(PrinterCartridgeStatusCartridgeSlot.from_dict(slot.value).actual_instance, slot)
+        self.assertIs(PrinterCartridgeStatusCartridgeSlot.from_json('""').actual_instance, BlankEnum(""))
+
+    def test_bool_is_not_taken_for_int(self) -> None:
+        self.assertIs(DeveloperAPIMyPrinterTotalNumberOfPrints.from_json("true").actual_instance, True)
+        self.assertEqual(DeveloperAPIMyPrinterTotalNumberOfPrints.from_json("12").actual_instance, 12)
+        with self.assertRaises(ValueError):
+            DeveloperAPIMyPrinterTotalNumberOfPrints.from_json('"12"')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# coding: utf-8
+
+import time
+import unittest
+
+from formlabs_web_api import EventsApi, PrintersApi, PrintsApi
+from formlabs_web_api.Pagination import iterate_all
+from tests.fake_web_api import FakeWebApi, make_event, make_print_run, make_printer
+
+
+class TestPagination(unittest.TestCase):
+    """Iteration over all pages of list operations unit test"""
+
+    def test_pages_are_fetched_concurrently_and_yielded_in_order(self) -> None:
+        prints = [make_print_run(index) for index in range(95)]
+        with FakeWebApi(prints=prints, latency=0.05) as server:
+            results = list(iterate_all(PrintsApi(server.api_client()).prints_list, per_page=10, max_concurrency=4))
+        self.assertEqual([run.guid for run in results], [run["guid"] for run in prints])
+        self.assertEqual(len(server.requests), 10)
+        self.assertGreater(server.max_in_flight, 1)
+        self.assertLessEqual(server.max_in_flight, 4)
+
+    def test_filters_are_passed_to_every_page(self) -> None:
+        prints = [make_print_run(index, printer=f"Printer-{index % 2}") for index in range(30)]
+        with FakeWebApi(printers=[make_printer(1)], prints=prints) as server:
+            client = server.api_client()
+            results = list(iterate_all(PrintersApi(client).printers_prints_list, "Printer-1", per_page=4))
+            events = list(iterate_all(EventsApi(client).events_list))
+        self.assertEqual([run.guid for run in results], [run["guid"] for run in prints if run["printer"] == "Printer-1"])
+        self.assertEqual(events, [])
+
+    def test_sequential_with_max_concurrency_one(self) -> None:
+        with FakeWebApi(events=[make_event(index) for index in range(25)], latency=0.01) as server:
+            events = list(iterate_all(EventsApi(server.api_client()).events_list, per_page=5, max_concurrency=1))
+        self.assertEqual(len(events), 25)
+        self.assertEqual(server.max_in_flight, 1)
+
+    def test_closing_early_stops_fetching(self) -> None:
+        with FakeWebApi(prints=[make_print_run(index) for index in range(100)], latency=0.02) as server:
+            results = iterate_all(PrintsApi(server.api_client()).prints_list, per_page=5, max_concurrency=2)
+            first = [next(results) for _ in range(6)]
+            results.close()
+            time.sleep(0.1)
+        self.assertEqual([run.guid for run in first], [f"print-{index:08d}" for index in range(6)])
+        self.assertLessEqual(len(server.requests), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# coding: utf-8
+
+import datetime
+import unittest
+
+from formlabs_web_api import EventsApi, PrintsApi
+from formlabs_web_api.Projection import project, record_type
+from formlabs_web_api.UncheckedApi import UncheckedPrintsApi
+from formlabs_web_api.exceptions import NotFoundException
+from formlabs_web_api.models import MyPrintRunReadOnly, PrintRunWithFleetControlData, StatusEnum, TypeEnum
+from tests.fake_web_api import FakeWebApi, make_event, make_print_run
+
+
+class TestProjection(unittest.TestCase):
+    """Field projection of list operations unit test"""
+
+    def test_record_type(self) -> None:
+        record = record_type(PrintRunWithFleetControlData, ["guid", "status"])
+        self.assertIs(record, record_type(PrintRunWithFleetControlData, ("guid", "status")))
+        self.assertEqual(record._fields, ("guid", "status"))
+        with self.assertRaisesRegex(ValueError, "no fields nope"):
+            record_type(PrintRunWithFleetControlData, ("guid", "nope"))
+
+    def test_results_hold_only_the_projected_fields(self) -> None:
+        prints = [make_print_run(index, status="ERROR" if index % 2 else "FINISHED") for index in range(25)]
+        with FakeWebApi(prints=prints) as server:
+            page = project(PrintsApi(server.api_client()).prints_list, ("guid", "status", "created_at", "user"), page=2, per_page=10)
+        self.assertEqual(page.count, 25)
+        self.assertTrue(page.next.endswith("page=3&per_page=10"))
+        self.assertEqual([run.guid for run in page.results], [run["guid"] for run in prints[10:20]])
+        run = page.results[1]
+        self.assertEqual(run._fields, ("guid", "status", "created_at", "user"))
+        self.assertIs(run.status, StatusEnum.ERROR)
+        self.assertEqual(run.created_at, datetime.datetime(2024, 1, 1, 0, 11, tzinfo=datetime.timezone.utc))
+        self.assertEqual(run.user.username, "user0")
+
+    def test_nested_models_and_unchecked_apis(self) -> None:
+        with FakeWebApi(events=[make_event(index) for index in range(3)], prints=[make_print_run(0)]) as server:
+            client = server.api_client()
+            events = project(EventsApi(client).events_list, ("id", "type", "print_run"))
+            prints = project(UncheckedPrintsApi(client).prints_list, ("guid",))
+        self.assertEqual([event.id for event in events.results], [1, 2, 3])
+        self.assertIs(events.results[0].type, TypeEnum.PRINT_FINISHED)
+        self.assertIsInstance(events.results[0].print_run, MyPrintRunReadOnly)
+        self.assertEqual(prints.results[0].guid, "print-00000000")
+
+    def test_errors_raise_api_exceptions(self) -> None:
+        with FakeWebApi(prints=[make_print_run(0)]) as server:
+            with self.assertRaises(NotFoundException):
+                project(PrintsApi(server.api_client()).prints_list, ("guid",), page=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
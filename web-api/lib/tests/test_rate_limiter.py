@@ -0,0 +1,81 @@
+# coding: utf-8
+
+from email.utils import format_datetime
+import datetime
+import time
+import unittest
+
+import urllib3
+
+from formlabs_web_api import PrintersApi, rest
+from formlabs_web_api.exceptions import ApiException
+from formlabs_web_api.Instrumentation import HistogramCollector
+from formlabs_web_api.RateLimiter import RateLimitedApiClient, RateLimiter, _retry_after_seconds
+from tests.fake_web_api import FakeWebApi, make_printer
+
+
+class TestRateLimiter(unittest.TestCase):
+    """RateLimiter unit test"""
+
+    def test_requests_are_paced_to_the_rate(self) -> None:
+        limiter = RateLimiter(rate=50, burst=1)
+        started = time.monotonic()
+        for _ in range(11):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+
+    def test_pause_holds_back_callers(self) -> None:
+        limiter = RateLimiter(rate=1000, burst=10)
+        limiter.pause(0.2)
+        started = time.monotonic()
+        limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+
+    def test_retry_after_formats(self) -> None:
+        self.assertEqual(_retry_after_seconds("3"), 3.0)
+        self.assertIsNone(_retry_after_seconds(None))
+        self.assertIsNone(_retry_after_seconds("soon"))
+        later = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+        self.assertAlmostEqual(_retry_after_seconds(format_datetime(later, usegmt=True)), 30, delta=2)
+
+
+class TestRateLimitedApiClient(unittest.TestCase):
+    """RateLimitedApiClient against a fake server unit test"""
+
+    def test_rate_limited_request_is_retried_after_retry_after(self) -> None:
+        with FakeWebApi(printers=[make_printer(1)], rate_limit_every=2, retry_after="0.2") as server:
+            client = RateLimitedApiClient(server.api_client().configuration, rate_limiter=RateLimiter(rate=100), backoff=0.01)
+            client.instrumentation = HistogramCollector()
+            api = PrintersApi(client)
+            started = time.monotonic()
+            self.assertEqual(api.printers_list().count, 1)
+            self.assertEqual(api.printers_list().count, 1)
+            self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(client.instrumentation.histogram("wait_seconds", "printers_list", status=429).count, 1)
+        self.assertEqual(client.instrumentation.histogram("wait_seconds", "printers_list", status=200).count, 2)
+
+    def test_gives_up_after_max_retries(self) -> None:
+        with FakeWebApi(rate_limit_every=1) as server:
+            client = RateLimitedApiClient(server.api_client().configuration, max_retries=2, backoff=0.01)
+            with self.assertRaises(ApiException) as raised:
+                PrintersApi(client).printers_list()
+        self.assertEqual(raised.exception.status, 429)
+        self.assertEqual(len(server.requests), 3)
+
+    def test_unavailable_is_only_retried_for_retry_methods(self) -> None:
+        client = RateLimitedApiClient(max_retries=2, backoff=0.01)
+        methods = []
+
+        def request(method, url, **kwargs):
+            methods.append(method)
+            return rest.RESTResponse(urllib3.HTTPResponse(body=b"", status=503, preload_content=True))
+
+        client.rest_client.request = request
+        self.assertEqual(client.call_api("POST", "https://api.formlabs.com/developer/v1/groups/").status, 503)
+        self.assertEqual(client.call_api("GET", "https://api.formlabs.com/developer/v1/groups/").status, 503)
+        self.assertEqual(methods, ["POST", "GET", "GET", "GET"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import datetime
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+from formlabs_web_api.SqliteMirror import SqliteMirror
+from formlabs_web_api.models import PrintRunWithFleetControlData, StatusEnum
+from tests.fake_web_api import FakeWebApi, make_cartridge, make_event, make_print_run, make_tank
+
+
+class TestSqliteMirror(unittest.TestCase):
+    """SqliteMirror unit test"""
+
+    def setUp(self) -> None:
+        self.server = FakeWebApi(
+            prints=[make_print_run(index, status="PRINTING" if index == 5 else "FINISHED") for index in range(30)],
+            events=[make_event(index) for index in range(12)],
+            tanks=[make_tank(index) for index in range(3)],
+            cartridges=[make_cartridge(index) for index in range(2)],
+        )
+        self.server.__enter__()
+        self.mirror = SqliteMirror(":memory:", self.server.api_client(), per_page=10, batch_size=7, overlap=datetime.timedelta(0))
+
+    def tearDown(self) -> None:
+        self.mirror.close()
+        self.server.__exit__(None, None, None)
+
+    def requested_filters(self, collection):
+        queries = [parse_qs(urlsplit(path).query) for path in self.server.requests if f"/{collection}/" in path]
+        return [query.get("date__gt", [None])[0] for query in queries if query.get("page") == ["1"]]
+
+    def test_first_sync_mirrors_everything(self) -> None:
+        self.assertEqual(self.mirror.sync(), {"prints": 30, "events": 12, "tanks": 3, "cartridges": 2})
+        runs = list(self.mirror.records("prints"))
+        self.assertEqual(runs, [PrintRunWithFleetControlData.from_dict(run) for run in self.server.collections["prints"]])
+        self.assertEqual([run.guid for run in self.mirror.records("prints", "status = ?", ("PRINTING",))], ["print-00000005"])
+        self.assertEqual(self.mirror.high_water_mark("events"), datetime.datetime(2024, 1, 1, 0, 11, tzinfo=datetime.timezone.utc))
+        self.assertEqual([tank.serial for tank in self.mirror.records("tanks")], ["TANK-0", "TANK-1", "TANK-2"])
+
+    def test_later_syncs_request_only_what_may_have_changed(self) -> None:
+        self.mirror.sync()
+        self.server.collections["prints"][5]["status"] = "FINISHED"
+        self.server.collections["prints"].append(make_print_run(30))
+        self.server.collections["events"].append(make_event(12))
+        self.server.collections["tanks"][1]["last_modified"] = "2024-02-01T00:00:00Z"
+        self.server.requests.clear()
+
+        self.assertEqual(self.mirror.sync(), {"prints": 26, "events": 1, "tanks": 1, "cartridges": 0})
+        # From the print run that was still printing on
+        self.assertEqual(self.requested_filters("prints"), ["2024-01-01T00:04:59.000000+0000"])
+        self.assertEqual(self.requested_filters("events"), ["2024-01-01T00:11:00.000000+0000"])
+        run = next(self.mirror.records("prints", "guid = ?", ("print-00000005",)))
+        self.assertIs(run.status, StatusEnum.FINISHED)
+        self.assertEqual(self.mirror.connection.execute("SELECT COUNT(*) FROM prints").fetchone(), (31,))
+
+        self.server.requests.clear()
+        self.assertEqual(self.mirror.sync(["prints", "events"]), {"prints": 0, "events": 0})
+        self.assertEqual(self.requested_filters("prints"), ["2024-01-01T00:30:00.000000+0000"])
+
+    def test_unfinished_print_runs_are_requested_again_up_to_max_lookback(self) -> None:
+        self.mirror.max_lookback = datetime.timedelta(minutes=10)
+        self.mirror.sync(["prints"])
+        # Deleted while printing, the mirror never sees it finish
+        del self.server.collections["prints"][5]
+        self.server.requests.clear()
+        self.assertEqual(self.mirror.sync(["prints"]), {"prints": 0})
+        self.assertEqual(self.requested_filters("prints"), ["2024-01-01T00:29:00.000000+0000"])
+        run = next(self.mirror.records("prints", "guid = ?", ("print-00000005",)))
+        self.assertIs(run.status, StatusEnum.PRINTING)
+
+    def test_unknown_collections(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Unknown collections printers"):
+            self.mirror.sync(["printers"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+# coding: utf-8
+
+import unittest
+
+from formlabs_web_api import PrintersApi, PrintsApi
+from formlabs_web_api.UncheckedApi import UncheckedPrintersApi, UncheckedPrintsApi
+from tests.fake_web_api import FakeWebApi, make_print_run, make_printer
+
+
+class TestUncheckedApi(unittest.TestCase):
+    """Unchecked web API classes unit test"""
+
+    def test_operations_are_not_validated(self) -> None:
+        self.assertTrue(issubclass(UncheckedPrintersApi, PrintersApi))
+        self.assertTrue(hasattr(PrintersApi.printers_retrieve, "raw_function"))
+        self.assertFalse(hasattr(UncheckedPrintersApi.printers_retrieve, "raw_function"))
+        self.assertEqual(UncheckedPrintersApi.printers_retrieve.__doc__, PrintersApi.printers_retrieve.__doc__)
+
+    def test_requests_and_responses_match_the_checked_api(self) -> None:
+        with FakeWebApi(printers=[make_printer(1)], prints=[make_print_run(index, printer="Printer-1") for index in range(3)]) as server:
+            client = server.api_client()
+            checked = (PrintersApi(client).printers_retrieve("Printer-1"), PrintsApi(client).prints_list(printer="Printer-1", per_page=2))
+            checked_requests = list(server.requests)
+            del server.requests[:]
+            unchecked = (UncheckedPrintersApi(client).printers_retrieve("Printer-1"), UncheckedPrintsApi(client).prints_list(printer="Printer-1", per_page=2))
+        self.assertEqual(server.requests, checked_requests)
+        self.assertEqual(unchecked, checked)
+
+
+if __name__ == '__main__':
+    unittest.main()